@@ -5,11 +5,17 @@ from models import db
 from routes.player_routes import player_bp
 from routes.data_routes import data_bp
 from routes.prediction_routes import prediction_bp
+from routes.metrics_routes import metrics_bp
+from routes.parlay_routes import parlay_bp
+from routes.export_routes import export_bp
 import schedule
 import time
 import threading
 import os
 from services.nfl_data_service import NFLDataService
+from services.prediction_matrix_service import PredictionMatrixService
+from services.query_metrics import QueryMetrics
+from services.conditional_requests import ConditionalRequests
 
 def create_app():
     """Application factory pattern"""
@@ -27,12 +33,29 @@ def create_app():
     app.register_blueprint(player_bp)
     app.register_blueprint(data_bp)
     app.register_blueprint(prediction_bp)
+    app.register_blueprint(parlay_bp)
+    app.register_blueprint(export_bp)
+
+    # Opt-in SQL statement counts and timings per request (/api/metrics and response headers)
+    if Config.QUERY_METRICS_ENABLED:
+        QueryMetrics.init_app(app)
+        app.register_blueprint(metrics_bp)
+
+    # Data-version ETags and 304s for read endpoints
+    if Config.HTTP_CACHE_ENABLED:
+        ConditionalRequests.init_app(app)
 
     # Create tables
     with app.app_context():
         db.create_all()
         print("Database tables created successfully")
 
+        # Populate team offense totals for databases synced before the table existed
+        NFLDataService.backfill_team_offense_weekly()
+
+        # Unique key backing team_stats upserts on databases created before it existed
+        NFLDataService.ensure_team_stats_unique_index()
+
     # Health check route
     @app.route('/api/health', methods=['GET'])
     def health_check():
@@ -53,7 +76,9 @@ def run_scheduled_update(app):
         with app.app_context():
             print(f"Running scheduled data update at {time.strftime('%Y-%m-%d %H:%M:%S')}")
             try:
-                NFLDataService.sync_all_data(years=5)
+                # Only new weeks and stat corrections are ingested
+                if NFLDataService.sync_incremental(years=5):
+                    PredictionMatrixService.build()
                 print("Scheduled update completed successfully")
             except Exception as e:
                 print(f"Error during scheduled update: {e}")
@@ -68,14 +93,17 @@ def run_scheduled_update(app):
         time.sleep(60)  # Check every minute
 
 
-# Create the app instance for gunicorn
-app = create_app()
+# Processes spawned for the prediction matrix build re-import the main module as
+# __mp_main__; they set up their own app and must not start another scheduler
+if __name__ != '__mp_main__':
+    # Create the app instance for gunicorn
+    app = create_app()
 
-# Start the scheduler in a separate thread when not in development mode
-if not Config.DEBUG:
-    scheduler_thread = threading.Thread(target=run_scheduled_update, args=(app,), daemon=True)
-    scheduler_thread.start()
-    print("Data update scheduler started")
+    # Start the scheduler in a separate thread when not in development mode
+    if not Config.DEBUG:
+        scheduler_thread = threading.Thread(target=run_scheduled_update, args=(app,), daemon=True)
+        scheduler_thread.start()
+        print("Data update scheduler started")
 
 if __name__ == '__main__':
     # Start the scheduler in development mode
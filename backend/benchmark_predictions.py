@@ -0,0 +1,359 @@
+"""
+Benchmark the prediction service and player routes on a synthetic league
+
+Generates a reproducible SQLite league (32 teams, ~1,500 players, 5 seasons of
+weekly player and team defensive stats), then times get_player_prediction,
+each predict_* method and the /api/players/current-season and
+/api/players/<id>/career routes. Reports p50/p95/p99 latency and SQL statement
+counts per call, and writes the results as JSON so runs can be compared
+across commits.
+
+Usage:
+    python benchmark_predictions.py                          # build league, run, write benchmark_results.json
+    python benchmark_predictions.py --reuse                  # keep an existing synthetic database
+    python benchmark_predictions.py --samples 200 --output after.json
+    python benchmark_predictions.py --reuse --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+BACKEND_DIR = os.path.abspath(os.path.dirname(__file__))
+DEFAULT_DB = os.path.join(BACKEND_DIR, 'benchmark_league.db')
+
+TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC',
+    'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
+]
+
+# Roster per team (47 x 32 = 1,504 players)
+ROSTER = {'QB': 4, 'RB': 10, 'WR': 20, 'TE': 13}
+
+SEASONS = [2021, 2022, 2023, 2024, 2025]
+WEEKS_PER_SEASON = 17
+CURRENT_SEASON_WEEKS = 8  # The latest season is in progress
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Benchmark predictions on a synthetic league')
+    parser.add_argument('--db', default=DEFAULT_DB, help='SQLite file for the synthetic league')
+    parser.add_argument('--reuse', action='store_true', help='Reuse the synthetic database if it exists')
+    parser.add_argument('--samples', type=int, default=100, help='Calls timed per benchmark')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the league and samples')
+    parser.add_argument('--output', default=os.path.join(BACKEND_DIR, 'benchmark_results.json'))
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+    return parser.parse_args()
+
+
+# The app reads DATABASE_URL at import time, so it is configured before importing it
+args = parse_args() if __name__ == '__main__' else None
+if args:
+    os.environ['DATABASE_URL'] = f'sqlite:///{os.path.abspath(args.db)}'
+    os.environ.setdefault('FLASK_DEBUG', 'True')  # Importing app must not start the scheduler
+    os.environ['RESULT_CACHE_BACKEND'] = 'none'  # Time the model, not cache hits
+    if not args.reuse and os.path.exists(args.db):
+        os.remove(args.db)
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from models import db  # noqa: E402
+from models.player import Player, PlayerStats  # noqa: E402
+from models.team import Team, TeamStats  # noqa: E402
+from services.nfl_data_service import NFLDataService  # noqa: E402
+from services.prediction_service import PredictionService, prediction_service  # noqa: E402
+from services.query_metrics import count_queries  # noqa: E402
+
+
+def generate_league(seed):
+    """Fill an empty database with a synthetic league"""
+    rng = np.random.default_rng(seed)
+
+    db.session.execute(insert(Team.__table__), [
+        {'team_abbr': team, 'team_name': f'{team} Football Team'} for team in TEAMS
+    ])
+
+    players, depths = [], []
+    for team in TEAMS:
+        for position, count in ROSTER.items():
+            for depth in range(count):
+                depths.append(depth + 1)
+                players.append({
+                    'player_id': f'SYN-{team}-{position}{depth + 1}',
+                    'name': f'{team} {position}{depth + 1}',
+                    'position': position,
+                    'team': team
+                })
+    db.session.execute(insert(Player.__table__), players)
+    db.session.commit()
+
+    team_ids = dict(db.session.query(Team.team_abbr, Team.id).all())
+    roster = db.session.query(Player.id, Player.position, Player.team).order_by(Player.id).all()
+    player_ids = np.array([player.id for player in roster])
+    positions = np.array([player.position for player in roster])
+    player_teams = np.array([player.team for player in roster])
+
+    # Starters get more volume than depth players
+    depth = np.array(depths)
+    usage = np.where(depth == 1, 1.0, np.where(depth <= 3, 0.55, 0.2))
+
+    stat_rows = 0
+    for season in SEASONS:
+        weeks = CURRENT_SEASON_WEEKS if season == SEASONS[-1] else WEEKS_PER_SEASON
+        for week in range(1, weeks + 1):
+            # Pair the 32 teams into 16 games
+            order = rng.permutation(TEAMS)
+            opponent_of = {}
+            for home, away in zip(order[::2], order[1::2]):
+                opponent_of[home] = away
+                opponent_of[away] = home
+
+            team_stats = []
+            for team in TEAMS:
+                passing = int(rng.normal(225, 45))
+                rushing = int(rng.normal(115, 30))
+                team_stats.append({
+                    'team_id': team_ids[team], 'season': season, 'week': week,
+                    'opponent': opponent_of[team],
+                    'points_against': int(rng.integers(6, 42)),
+                    'yards_against': passing + rushing,
+                    'passing_yards_against': passing,
+                    'rushing_yards_against': rushing
+                })
+            db.session.execute(insert(TeamStats.__table__), team_stats)
+
+            played = rng.random(len(roster)) < 0.85
+            n = len(roster)
+            qb = positions == 'QB'
+            rb = positions == 'RB'
+            receiver = (positions == 'WR') | (positions == 'TE')
+
+            targets = rng.poisson(np.where(receiver, 7.5, np.where(rb, 3.0, 0.0)) * usage)
+            receptions = rng.binomial(targets, 0.65)
+            receiving_yards = np.maximum(0, receptions * rng.normal(11.5, 4.0, n)).astype(int)
+            rushes = rng.poisson(np.where(rb, 15.0, np.where(qb, 3.5, 0.3)) * usage)
+            rushing_yards = np.maximum(-5, rushes * rng.normal(4.3, 1.5, n)).astype(int)
+            attempts = rng.poisson(np.where(qb, 34.0, 0.0) * usage)
+            completions = rng.binomial(attempts, 0.64)
+            passing_yards = np.maximum(0, completions * rng.normal(11.0, 2.5, n)).astype(int)
+
+            stats = {
+                'targets': targets,
+                'receptions': receptions,
+                'receiving_yards': receiving_yards,
+                'receiving_touchdowns': rng.poisson(receptions * 0.07),
+                'rushes': rushes,
+                'rushing_yards': rushing_yards,
+                'rushing_touchdowns': rng.poisson(rushes * 0.03),
+                'passing_attempts': attempts,
+                'passing_completions': completions,
+                'passing_yards': passing_yards,
+                'passing_touchdowns': rng.poisson(attempts * 0.045),
+                'interceptions': rng.poisson(attempts * 0.022)
+            }
+
+            rows = []
+            for i in np.flatnonzero(played):
+                row = {column: int(values[i]) for column, values in stats.items()}
+                row.update({
+                    'player_id': int(player_ids[i]), 'season': season, 'week': week,
+                    'opponent': opponent_of[player_teams[i]]
+                })
+                rows.append(row)
+            db.session.execute(insert(PlayerStats.__table__), rows)
+            stat_rows += len(rows)
+
+        db.session.commit()
+        print(f"  Generated season {season}")
+
+    NFLDataService.refresh_stat_rollups()
+    print(f"Synthetic league: {len(TEAMS)} teams, {len(roster)} players, {stat_rows} player games")
+
+
+def percentiles(durations):
+    """Latency summary in milliseconds"""
+    values = np.array(durations) * 1000
+    return {
+        'p50_ms': round(float(np.percentile(values, 50)), 3),
+        'p95_ms': round(float(np.percentile(values, 95)), 3),
+        'p99_ms': round(float(np.percentile(values, 99)), 3),
+        'mean_ms': round(float(values.mean()), 3)
+    }
+
+
+def measure(calls):
+    """
+    Time a list of zero-argument callables and count their SQL statements
+
+    The first call is a warm-up and is not recorded (it builds process-wide caches).
+    """
+    calls[0]()
+
+    durations, queries = [], []
+    for call in calls:
+        with count_queries() as collector:
+            start = time.perf_counter()
+            call()
+            durations.append(time.perf_counter() - start)
+        queries.append(collector.count)
+
+    result = {'calls': len(calls)}
+    result.update(percentiles(durations))
+    result['queries_mean'] = round(float(np.mean(queries)), 2)
+    result['queries_max'] = int(np.max(queries))
+    return result
+
+
+def run_benchmarks(app, samples, seed):
+    """Run every benchmark and return their results by name"""
+    rng = np.random.default_rng(seed + 1)
+
+    by_position = {
+        position: [player_id for (player_id,) in db.session.query(Player.id).filter_by(position=position)]
+        for position in ROSTER
+    }
+
+    def sample(positions):
+        pool = [player_id for position in positions for player_id in by_position[position]]
+        players = rng.choice(pool, size=samples)
+        opponents = rng.choice(TEAMS, size=samples)
+        return [(int(player), str(opponent)) for player, opponent in zip(players, opponents)]
+
+    skill = sample(['QB', 'RB', 'WR', 'TE'])
+    receivers = sample(['WR', 'TE'])
+    rushers = sample(['RB'])
+    quarterbacks = sample(['QB'])
+
+    # Start from cold in-process caches so every run measures the same thing
+    PredictionService.invalidate_cache()
+
+    benchmarks = {
+        'get_player_prediction': [
+            lambda p=p, o=o: prediction_service.get_player_prediction(p, o) for p, o in skill
+        ],
+        'predict_yardage_probabilities[receiving_yards]': [
+            lambda p=p, o=o: prediction_service.predict_yardage_probabilities(p, o, 'receiving_yards')
+            for p, o in receivers
+        ],
+        'predict_yardage_probabilities[rushing_yards]': [
+            lambda p=p, o=o: prediction_service.predict_yardage_probabilities(p, o, 'rushing_yards')
+            for p, o in rushers
+        ],
+        'predict_touchdown_probability': [
+            lambda p=p, o=o: prediction_service.predict_touchdown_probability(p, o, 'WR') for p, o in receivers
+        ],
+        'predict_receptions_probabilities': [
+            lambda p=p, o=o: prediction_service.predict_receptions_probabilities(p, o) for p, o in receivers
+        ],
+        'predict_qb_passing_probabilities': [
+            lambda p=p, o=o: prediction_service.predict_qb_passing_probabilities(p, o) for p, o in quarterbacks
+        ],
+        'predict_qb_passing_touchdowns': [
+            lambda p=p, o=o: prediction_service.predict_qb_passing_touchdowns(p, o) for p, o in quarterbacks
+        ],
+        'predict_qb_interceptions': [
+            lambda p=p: prediction_service.predict_qb_interceptions(p) for p, _ in quarterbacks
+        ]
+    }
+
+    client = app.test_client()
+
+    def get(url):
+        response = client.get(url)
+        if response.status_code != 200:
+            raise RuntimeError(f'{url} returned {response.status_code}')
+
+    sorts = ['receiving_yards', 'rushing_yards', 'receptions', 'touchdowns', 'passing_yards', 'passing_touchdowns']
+    positions = ['WR', 'RB', 'TE', 'QB', '']
+    benchmarks['GET /api/players/current-season'] = [
+        lambda i=i: get(
+            f'/api/players/current-season?sort_by={sorts[i % len(sorts)]}&position={positions[i % len(positions)]}'
+        )
+        for i in range(samples)
+    ]
+    benchmarks['GET /api/players/<id>/career'] = [
+        lambda p=p: get(f'/api/players/{p}/career') for p, _ in skill
+    ]
+
+    results = {}
+    for name, calls in benchmarks.items():
+        results[name] = measure(calls)
+        print(f"  {name:50s} p50 {results[name]['p50_ms']:9.3f} ms  "
+              f"p95 {results[name]['p95_ms']:9.3f} ms  p99 {results[name]['p99_ms']:9.3f} ms  "
+              f"queries {results[name]['queries_mean']:.1f}")
+    return results
+
+
+def git_commit():
+    """Current commit hash, if running inside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_file):
+    """Print latency and query count changes against an earlier results file"""
+    with open(baseline_file) as f:
+        baseline = json.load(f)
+
+    print(f"\nCompared with {baseline_file} (commit {baseline.get('commit')}):")
+    for name, result in results.items():
+        before = baseline.get('results', {}).get(name)
+        if not before:
+            print(f"  {name:50s} (new)")
+            continue
+        change = (result['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0.0
+        print(f"  {name:50s} p50 {before['p50_ms']:9.3f} -> {result['p50_ms']:9.3f} ms ({change:+.1f}%)  "
+              f"queries {before['queries_mean']:.1f} -> {result['queries_mean']:.1f}")
+
+
+def main():
+    app = create_app()
+
+    with app.app_context():
+        if Player.query.count() == 0:
+            print("Generating synthetic league...")
+            generate_league(args.seed)
+
+        dataset = {
+            'teams': Team.query.count(),
+            'players': Player.query.count(),
+            'player_stats': PlayerStats.query.count(),
+            'team_stats': TeamStats.query.count(),
+            'seasons': SEASONS
+        }
+
+        print(f"\nRunning benchmarks ({args.samples} calls each)...")
+        results = run_benchmarks(app, args.samples, args.seed)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'samples': args.samples,
+        'seed': args.seed,
+        'dataset': dataset,
+        'results': results
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,5 +30,50 @@ class Config:
     # API
     PORT = int(os.getenv('PORT', 5000))
 
+    # Serve prediction reads from the in-memory columnar stats snapshot
+    STATS_STORE_ENABLED = os.getenv('STATS_STORE_ENABLED', 'True') == 'True'
+
+    # Precompute every player vs opponent prediction after each sync
+    PREDICTION_MATRIX_ENABLED = os.getenv('PREDICTION_MATRIX_ENABLED', 'True') == 'True'
+    PREDICTION_MATRIX_WORKERS = int(os.getenv('PREDICTION_MATRIX_WORKERS', os.cpu_count() or 1))
+
+    # On-disk Parquet cache for nfl_data_py downloads (set to empty to disable)
+    NFL_DATA_CACHE_DIR = os.getenv(
+        'NFL_DATA_CACHE_DIR',
+        os.path.join(os.path.abspath(os.path.dirname(__file__)), 'nfl_data_cache')
+    )
+
+    # Read nfl_data_py datasets from this directory instead of the network (tests/offline)
+    NFL_DATA_FIXTURE_DIR = os.getenv('NFL_DATA_FIXTURE_DIR')
+
+    # ESPN API client
+    ESPN_MAX_WORKERS = int(os.getenv('ESPN_MAX_WORKERS', 8))  # Concurrent requests
+    ESPN_RATE_LIMIT = float(os.getenv('ESPN_RATE_LIMIT', 10))  # Requests per second (0 = unlimited)
+    ESPN_MAX_RETRIES = int(os.getenv('ESPN_MAX_RETRIES', 3))
+    ESPN_STUB_URL = os.getenv('ESPN_STUB_URL')  # Send all ESPN requests to a local stub server
+    # Persistent ESPN response cache (SQLite file; set to empty to disable)
+    ESPN_CACHE_PATH = os.getenv(
+        'ESPN_CACHE_PATH',
+        os.path.join(os.path.abspath(os.path.dirname(__file__)), 'espn_cache.sqlite3')
+    )
+
+    # Per-request SQL statement counts and timings (/api/metrics, X-DB-* response headers)
+    QUERY_METRICS_ENABLED = os.getenv('QUERY_METRICS_ENABLED', 'False') == 'True'
+
+    # ETag / 304 handling for GET /api/players, /api/predictions and /api/export, keyed by the data version
+    HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'True') == 'True'
+    HTTP_CACHE_MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', 0))  # Seconds clients/CDNs may skip revalidating
+    # Response schema/build version, part of every ETag; bump on deploys that change response bodies
+    API_VERSION = os.getenv('API_VERSION', '1')
+    # Seconds a worker trusts its copy of the data version before re-reading it
+    DATA_VERSION_CHECK_SECONDS = float(os.getenv('DATA_VERSION_CHECK_SECONDS', 5))
+
+    # Cache for PredictionService results, keyed by data version:
+    # 'memory' (per-process LRU), 'redis' (LRU in front of a shared Redis) or 'none'
+    RESULT_CACHE_BACKEND = os.getenv('RESULT_CACHE_BACKEND', 'memory')
+    RESULT_CACHE_MAX_ENTRIES = int(os.getenv('RESULT_CACHE_MAX_ENTRIES', 10000))
+    RESULT_CACHE_TTL = int(os.getenv('RESULT_CACHE_TTL', 6 * 3600))  # Seconds
+    RESULT_CACHE_URL = os.getenv('RESULT_CACHE_URL', 'redis://localhost:6379/0')
+
     # Data Update Schedule
     UPDATE_STATS_HOUR = 6  # Update stats at 6 AM daily
@@ -1,109 +1,68 @@
 """
-Export database to JSON seed file
-Run this locally after syncing all data to create a seed file
+Export database to a seed snapshot
+Run this locally after syncing all data to create a seed snapshot
+
+Usage:
+    python export_seed_data.py           # binary snapshot in seed_snapshot/
+    python export_seed_data.py --ndjson  # seed_data.ndjson (resumable import)
+    python export_seed_data.py --json    # legacy seed_data.json
+
+Every format is written incrementally while reading the database in chunks,
+so memory use does not grow with the number of seasons.
 """
-import json
+import os
+import sys
 from app import create_app
-from models.player import Player, PlayerStats
-from models.team import Team, TeamStats
+from services.seed_service import SeedService
 
-def export_data():
-    """Export all database data to JSON file"""
+
+def export_snapshot(directory=None):
+    """Export all database data to a binary seed snapshot (Parquet per table)"""
     app = create_app()
 
     with app.app_context():
-        print("Exporting database to seed file...")
-
-        # Export players
-        players = Player.query.all()
-        players_data = [{
-            'player_id': p.player_id,
-            'name': p.name,
-            'position': p.position,
-            'team': p.team
-        } for p in players]
-
-        print(f"  Exported {len(players_data)} players")
-
-        # Export player stats
-        stats = PlayerStats.query.all()
-        stats_data = []
-
-        # Create player_id lookup
-        player_id_map = {p.id: p.player_id for p in players}
+        print("Exporting database to seed snapshot...")
+        manifest = SeedService.export_snapshot(directory)
 
-        for s in stats:
-            stats_data.append({
-                'player_id': player_id_map.get(s.player_id),
-                'season': s.season,
-                'week': s.week,
-                'receptions': s.receptions,
-                'receiving_yards': s.receiving_yards,
-                'receiving_touchdowns': s.receiving_touchdowns,
-                'targets': s.targets,
-                'rushes': s.rushes,
-                'rushing_yards': s.rushing_yards,
-                'rushing_touchdowns': s.rushing_touchdowns,
-                'passing_attempts': s.passing_attempts,
-                'passing_completions': s.passing_completions,
-                'passing_yards': s.passing_yards,
-                'passing_touchdowns': s.passing_touchdowns,
-                'interceptions': s.interceptions,
-                'opponent': s.opponent
-            })
+        directory = directory or SeedService.DEFAULT_DIR
+        size = sum(
+            os.path.getsize(os.path.join(directory, table['file']))
+            for table in manifest['tables'].values()
+        )
+        print(f"\nSeed snapshot created: {directory}")
+        print(f"  Total size: {size / 1024 / 1024:.2f} MB")
+        print("\nYou can now upload this directory to your repository.")
 
-        print(f"  Exported {len(stats_data)} player stats")
 
-        # Export teams
-        teams = Team.query.all()
-        teams_data = [{
-            'team_abbr': t.team_abbr,
-            'team_name': t.team_name
-        } for t in teams]
-
-        print(f"  Exported {len(teams_data)} teams")
-
-        # Export team stats (needed for defensive adjustments)
-        team_stats = TeamStats.query.all()
-        team_stats_data = []
+def export_ndjson(output_file=None):
+    """Export all database data to an NDJSON seed file"""
+    app = create_app()
 
-        # Create team lookup
-        team_lookup = {t.id: t.team_abbr for t in teams}
+    with app.app_context():
+        output_file = output_file or SeedService.DEFAULT_NDJSON
+        print("Exporting database to NDJSON seed file...")
+        SeedService.export_ndjson(output_file)
 
-        for ts in team_stats:
-            team_abbr = team_lookup.get(ts.team_id)
-            if team_abbr:
-                team_stats_data.append({
-                    'team_abbr': team_abbr,
-                    'season': ts.season,
-                    'week': ts.week,
-                    'opponent': ts.opponent,
-                    'points_against': ts.points_against,
-                    'yards_against': ts.yards_against,
-                    'passing_yards_against': ts.passing_yards_against,
-                    'rushing_yards_against': ts.rushing_yards_against
-                })
+        print(f"\nSeed file created: {output_file}")
+        print(f"  Total size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
 
-        print(f"  Exported {len(team_stats_data)} team stats")
 
-        # Combine all data
-        seed_data = {
-            'version': '1.0',
-            'exported_at': str(app.config.get('UPDATE_STATS_HOUR', '2025-10-07')),
-            'players': players_data,
-            'player_stats': stats_data,
-            'teams': teams_data,
-            'team_stats': team_stats_data
-        }
+def export_data(output_file='seed_data.json'):
+    """Export all database data to JSON file"""
+    app = create_app()
 
-        # Write to file
-        output_file = 'seed_data.json'
-        with open(output_file, 'w') as f:
-            json.dump(seed_data, f, indent=2)
+    with app.app_context():
+        print("Exporting database to seed file...")
+        SeedService.export_json(output_file)
 
         print(f"\nSeed file created: {output_file}")
-        print(f"  Total size: {len(json.dumps(seed_data)) / 1024 / 1024:.2f} MB")
-        print(f"\nYou can now upload this file to your repository.")
+        print(f"  Total size: {os.path.getsize(output_file) / 1024 / 1024:.2f} MB")
+        print("\nYou can now upload this file to your repository.")
 
 if __name__ == '__main__':
-    export_data()
+    if '--json' in sys.argv:
+        export_data()
+    elif '--ndjson' in sys.argv:
+        export_ndjson()
+    else:
+        export_snapshot()
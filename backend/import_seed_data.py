@@ -1,12 +1,59 @@
 """
-Import database from JSON seed file
+Import database from a seed snapshot, NDJSON seed file or the legacy JSON seed file
 Fast initialization of database from pre-exported data
+
+Usage:
+    python import_seed_data.py                        # seed_snapshot/, else seed_data.json
+    python import_seed_data.py seed_data.ndjson       # chunked; rerun to resume
+    python import_seed_data.py seed_data.ndjson --restart
 """
 import json
+import os
+import sys
 from app import create_app
 from models import db
+from models.data_version import DataVersion
 from models.player import Player, PlayerStats
 from models.team import Team, TeamStats
+from services.nfl_data_service import NFLDataService
+from services.seed_service import SeedService
+
+
+def import_snapshot(directory=None):
+    """Restore all database data from a binary seed snapshot"""
+    app = create_app()
+
+    with app.app_context():
+        print("=" * 60)
+        print("IMPORTING DATABASE FROM SEED SNAPSHOT")
+        print("=" * 60)
+
+        SeedService.restore_snapshot(directory)
+        NFLDataService.refresh_stat_rollups()
+        DataVersion.bump()
+
+        print("\n" + "=" * 60)
+        print("DATABASE IMPORT COMPLETE!")
+        print("=" * 60)
+
+
+def import_ndjson(seed_file, resume=True):
+    """Import all database data from an NDJSON seed file, resuming an interrupted import"""
+    app = create_app()
+
+    with app.app_context():
+        print("=" * 60)
+        print("IMPORTING DATABASE FROM NDJSON SEED FILE")
+        print("=" * 60)
+
+        SeedService.import_ndjson(seed_file, resume=resume)
+        NFLDataService.refresh_stat_rollups()
+        DataVersion.bump()
+
+        print("\n" + "=" * 60)
+        print("DATABASE IMPORT COMPLETE!")
+        print("=" * 60)
+
 
 def import_data(seed_file='seed_data.json'):
     """Import all database data from JSON seed file"""
@@ -25,13 +72,8 @@ def import_data(seed_file='seed_data.json'):
         print(f"Seed version: {seed_data.get('version')}")
         print(f"Exported at: {seed_data.get('exported_at')}")
 
-        # Clear existing data
-        print("\nClearing existing data...")
-        PlayerStats.query.delete()
-        Player.query.delete()
-        TeamStats.query.delete()
-        Team.query.delete()
-        db.session.commit()
+        # Clear existing data (rollups and sync state included)
+        SeedService.clear_tables()
         print("  Database cleared")
 
         # Import teams
@@ -156,6 +198,9 @@ def import_data(seed_file='seed_data.json'):
         else:
             print("  No team stats in seed file")
 
+        NFLDataService.refresh_stat_rollups()
+        DataVersion.bump()
+
         print("\n" + "=" * 60)
         print("DATABASE IMPORT COMPLETE!")
         print("=" * 60)
@@ -175,4 +220,14 @@ def import_data(seed_file='seed_data.json'):
         print(f"  Seasons: {seasons}")
 
 if __name__ == '__main__':
-    import_data()
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if args and args[0].endswith('.ndjson'):
+        import_ndjson(args[0], resume='--restart' not in sys.argv)
+    elif args and os.path.isdir(args[0]):
+        import_snapshot(args[0])
+    elif args:
+        import_data(args[0])
+    elif SeedService.has_snapshot():
+        import_snapshot()
+    else:
+        import_data()
@@ -0,0 +1,74 @@
+from models import db
+from datetime import datetime
+import time
+
+class DataVersion(db.Model):
+    """Single-row counter bumped every time synced data changes"""
+
+    __tablename__ = 'data_version'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Process-level copy of the version for per-request checks (see cached())
+    _cached_version = None
+    _cached_at = 0.0
+
+    def __repr__(self):
+        return f'<DataVersion {self.version}>'
+
+    def to_dict(self):
+        """Convert data version to dictionary"""
+        return {
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    @staticmethod
+    def current():
+        """Get the current data version (0 before the first sync)"""
+        version = db.session.query(DataVersion.version).filter(DataVersion.id == 1).scalar()
+        return version or 0
+
+    @staticmethod
+    def bump():
+        """
+        Increment the data version
+        The increment runs in SQL so concurrent bumps never reuse a version
+
+        Returns:
+            The new data version
+        """
+        updated = DataVersion.query.filter(DataVersion.id == 1).update(
+            {DataVersion.version: DataVersion.version + 1, DataVersion.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        if not updated:
+            db.session.add(DataVersion(id=1, version=1))
+        db.session.commit()
+        return DataVersion._remember(DataVersion.current())
+
+    @staticmethod
+    def cached(max_age):
+        """
+        Get the data version without a query on most calls
+        The version is re-read from the database at most every max_age seconds;
+        bumps made by this process are seen immediately, bumps made by other
+        processes within max_age seconds
+
+        Args:
+            max_age: Seconds a read version is trusted
+
+        Returns:
+            The data version
+        """
+        if DataVersion._cached_version is None or time.monotonic() - DataVersion._cached_at >= max_age:
+            return DataVersion._remember(DataVersion.current())
+        return DataVersion._cached_version
+
+    @staticmethod
+    def _remember(version):
+        DataVersion._cached_version = version
+        DataVersion._cached_at = time.monotonic()
+        return version
@@ -103,3 +103,70 @@ class PlayerStats(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+class PlayerSeasonTotals(db.Model):
+    """Per-player season totals, rolled up from weekly player stats on import"""
+
+    __tablename__ = 'player_season_totals'
+
+    # Stats the current-season leaderboard can be sorted by (each has its own index)
+    SORT_COLUMNS = [
+        'receiving_yards', 'rushing_yards', 'receptions', 'touchdowns',
+        'passing_yards', 'passing_touchdowns'
+    ]
+
+    id = db.Column(db.Integer, primary_key=True)
+    player_id = db.Column(db.Integer, db.ForeignKey('players.id'), nullable=False)
+    season = db.Column(db.Integer, nullable=False)
+    games_played = db.Column(db.Integer, nullable=False, default=0)
+
+    # Summed over the player's weekly rows (season total rows excluded)
+    receptions = db.Column(db.Integer, nullable=False, default=0)
+    receiving_yards = db.Column(db.Integer, nullable=False, default=0)
+    receiving_touchdowns = db.Column(db.Integer, nullable=False, default=0)
+    rushes = db.Column(db.Integer, nullable=False, default=0)
+    rushing_yards = db.Column(db.Integer, nullable=False, default=0)
+    rushing_touchdowns = db.Column(db.Integer, nullable=False, default=0)
+    touchdowns = db.Column(db.Integer, nullable=False, default=0)  # Receiving + rushing
+    passing_attempts = db.Column(db.Integer, nullable=False, default=0)
+    passing_completions = db.Column(db.Integer, nullable=False, default=0)
+    passing_yards = db.Column(db.Integer, nullable=False, default=0)
+    passing_touchdowns = db.Column(db.Integer, nullable=False, default=0)
+    interceptions = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # One row per player-season; a (season, stat) index per sort column lets a
+    # leaderboard read the top rows of a season in index order
+    __table_args__ = (
+        db.UniqueConstraint('player_id', 'season', name='uq_player_season_totals_player_season'),
+        *[
+            db.Index(f'idx_player_season_totals_{column}', 'season', column)
+            for column in SORT_COLUMNS
+        ]
+    )
+
+    def __repr__(self):
+        return f'<PlayerSeasonTotals player {self.player_id} - Season {self.season}>'
+
+    def to_dict(self):
+        """Convert season totals to dictionary"""
+        return {
+            'player_id': self.player_id,
+            'season': self.season,
+            'games_played': self.games_played,
+            'receptions': self.receptions,
+            'receiving_yards': self.receiving_yards,
+            'receiving_touchdowns': self.receiving_touchdowns,
+            'rushes': self.rushes,
+            'rushing_yards': self.rushing_yards,
+            'rushing_touchdowns': self.rushing_touchdowns,
+            'touchdowns': self.touchdowns,
+            'passing_attempts': self.passing_attempts,
+            'passing_completions': self.passing_completions,
+            'passing_yards': self.passing_yards,
+            'passing_touchdowns': self.passing_touchdowns,
+            'interceptions': self.interceptions,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -0,0 +1,48 @@
+from models import db
+from datetime import datetime
+import json
+import zlib
+
+class PredictionMatrix(db.Model):
+    """Precomputed full prediction for a player against an opponent at a data version"""
+
+    __tablename__ = 'prediction_matrix'
+
+    id = db.Column(db.Integer, primary_key=True)
+    data_version = db.Column(db.Integer, nullable=False)
+    player_id = db.Column(db.Integer, nullable=False)  # players.id (no FK: rows are rebuilt, not maintained)
+    opponent = db.Column(db.String(10), nullable=False)
+
+    # zlib-compressed JSON of PredictionService.get_player_prediction
+    prediction = db.Column(db.LargeBinary, nullable=False)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Lookup key for reads
+    __table_args__ = (
+        db.UniqueConstraint('data_version', 'player_id', 'opponent', name='uq_prediction_matrix_key'),
+    )
+
+    def __repr__(self):
+        return f'<PredictionMatrix player={self.player_id} vs {self.opponent} v{self.data_version}>'
+
+    @staticmethod
+    def encode(prediction):
+        """Compress a prediction dictionary for storage"""
+        payload = json.dumps(prediction, separators=(',', ':'), default=lambda value: value.item())
+        return zlib.compress(payload.encode('utf-8'))
+
+    @staticmethod
+    def decode(data):
+        """Decompress a stored prediction back into a dictionary"""
+        return json.loads(zlib.decompress(data).decode('utf-8'))
+
+    def to_dict(self):
+        """Convert matrix entry to dictionary"""
+        return {
+            'data_version': self.data_version,
+            'player_id': self.player_id,
+            'opponent': self.opponent,
+            'prediction': self.decode(self.prediction),
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -0,0 +1,32 @@
+from models import db
+from datetime import datetime
+
+class SeedImport(db.Model):
+    """Progress of a chunked NDJSON seed import, committed with each chunk so an interrupted import can resume"""
+
+    __tablename__ = 'seed_import'
+
+    id = db.Column(db.Integer, primary_key=True)
+    path = db.Column(db.String(500), nullable=False)
+    exported_at = db.Column(db.String(50), nullable=False)  # Identifies the seed file the progress belongs to
+
+    # Byte offset of the next unread line and rows loaded so far
+    offset = db.Column(db.BigInteger, default=0)
+    rows = db.Column(db.Integer, default=0)
+    completed = db.Column(db.Boolean, default=False)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<SeedImport {self.path} {self.rows} rows>'
+
+    def to_dict(self):
+        """Convert seed import progress to dictionary"""
+        return {
+            'path': self.path,
+            'exported_at': self.exported_at,
+            'offset': self.offset,
+            'rows': self.rows,
+            'completed': self.completed,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
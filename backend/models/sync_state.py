@@ -0,0 +1,36 @@
+from models import db
+from datetime import datetime
+
+class SyncState(db.Model):
+    """Ingested content checksum per data source and week (the highest week is the season's watermark)"""
+
+    __tablename__ = 'sync_state'
+
+    id = db.Column(db.Integer, primary_key=True)
+    source = db.Column(db.String(50), nullable=False)  # e.g. 'player_stats', 'team_stats'
+    season = db.Column(db.Integer, nullable=False)
+    week = db.Column(db.Integer, nullable=False)
+
+    # Order-independent hash of the week's source rows and how many there were
+    checksum = db.Column(db.String(16), nullable=False)
+    row_count = db.Column(db.Integer, default=0)
+
+    synced_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('source', 'season', 'week', name='uq_sync_state_source_season_week'),
+    )
+
+    def __repr__(self):
+        return f'<SyncState {self.source} {self.season} Week {self.week}>'
+
+    def to_dict(self):
+        """Convert sync state to dictionary"""
+        return {
+            'source': self.source,
+            'season': self.season,
+            'week': self.week,
+            'checksum': self.checksum,
+            'row_count': self.row_count,
+            'synced_at': self.synced_at.isoformat() if self.synced_at else None
+        }
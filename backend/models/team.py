@@ -55,11 +55,29 @@ class TeamStats(db.Model):
     # Relationships
     team = db.relationship('Team', back_populates='stats')
 
-    # Composite index for efficient queries
+    # Composite index for efficient queries; the unique index backs bulk upserts
+    # NULLs never conflict in a unique index, so week/opponent are keyed through COALESCE
+    # (see TeamStats.unique_key()) to make season-total and bye rows upsert too
     __table_args__ = (
         db.Index('idx_team_season_week', 'team_id', 'season', 'week'),
+        db.Index(
+            'uq_team_stats_game', team_id, season,
+            db.func.coalesce(week, db.literal_column('0')),
+            db.func.coalesce(opponent, db.literal_column("''")),
+            unique=True
+        ),
     )
 
+    @classmethod
+    def unique_key(cls):
+        """Expressions of the uq_team_stats_game index (the upsert conflict target)"""
+        return [
+            cls.__table__.c.team_id,
+            cls.__table__.c.season,
+            db.func.coalesce(cls.__table__.c.week, db.literal_column('0')),
+            db.func.coalesce(cls.__table__.c.opponent, db.literal_column("''"))
+        ]
+
     def __repr__(self):
         return f'<TeamStats {self.team.team_name if self.team else "Unknown"} - Season {self.season} Week {self.week}>'
 
@@ -79,3 +97,44 @@ class TeamStats(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+
+
+class TeamOffenseWeekly(db.Model):
+    """Team offensive totals per week, aggregated from player stats on import"""
+
+    __tablename__ = 'team_offense_weekly'
+
+    id = db.Column(db.Integer, primary_key=True)
+    team = db.Column(db.String(10), nullable=False)  # Team abbreviation (matches Player.team)
+    season = db.Column(db.Integer, nullable=False)
+    week = db.Column(db.Integer, nullable=False)
+
+    # Summed over every player on the team that week
+    passing_yards = db.Column(db.Integer, default=0)
+    rushing_yards = db.Column(db.Integer, default=0)
+    receiving_yards = db.Column(db.Integer, default=0)
+    targets = db.Column(db.Integer, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # One row per team-week; also serves as the lookup index
+    __table_args__ = (
+        db.UniqueConstraint('team', 'season', 'week', name='uq_team_offense_team_season_week'),
+    )
+
+    def __repr__(self):
+        return f'<TeamOffenseWeekly {self.team} - Season {self.season} Week {self.week}>'
+
+    def to_dict(self):
+        """Convert team offense totals to dictionary"""
+        return {
+            'id': self.id,
+            'team': self.team,
+            'season': self.season,
+            'week': self.week,
+            'passing_yards': self.passing_yards,
+            'rushing_yards': self.rushing_yards,
+            'receiving_yards': self.receiving_yards,
+            'targets': self.targets,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
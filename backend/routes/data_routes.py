@@ -1,6 +1,10 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from services.nfl_data_service import NFLDataService
 from services.espn_2025_scraper import ESPN2025Scraper
+from services.prediction_service import PredictionService
+from services.prediction_matrix_service import PredictionMatrixService
+from services.seed_service import SeedService
+from services.result_cache import get_result_cache
 import os
 
 data_bp = Blueprint('data', __name__, url_prefix='/api/data')
@@ -11,17 +15,29 @@ def sync_data():
     Manually trigger data synchronization
     This will fetch the latest NFL data and update the database
     Note: This is a long-running operation (5-10 minutes)
+    Query params:
+        - mode: 'full' (default) or 'incremental' (only new or corrected weeks)
     """
     try:
         # Allow GET for easier testing in browser
         import threading
 
+        mode = request.args.get('mode', 'full')
+        if mode not in ('full', 'incremental'):
+            return jsonify({
+                'success': False,
+                'error': "mode must be 'full' or 'incremental'"
+            }), 400
+
         def run_sync():
             from app import app
             with app.app_context():
-                print("Manual data sync triggered")
+                print(f"Manual data sync triggered ({mode})")
                 # Sync historical data (2021-2024 from nfl-data-py)
-                NFLDataService.sync_all_data(years=5)
+                if mode == 'incremental':
+                    NFLDataService.sync_incremental(years=5)
+                else:
+                    NFLDataService.sync_all_data(years=5)
                 # Sync 2025 season from ESPN
                 print("Syncing 2025 season from ESPN...")
                 try:
@@ -29,6 +45,7 @@ def sync_data():
                     print("✓ 2025 season data synced")
                 except Exception as e:
                     print(f"⚠ Error syncing 2025 data: {e}")
+                PredictionMatrixService.build()
                 print("Data sync completed!")
 
         # Run sync in background thread to avoid timeout
@@ -61,6 +78,7 @@ def sync_2025_data():
             with app.app_context():
                 print("2025 season sync triggered")
                 ESPN2025Scraper.import_2025_data(start_week=1, end_week=18)
+                PredictionMatrixService.build()
                 print("2025 season sync completed!")
 
         sync_thread = threading.Thread(target=run_2025_sync, daemon=False)
@@ -81,7 +99,8 @@ def sync_2025_data():
 @data_bp.route('/seed', methods=['POST', 'GET'])
 def seed_database():
     """
-    Seed database from pre-exported seed_data.json file
+    Seed database from the pre-exported seed snapshot (seed_snapshot/) or
+    seed_data.ndjson, falling back to the legacy seed_data.json file
     Much faster than syncing from APIs (30 seconds vs 15 minutes)
     """
     try:
@@ -89,13 +108,32 @@ def seed_database():
         import json
         from models import db
         from models.player import Player, PlayerStats
-        from models.team import Team, TeamStats
+        from models.team import Team
 
         def run_seed():
             from app import app
             with app.app_context():
                 print("Database seeding started...")
 
+                # Prefer the binary snapshot, then NDJSON: both stream into the
+                # database instead of loading every row into memory first
+                streamed = True
+                if SeedService.has_snapshot():
+                    print(f"Restoring seed snapshot from {SeedService.DEFAULT_DIR}")
+                    SeedService.restore_snapshot()
+                elif os.path.exists(SeedService.DEFAULT_NDJSON):
+                    print(f"Importing seed file {SeedService.DEFAULT_NDJSON}")
+                    SeedService.import_ndjson()
+                else:
+                    streamed = False
+
+                if streamed:
+                    NFLDataService.refresh_stat_rollups()
+                    PredictionService.invalidate_cache()
+                    PredictionMatrixService.build()
+                    print("Database seeding complete!")
+                    return
+
                 # Check if seed file exists
                 seed_file = os.path.join(os.path.dirname(__file__), '..', 'seed_data.json')
                 if not os.path.exists(seed_file):
@@ -109,12 +147,7 @@ def seed_database():
                 print(f"Loading seed version: {seed_data.get('version')}")
 
                 # Clear existing data
-                print("Clearing existing data...")
-                PlayerStats.query.delete()
-                Player.query.delete()
-                TeamStats.query.delete()
-                Team.query.delete()
-                db.session.commit()
+                SeedService.clear_tables()
 
                 # Import teams
                 print("Importing teams...")
@@ -181,37 +214,35 @@ def seed_database():
                     db.session.commit()
                     print(f"  Imported batch {i//batch_size + 1}")
 
+                NFLDataService.refresh_stat_rollups()
+
                 # Import team stats
                 team_stats_data = seed_data.get('team_stats', [])
                 if team_stats_data:
                     print(f"Importing {len(team_stats_data)} team stats...")
-                    batch_size = 500
-
-                    for i in range(0, len(team_stats_data), batch_size):
-                        batch = team_stats_data[i:i + batch_size]
-                        team_stats_objects = []
-
-                        for ts_data in batch:
-                            db_team_id = team_id_map.get(ts_data['team_abbr'])
-                            if not db_team_id:
-                                continue
-
-                            team_stat = TeamStats(
-                                team_id=db_team_id,
-                                season=ts_data['season'],
-                                week=ts_data.get('week'),
-                                opponent=ts_data.get('opponent'),
-                                points_against=ts_data.get('points_against', 0),
-                                yards_against=ts_data.get('yards_against', 0),
-                                passing_yards_against=ts_data.get('passing_yards_against', 0),
-                                rushing_yards_against=ts_data.get('rushing_yards_against', 0)
-                            )
-                            team_stats_objects.append(team_stat)
-
-                        db.session.bulk_save_objects(team_stats_objects)
-                        db.session.commit()
+                    team_stats_records = []
+                    for ts_data in team_stats_data:
+                        db_team_id = team_id_map.get(ts_data['team_abbr'])
+                        if not db_team_id:
+                            continue
+
+                        team_stats_records.append({
+                            'team_id': db_team_id,
+                            'season': ts_data['season'],
+                            'week': ts_data.get('week'),
+                            'opponent': ts_data.get('opponent'),
+                            'points_against': ts_data.get('points_against', 0),
+                            'yards_against': ts_data.get('yards_against', 0),
+                            'passing_yards_against': ts_data.get('passing_yards_against', 0),
+                            'rushing_yards_against': ts_data.get('rushing_yards_against', 0)
+                        })
+
+                    # Upsert so duplicate rows in older seed files collapse onto the unique key
+                    NFLDataService.upsert_team_stats(team_stats_records)
                     print(f"  Imported {len(team_stats_data)} team stats")
 
+                PredictionService.invalidate_cache()
+                PredictionMatrixService.build()
                 print("Database seeding complete!")
 
         seed_thread = threading.Thread(target=run_seed, daemon=False)
@@ -246,6 +277,8 @@ def sync_defensive_stats():
                 seasons = [2021, 2022, 2023, 2024, 2025]
                 team_stats = NFLDataService.fetch_team_stats(seasons)
                 NFLDataService.import_team_stats_to_db(team_stats)
+                PredictionService.invalidate_cache()
+                PredictionMatrixService.build()
                 print("Defensive stats sync completed!")
 
         sync_thread = threading.Thread(target=run_defense_sync, daemon=False)
@@ -300,3 +333,22 @@ def get_data_status():
             'success': False,
             'error': str(e)
         }), 500
+
+
+@data_bp.route('/cache', methods=['GET'])
+def get_cache_status():
+    """
+    Prediction result cache counters for this worker
+    (hits, shared hits, coalesced waits, misses, evictions, entries)
+    """
+    result_cache = get_result_cache()
+    if result_cache is None:
+        return jsonify({
+            'success': True,
+            'cache': {'backend': 'none'}
+        }), 200
+
+    return jsonify({
+        'success': True,
+        'cache': result_cache.stats()
+    }), 200
@@ -0,0 +1,58 @@
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from services.export_service import ExportService
+
+export_bp = Blueprint('export', __name__, url_prefix='/api/export')
+
+
+@export_bp.route('/player-stats', methods=['GET'])
+def export_player_stats():
+    """
+    Stream weekly player stats for bulk download
+    Query params:
+        - format: ndjson (default), csv or parquet
+        - season_from: First season to include (optional)
+        - season_to: Last season to include (optional)
+        - season: Single season (optional, sets both bounds)
+        - position: Filter by position (optional)
+        - team: Filter by team abbreviation (optional)
+    """
+    try:
+        export_format = request.args.get('format', 'ndjson').lower()
+        if export_format not in ExportService.FORMATS:
+            return jsonify({
+                'success': False,
+                'error': f'format must be one of: {", ".join(ExportService.FORMATS)}'
+            }), 400
+
+        season = request.args.get('season', type=int)
+        season_from = request.args.get('season_from', season, type=int)
+        season_to = request.args.get('season_to', season, type=int)
+
+        if season_from is not None and season_to is not None and season_from > season_to:
+            return jsonify({
+                'success': False,
+                'error': 'season_from must not be after season_to'
+            }), 400
+
+        position = request.args.get('position')
+        team = request.args.get('team')
+
+        query = ExportService.player_stats_query(
+            season_from=season_from,
+            season_to=season_to,
+            position=position.upper() if position else None,
+            team=team.upper() if team else None
+        )
+
+        # stream_with_context keeps the database session open while the body is generated
+        return Response(
+            stream_with_context(ExportService.stream(query, export_format)),
+            mimetype=ExportService.FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename=player_stats.{export_format}'}
+        )
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -0,0 +1,19 @@
+from flask import Blueprint, Response
+from services.query_metrics import QueryMetrics
+from services.result_cache import get_result_cache
+
+metrics_bp = Blueprint('metrics', __name__, url_prefix='/api')
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Per-endpoint request and SQL metrics, plus prediction cache counters, in
+    Prometheus text format
+    Only registered when QUERY_METRICS_ENABLED is set
+    """
+    body = QueryMetrics.render_prometheus()
+    result_cache = get_result_cache()
+    if result_cache is not None:
+        body += result_cache.render_prometheus()
+    return Response(body, mimetype='text/plain; version=0.0.4')
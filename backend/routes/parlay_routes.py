@@ -0,0 +1,110 @@
+from flask import Blueprint, jsonify, request
+from services.parlay_service import ParlayService
+
+parlay_bp = Blueprint('parlays', __name__, url_prefix='/api/parlays')
+
+# Upper bounds for a single pricing request
+MAX_PARLAY_LEGS = 20
+MAX_DRAWS = 1000000
+MIN_DRAWS = 1000
+
+
+@parlay_bp.route('/price', methods=['POST'])
+def price_parlay():
+    """
+    Price a parlay with a correlated Monte Carlo simulation
+    JSON body:
+        - legs: List of {player_id, opponent, stat, line, side}
+          stat: passing_yards, rushing_yards, receiving_yards, receptions,
+                passing_tds, rushing_tds, receiving_tds, touchdowns, interceptions
+          side: 'over' (at or above the line, default) or 'under' (below it)
+        - draws: Simulated games (optional, default 100,000)
+        - seed: Random seed for reproducible prices (optional)
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        legs = data.get('legs')
+
+        if not isinstance(legs, list) or not legs:
+            return jsonify({
+                'success': False,
+                'error': 'legs must be a non-empty list'
+            }), 400
+
+        if len(legs) > MAX_PARLAY_LEGS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_PARLAY_LEGS} legs can be priced per parlay'
+            }), 400
+
+        try:
+            draws = int(data.get('draws') or ParlayService.DEFAULT_DRAWS)
+            seed = int(data['seed']) if data.get('seed') is not None else None
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'draws and seed must be integers'
+            }), 400
+
+        if not MIN_DRAWS <= draws <= MAX_DRAWS:
+            return jsonify({
+                'success': False,
+                'error': f'draws must be between {MIN_DRAWS} and {MAX_DRAWS}'
+            }), 400
+
+        normalized_legs = []
+        for leg in legs:
+            if not isinstance(leg, dict) or leg.get('player_id') is None or not leg.get('opponent'):
+                return jsonify({
+                    'success': False,
+                    'error': 'Each leg requires player_id, opponent, stat and line'
+                }), 400
+
+            if leg.get('stat') not in ParlayService.LEG_STATS:
+                return jsonify({
+                    'success': False,
+                    'error': f'Unknown stat: {leg.get("stat")}'
+                }), 400
+
+            side = str(leg.get('side', 'over')).lower()
+            if side not in ('over', 'under'):
+                return jsonify({
+                    'success': False,
+                    'error': "side must be 'over' or 'under'"
+                }), 400
+
+            try:
+                player_id = int(leg['player_id'])
+                line = float(leg['line'])
+            except (KeyError, TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid player_id or line in leg: {leg}'
+                }), 400
+
+            normalized_legs.append({
+                'player_id': player_id,
+                'opponent': str(leg['opponent']).upper(),
+                'stat': leg['stat'],
+                'line': line,
+                'side': side
+            })
+
+        try:
+            parlay = ParlayService.price(normalized_legs, draws=draws, seed=seed)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'parlay': parlay
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -1,9 +1,9 @@
 from flask import Blueprint, jsonify, request
-from models.player import Player, PlayerStats
+from models.player import Player, PlayerStats, PlayerSeasonTotals
 from models import db
+from services.career_stats_service import CareerStatsService
 from datetime import datetime
-from sqlalchemy import func
-import numpy as np
+from sqlalchemy import case, func
 
 player_bp = Blueprint('players', __name__, url_prefix='/api/players')
 
@@ -205,100 +205,13 @@ def get_player_career_stats(player_id):
     """
     Get complete career statistics for a player across all seasons
     Includes per-season stats, career totals, averages, and standard deviations
+    (per season and overall)
     """
     try:
         player = Player.query.get_or_404(player_id)
 
-        # Get stats grouped by season
-        season_stats = db.session.query(
-            PlayerStats.season,
-            func.count(PlayerStats.id).label('games_played'),
-            func.sum(PlayerStats.receptions).label('total_receptions'),
-            func.sum(PlayerStats.receiving_yards).label('total_receiving_yards'),
-            func.sum(PlayerStats.receiving_touchdowns).label('total_receiving_tds'),
-            func.sum(PlayerStats.rushes).label('total_rushes'),
-            func.sum(PlayerStats.rushing_yards).label('total_rushing_yards'),
-            func.sum(PlayerStats.rushing_touchdowns).label('total_rushing_tds'),
-            func.sum(PlayerStats.targets).label('total_targets'),
-            func.sum(PlayerStats.passing_attempts).label('total_passing_attempts'),
-            func.sum(PlayerStats.passing_completions).label('total_passing_completions'),
-            func.sum(PlayerStats.passing_yards).label('total_passing_yards'),
-            func.sum(PlayerStats.passing_touchdowns).label('total_passing_tds'),
-            func.sum(PlayerStats.interceptions).label('total_interceptions')
-        ).filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).group_by(PlayerStats.season).order_by(PlayerStats.season.desc()).all()
-
-        # Get all weekly stats for standard deviation calculations
-        all_stats = PlayerStats.query.filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).all()
-
-        # Calculate arrays for standard deviation
-        rushing_yards_list = [s.rushing_yards or 0 for s in all_stats]
-        receiving_yards_list = [s.receiving_yards or 0 for s in all_stats]
-        passing_yards_list = [s.passing_yards or 0 for s in all_stats]
-        rushing_td_list = [s.rushing_touchdowns or 0 for s in all_stats]
-        receiving_td_list = [s.receiving_touchdowns or 0 for s in all_stats]
-        passing_td_list = [s.passing_touchdowns or 0 for s in all_stats]
-        interceptions_list = [s.interceptions or 0 for s in all_stats]
-        total_td_list = [(s.rushing_touchdowns or 0) + (s.receiving_touchdowns or 0) for s in all_stats]
-
-        # Format season-by-season data
-        seasons_data = []
-        for season in season_stats:
-            seasons_data.append({
-                'season': season.season,
-                'games_played': season.games_played,
-                'totals': {
-                    'receptions': season.total_receptions or 0,
-                    'receiving_yards': season.total_receiving_yards or 0,
-                    'receiving_touchdowns': season.total_receiving_tds or 0,
-                    'rushes': season.total_rushes or 0,
-                    'rushing_yards': season.total_rushing_yards or 0,
-                    'rushing_touchdowns': season.total_rushing_tds or 0,
-                    'targets': season.total_targets or 0,
-                    'passing_attempts': season.total_passing_attempts or 0,
-                    'passing_completions': season.total_passing_completions or 0,
-                    'passing_yards': season.total_passing_yards or 0,
-                    'passing_touchdowns': season.total_passing_tds or 0,
-                    'interceptions': season.total_interceptions or 0
-                },
-                'averages': {
-                    'receiving_yards_per_game': round((season.total_receiving_yards or 0) / season.games_played, 2) if season.games_played > 0 else 0,
-                    'rushing_yards_per_game': round((season.total_rushing_yards or 0) / season.games_played, 2) if season.games_played > 0 else 0,
-                    'passing_yards_per_game': round((season.total_passing_yards or 0) / season.games_played, 2) if season.games_played > 0 else 0,
-                    'total_touchdowns_per_game': round(((season.total_receiving_tds or 0) + (season.total_rushing_tds or 0)) / season.games_played, 2) if season.games_played > 0 else 0
-                }
-            })
-
-        # Calculate career totals and statistics
-        total_games = len(all_stats)
-        career_stats = {
-            'total_games': total_games,
-            'averages': {
-                'rushing_yards_per_game': round(np.mean(rushing_yards_list), 2) if rushing_yards_list else 0,
-                'receiving_yards_per_game': round(np.mean(receiving_yards_list), 2) if receiving_yards_list else 0,
-                'passing_yards_per_game': round(np.mean(passing_yards_list), 2) if passing_yards_list else 0,
-                'rushing_touchdowns_per_game': round(np.mean(rushing_td_list), 2) if rushing_td_list else 0,
-                'receiving_touchdowns_per_game': round(np.mean(receiving_td_list), 2) if receiving_td_list else 0,
-                'passing_touchdowns_per_game': round(np.mean(passing_td_list), 2) if passing_td_list else 0,
-                'interceptions_per_game': round(np.mean(interceptions_list), 2) if interceptions_list else 0,
-                'total_touchdowns_per_game': round(np.mean(total_td_list), 2) if total_td_list else 0
-            },
-            'standard_deviations': {
-                'rushing_yards': round(np.std(rushing_yards_list), 2) if len(rushing_yards_list) > 1 else 0,
-                'receiving_yards': round(np.std(receiving_yards_list), 2) if len(receiving_yards_list) > 1 else 0,
-                'passing_yards': round(np.std(passing_yards_list), 2) if len(passing_yards_list) > 1 else 0,
-                'rushing_touchdowns': round(np.std(rushing_td_list), 2) if len(rushing_td_list) > 1 else 0,
-                'receiving_touchdowns': round(np.std(receiving_td_list), 2) if len(receiving_td_list) > 1 else 0,
-                'passing_touchdowns': round(np.std(passing_td_list), 2) if len(passing_td_list) > 1 else 0,
-                'interceptions': round(np.std(interceptions_list), 2) if len(interceptions_list) > 1 else 0,
-                'total_touchdowns': round(np.std(total_td_list), 2) if len(total_td_list) > 1 else 0
-            }
-        }
+        # One query for the weekly stat matrix; all aggregates are vectorized
+        seasons_data, career_stats = CareerStatsService.compute(player_id)
 
         return jsonify({
             'success': True,
@@ -347,71 +260,48 @@ def get_current_season_players():
             else:
                 current_season = current_year - 1
 
-            # Check if current season has data, fallback to latest available
-            season_check = PlayerStats.query.filter_by(season=current_season).first()
-            if not season_check:
-                # Get the latest season with data
-                latest_season = db.session.query(func.max(PlayerStats.season)).scalar()
-                if latest_season:
-                    current_season = latest_season
-
-        # Map sort_by to actual column
-        sort_column_map = {
-            'receiving_yards': func.sum(PlayerStats.receiving_yards),
-            'rushing_yards': func.sum(PlayerStats.rushing_yards),
-            'receptions': func.sum(PlayerStats.receptions),
-            'touchdowns': func.sum(PlayerStats.receiving_touchdowns + PlayerStats.rushing_touchdowns),
-            'passing_yards': func.sum(PlayerStats.passing_yards),
-            'passing_touchdowns': func.sum(PlayerStats.passing_touchdowns)
-        }
-
-        sort_column = sort_column_map.get(sort_by, func.sum(PlayerStats.receiving_yards))
-
-        # Build query
-        query = db.session.query(
-            Player,
-            func.sum(PlayerStats.receptions).label('total_receptions'),
-            func.sum(PlayerStats.receiving_yards).label('total_receiving_yards'),
-            func.sum(PlayerStats.receiving_touchdowns).label('total_receiving_tds'),
-            func.sum(PlayerStats.rushes).label('total_rushes'),
-            func.sum(PlayerStats.rushing_yards).label('total_rushing_yards'),
-            func.sum(PlayerStats.rushing_touchdowns).label('total_rushing_tds'),
-            func.sum(PlayerStats.passing_attempts).label('total_passing_attempts'),
-            func.sum(PlayerStats.passing_completions).label('total_passing_completions'),
-            func.sum(PlayerStats.passing_yards).label('total_passing_yards'),
-            func.sum(PlayerStats.passing_touchdowns).label('total_passing_tds'),
-            func.sum(PlayerStats.interceptions).label('total_interceptions'),
-            func.count(PlayerStats.id).label('games_played')
-        ).join(PlayerStats).filter(
-            PlayerStats.season == current_season,
-            PlayerStats.week.isnot(None)
+        # Resolve the season and read the leaderboard from the season totals rollup;
+        # each sort column has a (season, stat) index, so this is an index scan with LIMIT
+        if not requested_season:
+            # Fall back to the latest season with data if the current one has none
+            current_available, latest_season = db.session.query(
+                func.max(case((PlayerSeasonTotals.season == current_season, PlayerSeasonTotals.season))),
+                func.max(PlayerSeasonTotals.season)
+            ).one()
+            if current_available is None and latest_season:
+                current_season = latest_season
+
+        sort_field = sort_by if sort_by in PlayerSeasonTotals.SORT_COLUMNS else 'receiving_yards'
+        sort_column = getattr(PlayerSeasonTotals, sort_field)
+
+        query = db.session.query(Player, PlayerSeasonTotals).join(
+            PlayerSeasonTotals, PlayerSeasonTotals.player_id == Player.id
+        ).filter(
+            PlayerSeasonTotals.season == current_season
         )
 
         if position:
             query = query.filter(Player.position == position.upper())
 
-        query = query.group_by(Player.id).order_by(sort_column.desc()).limit(limit)
-
-        results = query.all()
+        results = query.order_by(sort_column.desc()).limit(limit).all()
 
         players_data = []
-        for result in results:
-            player = result[0]
+        for player, totals in results:
             player_dict = player.to_dict()
             player_dict['current_season_stats'] = {
                 'season': current_season,
-                'games_played': result.games_played,
-                'total_receptions': result.total_receptions or 0,
-                'total_receiving_yards': result.total_receiving_yards or 0,
-                'total_receiving_touchdowns': result.total_receiving_tds or 0,
-                'total_rushes': result.total_rushes or 0,
-                'total_rushing_yards': result.total_rushing_yards or 0,
-                'total_rushing_touchdowns': result.total_rushing_tds or 0,
-                'total_passing_attempts': result.total_passing_attempts or 0,
-                'total_passing_completions': result.total_passing_completions or 0,
-                'total_passing_yards': result.total_passing_yards or 0,
-                'total_passing_touchdowns': result.total_passing_tds or 0,
-                'total_interceptions': result.total_interceptions or 0
+                'games_played': totals.games_played,
+                'total_receptions': totals.receptions,
+                'total_receiving_yards': totals.receiving_yards,
+                'total_receiving_touchdowns': totals.receiving_touchdowns,
+                'total_rushes': totals.rushes,
+                'total_rushing_yards': totals.rushing_yards,
+                'total_rushing_touchdowns': totals.rushing_touchdowns,
+                'total_passing_attempts': totals.passing_attempts,
+                'total_passing_completions': totals.passing_completions,
+                'total_passing_yards': totals.passing_yards,
+                'total_passing_touchdowns': totals.passing_touchdowns,
+                'total_interceptions': totals.interceptions
             }
             players_data.append(player_dict)
 
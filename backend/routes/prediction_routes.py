@@ -1,8 +1,15 @@
 from flask import Blueprint, jsonify, request
-from services.prediction_service import prediction_service
+from services.prediction_service import prediction_service, PredictionService
+from services.prediction_matrix_service import PredictionMatrixService
 
 prediction_bp = Blueprint('predictions', __name__, url_prefix='/api/predictions')
 
+# Upper bound on items in a single /batch request (a full weekly slate is ~200)
+MAX_BATCH_ITEMS = 500
+
+# Upper bound on lines evaluated for a single /lines item
+MAX_LINES_PER_ITEM = 50
+
 
 @prediction_bp.route('/player/<int:player_id>', methods=['GET'])
 def get_player_prediction(player_id):
@@ -20,8 +27,10 @@ def get_player_prediction(player_id):
                 'error': 'Opponent team abbreviation is required'
             }), 400
 
-        # Get prediction
-        prediction = prediction_service.get_player_prediction(player_id, opponent.upper())
+        # Serve from the precomputed matrix, computing live if it has no entry
+        prediction = PredictionMatrixService.get_prediction(player_id, opponent.upper())
+        if prediction is None:
+            prediction = prediction_service.get_player_prediction(player_id, opponent.upper())
 
         if not prediction:
             return jsonify({
@@ -154,3 +163,227 @@ def get_touchdown_prediction(player_id):
             'success': False,
             'error': str(e)
         }), 500
+
+
+@prediction_bp.route('/batch', methods=['POST'])
+def get_batch_predictions():
+    """
+    Get predictions for a whole slate of players in one request
+    JSON body:
+        - items: List of {player_id, opponent, markets}
+          markets is optional and defaults to ['full'] (complete player prediction)
+          Valid markets: full, receiving_yards, rushing_yards, total_yards, passing_yards,
+          receptions, touchdown, rushing_touchdowns, receiving_touchdowns,
+          passing_touchdowns, interceptions
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        items = data.get('items')
+
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                'success': False,
+                'error': 'items must be a non-empty list'
+            }), 400
+
+        if len(items) > MAX_BATCH_ITEMS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_ITEMS} items can be predicted per request'
+            }), 400
+
+        normalized_items = []
+        for item in items:
+            if not isinstance(item, dict) or not item.get('opponent') or item.get('player_id') is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Each item requires player_id and opponent'
+                }), 400
+
+            markets = item.get('markets') or ['full']
+            if not isinstance(markets, list):
+                return jsonify({
+                    'success': False,
+                    'error': 'markets must be a list'
+                }), 400
+
+            invalid_markets = [m for m in markets if m not in PredictionService.BATCH_MARKETS]
+            if invalid_markets:
+                return jsonify({
+                    'success': False,
+                    'error': f'Unknown markets: {", ".join(map(str, invalid_markets))}'
+                }), 400
+
+            try:
+                player_id = int(item['player_id'])
+            except (TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid player_id: {item["player_id"]}'
+                }), 400
+
+            normalized_items.append({
+                'player_id': player_id,
+                'opponent': str(item['opponent']).upper(),
+                'markets': markets
+            })
+
+        results = prediction_service.predict_batch(normalized_items)
+
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'predictions': results
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+def _parse_lines(lines):
+    """Validate a list of lines, returning (floats, error message)"""
+    if not isinstance(lines, list) or not lines:
+        return None, 'lines must be a non-empty list of numbers'
+    if len(lines) > MAX_LINES_PER_ITEM:
+        return None, f'At most {MAX_LINES_PER_ITEM} lines can be evaluated per item'
+    try:
+        return [float(line) for line in lines], None
+    except (TypeError, ValueError):
+        return None, f'Invalid lines: {lines}'
+
+
+@prediction_bp.route('/lines/<int:player_id>', methods=['GET'])
+def get_line_probabilities(player_id):
+    """
+    Over/under probabilities for arbitrary lines on one player market
+    Query params:
+        - opponent: Opponent team abbreviation (required)
+        - market: receiving_yards, rushing_yards, total_yards, passing_yards, receptions,
+          touchdown, rushing_touchdowns, receiving_touchdowns, passing_touchdowns or
+          interceptions (required)
+        - lines: Comma-separated lines, e.g. 62.5,67.5,72.5 (required)
+    """
+    try:
+        opponent = request.args.get('opponent')
+        market = request.args.get('market')
+
+        if not opponent:
+            return jsonify({
+                'success': False,
+                'error': 'Opponent team abbreviation is required'
+            }), 400
+
+        if market not in PredictionService.LINE_MARKETS:
+            return jsonify({
+                'success': False,
+                'error': f'market must be one of: {", ".join(PredictionService.LINE_MARKETS)}'
+            }), 400
+
+        lines, error = _parse_lines(request.args.get('lines', '').split(',') if request.args.get('lines') else None)
+        if error:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 400
+
+        result = prediction_service.predict_lines([{
+            'player_id': player_id,
+            'opponent': opponent.upper(),
+            'market': market,
+            'lines': lines
+        }])[0]
+
+        if 'error' in result:
+            return jsonify({
+                'success': False,
+                'error': result['error']
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'prediction': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@prediction_bp.route('/lines', methods=['POST'])
+def get_batch_line_probabilities():
+    """
+    Over/under probabilities for many players' lines in one request
+    JSON body:
+        - items: List of {player_id, opponent, market, lines}
+          market: any market of /lines/<player_id>; lines: list of numbers
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        items = data.get('items')
+
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                'success': False,
+                'error': 'items must be a non-empty list'
+            }), 400
+
+        if len(items) > MAX_BATCH_ITEMS:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_BATCH_ITEMS} items can be priced per request'
+            }), 400
+
+        normalized_items = []
+        for item in items:
+            if not isinstance(item, dict) or not item.get('opponent') or item.get('player_id') is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'Each item requires player_id, opponent, market and lines'
+                }), 400
+
+            if item.get('market') not in PredictionService.LINE_MARKETS:
+                return jsonify({
+                    'success': False,
+                    'error': f'Unknown market: {item.get("market")}'
+                }), 400
+
+            lines, error = _parse_lines(item.get('lines'))
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': error
+                }), 400
+
+            try:
+                player_id = int(item['player_id'])
+            except (TypeError, ValueError):
+                return jsonify({
+                    'success': False,
+                    'error': f'Invalid player_id: {item["player_id"]}'
+                }), 400
+
+            normalized_items.append({
+                'player_id': player_id,
+                'opponent': str(item['opponent']).upper(),
+                'market': item['market'],
+                'lines': lines
+            })
+
+        results = prediction_service.predict_lines(normalized_items)
+
+        return jsonify({
+            'success': True,
+            'count': len(results),
+            'predictions': results
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -1,11 +1,12 @@
 """
 Scrape 2025 NFL season data from ESPN game summaries
 """
-import requests
-import time
 from app import create_app
 from models import db
+from models.data_version import DataVersion
 from models.player import Player, PlayerStats
+from services.nfl_data_service import NFLDataService
+from services.espn_client import get_espn_client, scoreboard_is_final, summary_is_final
 
 def get_2025_games(week):
     """Get all game IDs for a specific week in 2025"""
@@ -16,9 +17,12 @@ def get_2025_games(week):
         'dates': 2025
     }
 
-    response = requests.get(url, params=params, timeout=10)
-    response.raise_for_status()
-    data = response.json()
+    client = get_espn_client()
+    data = client.get_json(url, params=params, timeout=10)
+
+    # A week where every game is final never changes again
+    if scoreboard_is_final(data):
+        client.pin(url, params)
 
     game_ids = []
     if 'events' in data:
@@ -32,9 +36,12 @@ def get_player_stats_from_game(event_id, week):
     url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary"
     params = {'event': event_id}
 
-    response = requests.get(url, params=params, timeout=10)
-    response.raise_for_status()
-    data = response.json()
+    client = get_espn_client()
+    data = client.get_json(url, params=params, timeout=10)
+
+    # Boxscores of final games never change again
+    if summary_is_final(data):
+        client.pin(url, params)
 
     # Dictionary to aggregate stats by player
     player_dict = {}
@@ -134,9 +141,11 @@ def import_2025_week(week):
 
     all_players = {}
 
-    for game_id in game_ids:
+    # Game summaries are fetched concurrently; the client enforces the rate limit
+    game_players = get_espn_client().map(lambda game_id: get_player_stats_from_game(game_id, week), game_ids)
+
+    for game_id, players in zip(game_ids, game_players):
         print(f"  Processing game {game_id}...")
-        players = get_player_stats_from_game(game_id, week)
 
         for p in players:
             key = p['espn_id']
@@ -147,8 +156,6 @@ def import_2025_week(week):
             else:
                 all_players[key] = p
 
-        time.sleep(0.2)  # Rate limiting
-
     print(f"  Found {len(all_players)} unique players")
 
     # Import to database
@@ -285,6 +292,10 @@ def main():
         for week in range(1, 5):
             import_2025_week(week)
 
+        # Player teams may have changed, so rebuild every season's rollups
+        NFLDataService.refresh_stat_rollups()
+        DataVersion.bump()
+
     print("\n" + "=" * 60)
     print("2025 DATA IMPORT COMPLETE!")
     print("=" * 60)
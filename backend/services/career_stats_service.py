@@ -0,0 +1,134 @@
+"""
+Career statistics for a player from a single query
+
+A player's weekly games are loaded once as a stat matrix (one row per game,
+ordered by season) and every per-season and career total, average and standard
+deviation is computed from it with vectorized reductions, so a long career
+costs one query and a handful of array operations instead of ORM objects and
+per-stat Python lists.
+"""
+
+import numpy as np
+
+from models import db
+from models.player import PlayerStats
+
+
+class CareerStatsService:
+    """Per-season and career aggregates of a player's weekly stats"""
+
+    # PlayerStats columns summed into season totals
+    TOTAL_COLUMNS = [
+        'receptions', 'receiving_yards', 'receiving_touchdowns', 'rushes',
+        'rushing_yards', 'rushing_touchdowns', 'targets', 'passing_attempts',
+        'passing_completions', 'passing_yards', 'passing_touchdowns', 'interceptions'
+    ]
+
+    # Stats reported with a per-game average and standard deviation
+    # (total_touchdowns is rushing + receiving touchdowns)
+    PER_GAME_STATS = [
+        'rushing_yards', 'receiving_yards', 'passing_yards', 'rushing_touchdowns',
+        'receiving_touchdowns', 'passing_touchdowns', 'interceptions', 'total_touchdowns'
+    ]
+
+    # Per-game averages reported for each season
+    SEASON_AVERAGE_STATS = ['receiving_yards', 'rushing_yards', 'passing_yards', 'total_touchdowns']
+
+    @staticmethod
+    def load_matrix(player_id):
+        """
+        Load a player's weekly games as arrays
+
+        Args:
+            player_id: Player database ID
+
+        Returns:
+            Tuple (seasons, matrix) where seasons has one entry per game (newest
+            season first) and matrix has one column per TOTAL_COLUMNS entry
+            plus total_touchdowns, with NULL stats as 0
+        """
+        rows = db.session.query(
+            PlayerStats.season,
+            *[getattr(PlayerStats, column) for column in CareerStatsService.TOTAL_COLUMNS]
+        ).filter(
+            PlayerStats.player_id == player_id,
+            PlayerStats.week.isnot(None)  # Exclude season totals
+        ).order_by(PlayerStats.season.desc()).all()
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(CareerStatsService.TOTAL_COLUMNS) + 1))
+
+        # None becomes NaN in a float array
+        data = np.nan_to_num(np.array(rows, dtype=float))
+        seasons = data[:, 0].astype(np.int64)
+        stats = data[:, 1:]
+
+        columns = CareerStatsService.TOTAL_COLUMNS
+        total_tds = stats[:, columns.index('rushing_touchdowns')] + stats[:, columns.index('receiving_touchdowns')]
+
+        return seasons, np.column_stack([stats, total_tds])
+
+    @staticmethod
+    def compute(player_id):
+        """
+        Compute per-season and career statistics for a player
+
+        Args:
+            player_id: Player database ID
+
+        Returns:
+            Tuple (seasons_data, career_stats) in the /api/players/<id>/career format
+        """
+        seasons, matrix = CareerStatsService.load_matrix(player_id)
+        column_names = CareerStatsService.TOTAL_COLUMNS + ['total_touchdowns']
+        index = {name: position for position, name in enumerate(column_names)}
+        total_games = len(seasons)
+
+        seasons_data = []
+        if total_games:
+            # Games are grouped by season, so each season is a contiguous block
+            starts = np.concatenate([[0], np.flatnonzero(np.diff(seasons)) + 1])
+            games = np.diff(np.append(starts, total_games))
+
+            sums = np.add.reduceat(matrix, starts, axis=0)
+            means = sums / games[:, None]
+            stds = np.sqrt(np.maximum(np.add.reduceat(matrix ** 2, starts, axis=0) / games[:, None] - means ** 2, 0))
+
+            season_totals = sums.astype(np.int64).tolist()
+            season_means = np.round(means, 2).tolist()
+            season_stds = np.round(stds, 2).tolist()
+
+            for row, start in enumerate(starts):
+                seasons_data.append({
+                    'season': int(seasons[start]),
+                    'games_played': int(games[row]),
+                    'totals': {
+                        column: season_totals[row][index[column]]
+                        for column in CareerStatsService.TOTAL_COLUMNS
+                    },
+                    'averages': {
+                        f'{stat}_per_game': season_means[row][index[stat]]
+                        for stat in CareerStatsService.SEASON_AVERAGE_STATS
+                    },
+                    'standard_deviations': {
+                        stat: season_stds[row][index[stat]] if games[row] > 1 else 0
+                        for stat in CareerStatsService.PER_GAME_STATS
+                    }
+                })
+
+        career_means = np.round(matrix.mean(axis=0), 2).tolist() if total_games else None
+        career_stds = np.round(matrix.std(axis=0), 2).tolist() if total_games > 1 else None
+
+        career_stats = {
+            'total_games': total_games,
+            'averages': {
+                f'{stat}_per_game': career_means[index[stat]] if career_means else 0
+                for stat in CareerStatsService.PER_GAME_STATS
+            },
+            'standard_deviations': {
+                stat: career_stds[index[stat]] if career_stds else 0
+                for stat in CareerStatsService.PER_GAME_STATS
+            }
+        }
+
+        return seasons_data, career_stats
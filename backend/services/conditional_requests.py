@@ -0,0 +1,63 @@
+"""
+HTTP validators for read endpoints driven by the data version
+
+Everything served under /api/players, /api/predictions and /api/export is a
+function of the synced data, which only changes when a sync, seed or defense
+import bumps the data version. GET responses there carry an ETag built from
+that version and Config.API_VERSION (so a deploy that changes the response
+schema invalidates cached bodies too), so a client (or a CDN in front of the API) that sends it back in
+If-None-Match gets a 304 Not Modified before the view runs: no database query
+and no prediction.
+
+The version is read through DataVersion.cached(), so answering a revalidation
+costs at most one query every DATA_VERSION_CHECK_SECONDS per process.
+"""
+
+from flask import g, request
+
+from config import Config
+from models.data_version import DataVersion
+
+
+class ConditionalRequests:
+    """ETag / Cache-Control / 304 handling for data-backed GET endpoints"""
+
+    # URL prefixes whose responses depend only on the synced data
+    PREFIXES = ('/api/players', '/api/predictions', '/api/export')
+
+    @staticmethod
+    def init_app(app):
+        """Answer matching revalidations early and tag successful responses"""
+        app.before_request(ConditionalRequests._check_request)
+        app.after_request(ConditionalRequests._tag_response)
+
+    @staticmethod
+    def etag(version):
+        """ETag for a data version (weak: equal data, not byte-identical bodies)"""
+        return f'data-v{version}-{Config.API_VERSION}'
+
+    @staticmethod
+    def _applies():
+        return request.method in ('GET', 'HEAD') and request.path.startswith(ConditionalRequests.PREFIXES)
+
+    @staticmethod
+    def _check_request():
+        if not ConditionalRequests._applies():
+            return None
+
+        g.data_version = DataVersion.cached(Config.DATA_VERSION_CHECK_SECONDS)
+        if request.if_none_match.contains_weak(ConditionalRequests.etag(g.data_version)):
+            # Headers are added by _tag_response, which also runs for this response
+            return '', 304
+
+        return None
+
+    @staticmethod
+    def _tag_response(response):
+        version = g.pop('data_version', None)
+        if version is None or response.status_code not in (200, 304):
+            return response
+
+        response.set_etag(ConditionalRequests.etag(version), weak=True)
+        response.headers['Cache-Control'] = f'public, max-age={Config.HTTP_CACHE_MAX_AGE}, must-revalidate'
+        return response
@@ -2,11 +2,12 @@
 ESPN API scraper for 2025 NFL season player statistics
 Supplements nfl-data-py which doesn't have 2025 data yet
 """
-import requests
-import time
 from datetime import datetime
 from models import db
 from models.player import Player, PlayerStats
+from services.prediction_service import PredictionService
+from services.nfl_data_service import NFLDataService
+from services.espn_client import get_espn_client
 
 class ESPN2025Scraper:
     """Scraper for 2025 NFL player stats from ESPN API"""
@@ -32,47 +33,19 @@ class ESPN2025Scraper:
         url = f"{ESPN2025Scraper.BASE_URL}/seasons/{ESPN2025Scraper.SEASON}/types/{ESPN2025Scraper.SEASON_TYPE}/weeks/{week}/athletes"
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            client = get_espn_client()
+            data = client.get_json(url, timeout=30)
 
             if 'items' not in data:
                 print(f"  No player data found for week {week}")
                 return []
 
-            players_data = []
-
-            for item in data['items']:
-                try:
-                    # Get athlete details
-                    athlete_url = item.get('$ref')
-                    if not athlete_url:
-                        continue
-
-                    athlete_response = requests.get(athlete_url, timeout=10)
-                    athlete_response.raise_for_status()
-                    athlete = athlete_response.json()
-
-                    # Get stats if available
-                    if 'statistics' in athlete:
-                        stats_url = athlete['statistics'].get('$ref')
-                        if stats_url:
-                            stats_response = requests.get(stats_url, timeout=10)
-                            stats_response.raise_for_status()
-                            stats_data = stats_response.json()
-
-                            player_info = ESPN2025Scraper.parse_player_stats(
-                                athlete, stats_data, week
-                            )
-                            if player_info:
-                                players_data.append(player_info)
-
-                    # Rate limiting
-                    time.sleep(0.1)
-
-                except Exception as e:
-                    print(f"  Error processing athlete: {e}")
-                    continue
+            # Athletes are fetched concurrently; the client enforces the rate limit
+            results = client.map(
+                lambda item: ESPN2025Scraper.fetch_athlete_stats(item, week),
+                data['items']
+            )
+            players_data = [player_info for player_info in results if player_info]
 
             print(f"  Processed {len(players_data)} players for week {week}")
             return players_data
@@ -81,6 +54,39 @@ class ESPN2025Scraper:
             print(f"  Error fetching week {week}: {e}")
             return []
 
+    @staticmethod
+    def fetch_athlete_stats(item, week):
+        """
+        Fetch one athlete and their statistics for a week
+
+        Args:
+            item: Athlete reference from the week's athlete list
+            week: Week number
+
+        Returns:
+            Parsed player dictionary, or None if unavailable
+        """
+        try:
+            # Get athlete details
+            athlete_url = item.get('$ref')
+            if not athlete_url:
+                return None
+
+            client = get_espn_client()
+            athlete = client.get_json(athlete_url, timeout=10)
+
+            # Get stats if available
+            stats_url = athlete.get('statistics', {}).get('$ref')
+            if not stats_url:
+                return None
+
+            stats_data = client.get_json(stats_url, timeout=10)
+            return ESPN2025Scraper.parse_player_stats(athlete, stats_data, week)
+
+        except Exception as e:
+            print(f"  Error processing athlete: {e}")
+            return None
+
     @staticmethod
     def parse_player_stats(athlete, stats_data, week):
         """
@@ -170,6 +176,7 @@ class ESPN2025Scraper:
 
         total_players = 0
         total_stats = 0
+        teams_changed = False
 
         for week in range(start_week, end_week + 1):
             players_data = ESPN2025Scraper.get_player_stats_for_week(week)
@@ -193,6 +200,8 @@ class ESPN2025Scraper:
                         total_players += 1
                     else:
                         # Update team if changed
+                        if player.team != player_data['team']:
+                            teams_changed = True
                         player.team = player_data['team']
 
                     # Check if stats already exist
@@ -252,6 +261,13 @@ class ESPN2025Scraper:
         # Final commit
         db.session.commit()
 
+        # Team-week totals follow current rosters, so a team change touches every season
+        NFLDataService.refresh_team_offense_weekly(None if teams_changed else [ESPN2025Scraper.SEASON])
+        NFLDataService.refresh_player_season_totals([ESPN2025Scraper.SEASON])
+
+        # Cached team context is stale once new stats are in
+        PredictionService.invalidate_cache()
+
         print("\n" + "=" * 60)
         print(f"Import complete!")
         print(f"  New players added: {total_players}")
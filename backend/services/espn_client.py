@@ -0,0 +1,213 @@
+"""
+Shared HTTP client for ESPN APIs
+
+All ESPN requests go through one client so they share:
+- A pooled requests.Session (keep-alive connections instead of one per call)
+- A token-bucket rate limiter across every thread
+- Retries with exponential backoff on connection errors, 429 and 5xx
+- Bounded concurrency for fan-out work (athletes, game summaries)
+- A persistent response cache with ETag/Last-Modified revalidation, where
+  scoreboards and boxscores of final games are pinned and never refetched
+
+Setting ESPN_STUB_URL sends every ESPN request (including $ref links returned
+by the API) to a local HTTP stub instead, keeping the path and query string.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+from services.http_cache import ResponseCache
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second with bursts of `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class ESPNClient:
+    """Rate-limited, retrying, pooled HTTP client for ESPN"""
+
+    def __init__(self, max_workers=None, rate_limit=None, max_retries=None, stub_url=None, cache_path=None):
+        self.max_workers = max_workers or Config.ESPN_MAX_WORKERS
+        self.stub_url = stub_url if stub_url is not None else Config.ESPN_STUB_URL
+
+        cache_path = cache_path if cache_path is not None else Config.ESPN_CACHE_PATH
+        self.cache = ResponseCache(cache_path) if cache_path else None
+
+        rate_limit = rate_limit or Config.ESPN_RATE_LIMIT
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit > 0 else None
+
+        retries = Retry(
+            total=max_retries if max_retries is not None else Config.ESPN_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_workers,
+            max_retries=retries
+        )
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _resolve(self, url):
+        """Point a URL at the stub server when one is configured"""
+        if not self.stub_url:
+            return url
+
+        stub = urlsplit(self.stub_url)
+        parts = urlsplit(url)
+        return urlunsplit((stub.scheme, stub.netloc, stub.path.rstrip('/') + parts.path, parts.query, ''))
+
+    def _cache_key(self, url, params=None):
+        """Full request URL (query string included) used as the cache key"""
+        return requests.Request('GET', self._resolve(url), params=params).prepare().url
+
+    def get(self, url, params=None, timeout=10):
+        """
+        Rate-limited GET request, served or revalidated from the response cache
+
+        Returns:
+            requests.Response (status codes are left to the caller)
+        """
+        key = self._cache_key(url, params)
+        cached = self.cache.get(key) if self.cache else None
+
+        if cached and cached['pinned']:
+            return self._cached_response(key, cached)
+
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        response = self.session.get(key, headers=headers, timeout=timeout)
+
+        if cached and response.status_code == 304:
+            self.cache.touch(key)
+            return self._cached_response(key, cached)
+
+        if self.cache and response.status_code == 200:
+            self.cache.store(
+                key,
+                response.content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+
+        return response
+
+    def get_json(self, url, params=None, timeout=10):
+        """
+        Rate-limited GET request that raises on HTTP errors
+
+        Returns:
+            Parsed JSON body
+        """
+        response = self.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def pin(self, url, params=None):
+        """Stop revalidating a cached response that can no longer change (e.g. a final game)"""
+        if self.cache:
+            self.cache.pin(self._cache_key(url, params))
+
+    @staticmethod
+    def _cached_response(url, cached):
+        """Build a 200 response from a cache entry"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers['Content-Type'] = 'application/json'
+        response._content = cached['body']
+        return response
+
+    def map(self, fn, items):
+        """
+        Apply fn to every item with at most max_workers running at once
+
+        Returns:
+            List of results in the same order as items
+        """
+        items = list(items)
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(fn, items))
+
+
+# Shared client; replace with set_espn_client() to point at a stub in tests
+_espn_client = None
+_client_lock = threading.Lock()
+
+
+def get_espn_client():
+    """Get the shared ESPN client, creating it on first use"""
+    global _espn_client
+
+    if _espn_client is None:
+        with _client_lock:
+            if _espn_client is None:
+                _espn_client = ESPNClient()
+
+    return _espn_client
+
+
+def set_espn_client(client):
+    """Replace the shared ESPN client (e.g. with one pointed at a stub server)"""
+    global _espn_client
+    _espn_client = client
+
+
+def scoreboard_is_final(data):
+    """Whether every game on an ESPN scoreboard response has finished"""
+    events = data.get('events', [])
+    return bool(events) and all(
+        event.get('status', {}).get('type', {}).get('completed', False) for event in events
+    )
+
+
+def summary_is_final(data):
+    """Whether the game in an ESPN summary (boxscore) response has finished"""
+    competitions = data.get('header', {}).get('competitions', [])
+    return bool(competitions) and competitions[0].get('status', {}).get('type', {}).get('completed', False)
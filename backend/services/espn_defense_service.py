@@ -2,9 +2,9 @@
 ESPN Defensive Statistics Service
 Fetches 2025 NFL defensive statistics from ESPN API
 """
-import requests
 import pandas as pd
 from datetime import datetime
+from services.espn_client import get_espn_client, scoreboard_is_final, summary_is_final
 
 
 class ESPNDefenseService:
@@ -36,15 +36,21 @@ class ESPNDefenseService:
 
         params = {
             'seasontype': 2,  # Regular season
-            'week': week
+            'week': week,
+            'dates': season
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            client = get_espn_client()
+            response = client.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
 
+                # A week where every game is final never changes again
+                if scoreboard_is_final(data):
+                    client.pin(url, params)
+
                 games = []
                 if 'events' in data:
                     for event in data['events']:
@@ -98,11 +104,16 @@ class ESPNDefenseService:
         params = {'event': game_id}
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            client = get_espn_client()
+            response = client.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
 
+                # Boxscores of final games never change again
+                if summary_is_final(data):
+                    client.pin(url, params)
+
                 team_stats = {}
 
                 if 'boxscore' in data and 'teams' in data['boxscore']:
@@ -163,12 +174,13 @@ class ESPNDefenseService:
             print(f"Fetching week {week}...")
             games = ESPNDefenseService.fetch_week_scores(season=season, week=week)
 
-            for game in games:
-                game_id = game.get('game_id')
-
-                # Fetch boxscore for yards data
-                boxscore_stats = ESPNDefenseService.fetch_game_boxscore(game_id) if game_id else {}
+            # Fetch boxscores for yards data concurrently
+            boxscores = get_espn_client().map(
+                lambda game: ESPNDefenseService.fetch_game_boxscore(game['game_id']) if game.get('game_id') else {},
+                games
+            )
 
+            for game, boxscore_stats in zip(games, boxscores):
                 # Get offensive stats for each team (which = yards ALLOWED by opponent's defense)
                 home_offensive = boxscore_stats.get(game['home_team'], {})
                 away_offensive = boxscore_stats.get(game['away_team'], {})
@@ -0,0 +1,153 @@
+"""
+Streaming bulk exports of weekly player stats
+
+Rows are read with yield_per (a server-side cursor on PostgreSQL) and encoded
+one chunk at a time, so a response body is produced incrementally and memory
+stays at one chunk no matter how many seasons are exported. Formats:
+- ndjson: one JSON object per line
+- csv: header row, then one row per game
+- parquet: zstd-compressed, one row group per chunk
+"""
+
+import csv
+import io
+import json
+
+import pyarrow.parquet as pq
+from sqlalchemy import select
+
+from models.player import Player, PlayerStats
+from services.seed_service import SeedService
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands over what has been written since the last drain"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer.extend(data)
+        return len(data)
+
+    def drain(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class ExportService:
+    """Stream player stats as NDJSON, CSV or Parquet"""
+
+    FORMATS = {
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+        'parquet': 'application/vnd.apache.parquet'
+    }
+
+    # Rows read from the database and encoded per chunk
+    CHUNK_SIZE = 5000
+
+    # PlayerStats columns exported for each game (player_id is the players.id used by the API)
+    STAT_COLUMNS = [
+        'player_id', 'season', 'week', 'receptions', 'receiving_yards', 'receiving_touchdowns',
+        'targets', 'rushes', 'rushing_yards', 'rushing_touchdowns', 'passing_attempts',
+        'passing_completions', 'passing_yards', 'passing_touchdowns', 'interceptions',
+        'opponent', 'home_away'
+    ]
+
+    @staticmethod
+    def player_stats_query(season_from=None, season_to=None, position=None, team=None):
+        """
+        Query weekly player stats with player details, in insertion (primary key) order
+        so the database can stream rows without sorting the result first
+
+        Args:
+            season_from: First season to include (optional)
+            season_to: Last season to include (optional)
+            position: Player position filter (optional)
+            team: Player team abbreviation filter (optional)
+
+        Returns:
+            SQLAlchemy select
+        """
+        query = select(
+            *[getattr(PlayerStats, column) for column in ExportService.STAT_COLUMNS[:3]],
+            Player.name.label('player_name'),
+            Player.position,
+            Player.team,
+            *[getattr(PlayerStats, column) for column in ExportService.STAT_COLUMNS[3:]]
+        ).join(
+            Player, Player.id == PlayerStats.player_id
+        ).where(
+            PlayerStats.week.isnot(None)  # Exclude season totals
+        )
+
+        if season_from is not None:
+            query = query.where(PlayerStats.season >= season_from)
+        if season_to is not None:
+            query = query.where(PlayerStats.season <= season_to)
+        if position:
+            query = query.where(Player.position == position)
+        if team:
+            query = query.where(Player.team == team)
+
+        return query.order_by(PlayerStats.id)
+
+    @staticmethod
+    def stream(query, export_format):
+        """
+        Encode a query's rows chunk by chunk
+
+        Args:
+            query: Select to export
+            export_format: One of FORMATS
+
+        Returns:
+            Generator of bytes
+        """
+        if export_format == 'ndjson':
+            return ExportService._stream_ndjson(query)
+        if export_format == 'csv':
+            return ExportService._stream_csv(query)
+        if export_format == 'parquet':
+            return ExportService._stream_parquet(query)
+        raise ValueError(f"Unknown export format: {export_format}")
+
+    @staticmethod
+    def _stream_ndjson(query):
+        columns = [column.name for column in query.selected_columns]
+        for chunk in SeedService.iter_chunks(query, ExportService.CHUNK_SIZE):
+            yield ''.join(json.dumps(dict(zip(columns, row))) + '\n' for row in chunk).encode('utf-8')
+
+    @staticmethod
+    def _stream_csv(query):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.name for column in query.selected_columns])
+
+        for chunk in SeedService.iter_chunks(query, ExportService.CHUNK_SIZE):
+            writer.writerows(chunk)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Header only when nothing matched
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    @staticmethod
+    def _stream_parquet(query):
+        schema, dtypes = SeedService.arrow_schema(query)
+        sink = _ChunkSink()
+
+        with pq.ParquetWriter(sink, schema, compression='zstd') as writer:
+            for chunk in SeedService.iter_chunks(query, ExportService.CHUNK_SIZE):
+                writer.write_table(SeedService.chunk_table(chunk, schema, dtypes))
+                yield sink.drain()
+
+        # The footer (the whole file when nothing matched) is written on close
+        yield sink.drain()
@@ -0,0 +1,91 @@
+"""
+Persistent HTTP response cache with conditional revalidation
+
+Responses are stored in a standalone SQLite file keyed by the full request URL
+(query string included), together with their ETag and Last-Modified headers.
+A cached entry is revalidated with If-None-Match / If-Modified-Since, so an
+unchanged resource costs a 304 instead of a full download. Entries for
+resources that can never change again (e.g. boxscores of final games) are
+pinned and served without any request at all.
+"""
+
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+
+
+class ResponseCache:
+    """SQLite-backed store of response bodies and validators"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' url TEXT PRIMARY KEY,'
+            ' body BLOB NOT NULL,'
+            ' etag TEXT,'
+            ' last_modified TEXT,'
+            ' pinned INTEGER NOT NULL DEFAULT 0,'
+            ' fetched_at TEXT NOT NULL'
+            ')'
+        )
+        self._connection.commit()
+
+    def get(self, url):
+        """
+        Look up a cached response
+
+        Returns:
+            Dictionary with body, etag, last_modified and pinned, or None
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, pinned FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'body': zlib.decompress(row[0]),
+            'etag': row[1],
+            'last_modified': row[2],
+            'pinned': bool(row[3])
+        }
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Store (or replace) a response body and its validators"""
+        with self._lock:
+            self._connection.execute(
+                'INSERT INTO responses (url, body, etag, last_modified, pinned, fetched_at) '
+                'VALUES (?, ?, ?, ?, 0, ?) '
+                'ON CONFLICT (url) DO UPDATE SET body = excluded.body, etag = excluded.etag, '
+                'last_modified = excluded.last_modified, fetched_at = excluded.fetched_at',
+                (url, zlib.compress(body), etag, last_modified, datetime.utcnow().isoformat())
+            )
+            self._connection.commit()
+
+    def touch(self, url):
+        """Record a successful revalidation (304) of a cached response"""
+        with self._lock:
+            self._connection.execute(
+                'UPDATE responses SET fetched_at = ? WHERE url = ?',
+                (datetime.utcnow().isoformat(), url)
+            )
+            self._connection.commit()
+
+    def pin(self, url):
+        """Serve a cached response from now on without revalidating it"""
+        with self._lock:
+            self._connection.execute('UPDATE responses SET pinned = 1 WHERE url = ?', (url,))
+            self._connection.commit()
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            self._connection.execute('DELETE FROM responses')
+            self._connection.commit()
@@ -0,0 +1,143 @@
+"""
+On-disk cache for nfl_data_py downloads
+
+Each dataset (weekly stats, schedules, play-by-play) is stored as one
+column-pruned Parquet file per season:
+
+    <NFL_DATA_CACHE_DIR>/<dataset>/season=<year>.parquet
+    <NFL_DATA_CACHE_DIR>/manifest.json
+
+The manifest records the columns, row count and fetch time of every partition.
+Completed seasons never change, so they are read from disk (memory-mapped)
+instead of being downloaded again; the in-progress season is refetched on
+every sync and falls back to its cached copy if the download fails. A season
+last cached while in progress is refetched once after it ends, which picks up
+its final weeks and stat corrections and marks it complete.
+
+When NFL_DATA_FIXTURE_DIR is set, datasets are read from that directory (same
+layout) and the network is never used, for tests and offline runs.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from config import Config
+
+
+class NFLDataCache:
+    """Season-partitioned Parquet cache for nfl_data_py datasets"""
+
+    MANIFEST_FILE = 'manifest.json'
+
+    # Serializes manifest updates within the process
+    _manifest_lock = threading.Lock()
+
+    @staticmethod
+    def load(dataset, season, fetch, columns=None, refresh=False):
+        """
+        Load one season of a dataset, from the cache when possible
+
+        Args:
+            dataset: Dataset name (e.g. 'weekly', 'schedules', 'pbp')
+            season: Season year
+            fetch: Callable returning the season's DataFrame from nfl_data_py
+            columns: Columns to keep (default: all columns)
+            refresh: Refetch even when cached (used for the in-progress season)
+
+        Returns:
+            DataFrame for the season
+        """
+        if Config.NFL_DATA_FIXTURE_DIR:
+            path = NFLDataCache._partition_path(Config.NFL_DATA_FIXTURE_DIR, dataset, season)
+            return NFLDataCache._read(path, columns)
+
+        cache_dir = Config.NFL_DATA_CACHE_DIR
+        if not cache_dir:
+            return NFLDataCache._prune(fetch(), columns)
+
+        path = NFLDataCache._partition_path(cache_dir, dataset, season)
+        entry = NFLDataCache._read_manifest(cache_dir).get(dataset, {}).get(str(season))
+        cached = entry is not None and os.path.exists(path) and NFLDataCache._covers(entry, columns)
+
+        # Partitions written while their season was in progress are never final
+        if cached and not refresh and entry.get('complete') is not False:
+            print(f"Loaded {dataset} {season} from cache")
+            return NFLDataCache._read(path, columns)
+
+        try:
+            data = NFLDataCache._prune(fetch(), columns)
+        except Exception as e:
+            if not cached:
+                raise
+            print(f"Refetching {dataset} {season} failed ({e}), using cached copy")
+            return NFLDataCache._read(path, columns)
+
+        NFLDataCache._write(cache_dir, dataset, season, data, columns, complete=not refresh)
+        return data
+
+    @staticmethod
+    def _partition_path(base_dir, dataset, season):
+        """Path of a dataset's Parquet file for one season"""
+        return os.path.join(base_dir, dataset, f'season={season}.parquet')
+
+    @staticmethod
+    def _prune(data, columns):
+        """Keep only the requested columns that exist in the data"""
+        if columns is None:
+            return data
+        return data[[column for column in columns if column in data.columns]]
+
+    @staticmethod
+    def _covers(entry, columns):
+        """Whether a cached partition holds every requested column"""
+        if entry.get('columns') is None:
+            return True
+        return columns is not None and set(columns) <= set(entry['columns'])
+
+    @staticmethod
+    def _read(path, columns):
+        """Read a partition, memory-mapping the file"""
+        available = None
+        if columns is not None:
+            available = [column for column in columns if column in pq.read_schema(path).names]
+        return pd.read_parquet(path, columns=available, engine='pyarrow', memory_map=True)
+
+    @staticmethod
+    def _write(cache_dir, dataset, season, data, columns, complete):
+        """Write a partition atomically and record it in the manifest"""
+        path = NFLDataCache._partition_path(cache_dir, dataset, season)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        temp_path = f'{path}.tmp'
+        data.to_parquet(temp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(temp_path, path)
+
+        with NFLDataCache._manifest_lock:
+            manifest = NFLDataCache._read_manifest(cache_dir)
+            manifest.setdefault(dataset, {})[str(season)] = {
+                'columns': columns,
+                'rows': len(data),
+                'complete': complete,
+                'fetched_at': datetime.utcnow().isoformat()
+            }
+
+            manifest_path = os.path.join(cache_dir, NFLDataCache.MANIFEST_FILE)
+            with open(f'{manifest_path}.tmp', 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(f'{manifest_path}.tmp', manifest_path)
+
+        print(f"Cached {dataset} {season} ({len(data)} rows)")
+
+    @staticmethod
+    def _read_manifest(cache_dir):
+        """Read the manifest (empty if the cache has not been written yet)"""
+        manifest_path = os.path.join(cache_dir, NFLDataCache.MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return {}
+        with open(manifest_path) as f:
+            return json.load(f)
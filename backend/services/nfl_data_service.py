@@ -1,13 +1,58 @@
 import nfl_data_py as nfl
 import pandas as pd
 from datetime import datetime
+from sqlalchemy import func, insert, select, text, tuple_
 from models import db
-from models.player import Player, PlayerStats
-from models.team import Team, TeamStats
+from models.player import Player, PlayerStats, PlayerSeasonTotals
+from models.team import Team, TeamStats, TeamOffenseWeekly
+from models.sync_state import SyncState
+from services.prediction_service import PredictionService
+from services.nfl_data_cache import NFLDataCache
 
 class NFLDataService:
     """Service to fetch and process NFL data"""
 
+    # nfl_data_py weekly stat columns and the PlayerStats columns they load into
+    WEEKLY_STAT_COLUMNS = {
+        'receptions': 'receptions',
+        'receiving_yards': 'receiving_yards',
+        'receiving_tds': 'receiving_touchdowns',
+        'targets': 'targets',
+        'carries': 'rushes',
+        'rushing_yards': 'rushing_yards',
+        'rushing_tds': 'rushing_touchdowns',
+        'attempts': 'passing_attempts',
+        'completions': 'passing_completions',
+        'passing_yards': 'passing_yards',
+        'passing_tds': 'passing_touchdowns',
+        'interceptions': 'interceptions'
+    }
+
+    # Team defensive stat columns and the TeamStats columns they load into
+    TEAM_STAT_COLUMNS = {
+        'points_allowed': 'points_against',
+        'yards_allowed': 'yards_against',
+        'passing_yards_allowed': 'passing_yards_against',
+        'rushing_yards_allowed': 'rushing_yards_against'
+    }
+
+    # Weekly data columns used by the player imports
+    WEEKLY_COLUMNS = [
+        'player_id', 'player_name', 'position', 'recent_team', 'season', 'week', 'opponent_team'
+    ] + list(WEEKLY_STAT_COLUMNS)
+
+    # Schedule columns used for points allowed
+    SCHEDULE_COLUMNS = ['season', 'week', 'home_team', 'away_team', 'home_score', 'away_score']
+
+    # Play-by-play columns needed for yards allowed (the full PBP has ~370 columns)
+    PBP_COLUMNS = ['season', 'week', 'defteam', 'posteam', 'yards_gained', 'passing_yards', 'rushing_yards']
+
+    # Unique key of a team_stats row (used for upserts; NULL week/opponent count as one value)
+    TEAM_STATS_KEY = ['team_id', 'season', 'week', 'opponent']
+
+    # Rows per INSERT when bulk loading stats
+    STATS_INSERT_BATCH_SIZE = 5000
+
     @staticmethod
     def get_available_seasons(years=5):
         """Get list of seasons to fetch (last 5 years including current)"""
@@ -43,11 +88,19 @@ class NFLDataService:
         """
         all_stats = []
 
+        # Completed seasons are served from the on-disk cache
+        current_season = NFLDataService.get_available_seasons(1)[0]
+
         # Fetch each season individually to handle missing data gracefully
         for season in seasons:
             try:
                 print(f"Fetching player stats for season: {season}")
-                weekly_stats = nfl.import_weekly_data([season])
+                weekly_stats = NFLDataCache.load(
+                    'weekly', season,
+                    lambda: nfl.import_weekly_data([season]),
+                    columns=NFLDataService.WEEKLY_COLUMNS,
+                    refresh=season >= current_season
+                )
 
                 # Filter for relevant positions (QB, RB, WR, TE)
                 relevant_positions = ['QB', 'RB', 'WR', 'TE']
@@ -84,12 +137,30 @@ class NFLDataService:
         all_schedules = []
         all_pbp = []
 
+        # Completed seasons are served from the on-disk cache
+        current_season = NFLDataService.get_available_seasons(1)[0]
+
         # Fetch each season individually to handle missing data gracefully
         for season in seasons:
             try:
                 print(f"Fetching team stats for season: {season}")
-                schedules = nfl.import_schedules([season])
-                pbp = nfl.import_pbp_data([season], downcast=True)
+                schedules = NFLDataCache.load(
+                    'schedules', season,
+                    lambda: nfl.import_schedules([season]),
+                    columns=NFLDataService.SCHEDULE_COLUMNS,
+                    refresh=season >= current_season
+                )
+                pbp = NFLDataCache.load(
+                    'pbp', season,
+                    lambda: nfl.import_pbp_data(
+                        [season],
+                        columns=NFLDataService.PBP_COLUMNS,
+                        include_participation=False,
+                        downcast=True
+                    ),
+                    columns=NFLDataService.PBP_COLUMNS,
+                    refresh=season >= current_season
+                )
 
                 all_schedules.append(schedules)
                 all_pbp.append(pbp)
@@ -106,53 +177,39 @@ class NFLDataService:
         schedules = pd.concat(all_schedules, ignore_index=True)
         pbp = pd.concat(all_pbp, ignore_index=True) if all_pbp else pd.DataFrame()
 
-        all_team_stats = []
-
-        # Get all unique teams
-        teams = pd.concat([schedules['home_team'], schedules['away_team']]).unique()
-
-        for team in teams:
-            # Calculate points allowed from schedules
-            # When team is home, they allowed away_score
-            home_games = schedules[schedules['home_team'] == team][
-                ['season', 'week', 'away_team', 'away_score']
-            ].rename(columns={'away_team': 'opponent', 'away_score': 'points_allowed'})
-
-            # When team is away, they allowed home_score
-            away_games = schedules[schedules['away_team'] == team][
-                ['season', 'week', 'home_team', 'home_score']
-            ].rename(columns={'home_team': 'opponent', 'home_score': 'points_allowed'})
-
-            points_allowed = pd.concat([home_games, away_games])
-            points_allowed['team'] = team
-
-            # Calculate yards allowed from PBP (when team is on defense)
-            if not pbp.empty:
-                yards_allowed = pbp[pbp['defteam'] == team].groupby(['season', 'week', 'posteam']).agg({
-                    'yards_gained': 'sum',
-                    'passing_yards': 'sum',
-                    'rushing_yards': 'sum'
-                }).reset_index()
-
-                yards_allowed.columns = ['season', 'week', 'opponent', 'yards_allowed',
-                                        'passing_yards_allowed', 'rushing_yards_allowed']
-                yards_allowed['team'] = team
-
-                # Merge points and yards
-                team_stats = pd.merge(
-                    points_allowed,
-                    yards_allowed,
-                    on=['season', 'week', 'opponent', 'team'],
-                    how='outer'
-                )
-            else:
-                # No PBP data available, use points only
-                team_stats = points_allowed
-
-            all_team_stats.append(team_stats)
-
-        # Combine all teams
-        combined_stats = pd.concat(all_team_stats, ignore_index=True)
+        # Points allowed from schedules, one row per team-game
+        # The home team allowed away_score and the away team allowed home_score
+        home_games = schedules[['season', 'week', 'home_team', 'away_team', 'away_score']].rename(
+            columns={'home_team': 'team', 'away_team': 'opponent', 'away_score': 'points_allowed'}
+        )
+        away_games = schedules[['season', 'week', 'away_team', 'home_team', 'home_score']].rename(
+            columns={'away_team': 'team', 'home_team': 'opponent', 'home_score': 'points_allowed'}
+        )
+        points_allowed = pd.concat([home_games, away_games], ignore_index=True)
+        teams = points_allowed['team'].unique()
+
+        if not pbp.empty:
+            # Yards allowed for every defense in one pass over the play-by-play
+            yards_allowed = pbp.groupby(['defteam', 'season', 'week', 'posteam'], observed=True).agg({
+                'yards_gained': 'sum',
+                'passing_yards': 'sum',
+                'rushing_yards': 'sum'
+            }).reset_index()
+
+            yards_allowed.columns = ['team', 'season', 'week', 'opponent', 'yards_allowed',
+                                     'passing_yards_allowed', 'rushing_yards_allowed']
+            yards_allowed = yards_allowed[yards_allowed['team'].isin(teams)]
+
+            # Merge points and yards
+            combined_stats = pd.merge(
+                points_allowed,
+                yards_allowed,
+                on=['season', 'week', 'opponent', 'team'],
+                how='outer'
+            )
+        else:
+            # No PBP data available, use points only
+            combined_stats = points_allowed
 
         print(f"Fetched defensive stats for {len(teams)} teams, {len(combined_stats)} total records")
         return combined_stats
@@ -199,77 +256,232 @@ class NFLDataService:
             raise
 
     @staticmethod
-    def import_player_stats_to_db(weekly_stats_df):
+    def import_player_stats_to_db(weekly_stats_df, replace=False):
         """
         Import player statistics from DataFrame to database
+        Rows are mapped, de-duplicated against existing stats and inserted in bulk
+        without per-row Python work
 
         Args:
             weekly_stats_df: DataFrame containing weekly player stats
+            replace: Replace the nflverse stats stored for the (season, week) games in
+                     the DataFrame (used to apply stat corrections, including rows the
+                     correction removed) instead of skipping existing ones; stats of
+                     ESPN-scraped players (ESPN_ ids) are kept
         """
         try:
-            # Create player_id to database id mapping
-            player_id_map = {p.player_id: p.id for p in Player.query.with_entities(Player.player_id, Player.id).all()}
-
-            # Get existing stats for quick lookup
-            existing_stats_keys = {
-                (s.player_id, s.season, s.week)
-                for s in PlayerStats.query.with_entities(PlayerStats.player_id, PlayerStats.season, PlayerStats.week).all()
-            }
+            print(f"Processing {len(weekly_stats_df)} stat records...")
 
-            new_stats = []
-            imported_count = 0
+            # Map to database player ids, dropping players that were not imported
+            player_id_map = pd.Series(
+                dict(Player.query.with_entities(Player.player_id, Player.id).all()),
+                dtype='float64'
+            )
+            stats_df = pd.DataFrame({
+                'player_id': weekly_stats_df['player_id'].map(player_id_map),
+                'season': pd.to_numeric(weekly_stats_df['season'], errors='coerce'),
+                'week': pd.to_numeric(weekly_stats_df['week'], errors='coerce')
+            })
+
+            for source, column in NFLDataService.WEEKLY_STAT_COLUMNS.items():
+                if source in weekly_stats_df:
+                    stats_df[column] = pd.to_numeric(
+                        weekly_stats_df[source], errors='coerce'
+                    ).fillna(0).round().astype('int64')
+                else:
+                    stats_df[column] = 0
 
-            print(f"Processing {len(weekly_stats_df)} stat records...")
-            for idx, row in weekly_stats_df.iterrows():
-                # Map to database player id
-                db_player_id = player_id_map.get(row['player_id'])
-
-                if not db_player_id:
-                    continue
-
-                # Skip if already exists
-                if (db_player_id, row['season'], row['week']) in existing_stats_keys:
-                    continue
-
-                new_stats.append(PlayerStats(
-                    player_id=db_player_id,
-                    season=row['season'],
-                    week=row['week'],
-                    receptions=row.get('receptions', 0) or 0,
-                    receiving_yards=row.get('receiving_yards', 0) or 0,
-                    receiving_touchdowns=row.get('receiving_tds', 0) or 0,
-                    targets=row.get('targets', 0) or 0,
-                    rushes=row.get('carries', 0) or 0,
-                    rushing_yards=row.get('rushing_yards', 0) or 0,
-                    rushing_touchdowns=row.get('rushing_tds', 0) or 0,
-                    passing_attempts=row.get('attempts', 0) or 0,
-                    passing_completions=row.get('completions', 0) or 0,
-                    passing_yards=row.get('passing_yards', 0) or 0,
-                    passing_touchdowns=row.get('passing_tds', 0) or 0,
-                    interceptions=row.get('interceptions', 0) or 0,
-                    opponent=row.get('opponent_team', None)
-                ))
-                imported_count += 1
-
-                # Bulk insert in batches of 1000
-                if len(new_stats) >= 1000:
-                    db.session.bulk_save_objects(new_stats)
-                    db.session.commit()
-                    print(f"  Imported {len(new_stats)} records...")
-                    new_stats = []
-
-            # Insert remaining stats
-            if new_stats:
-                db.session.bulk_save_objects(new_stats)
+            if 'opponent_team' in weekly_stats_df:
+                stats_df['opponent'] = weekly_stats_df['opponent_team'].astype(object)
+            else:
+                stats_df['opponent'] = None
+
+            if replace:
+                # Whole weeks, taken before unmapped players are dropped, so rows a
+                # correction removed (or whose player is no longer imported) go too.
+                # Rows the ESPN scraper stored are not part of this feed
+                weeks = [
+                    (int(season), int(week))
+                    for season, week in stats_df[['season', 'week']].dropna().drop_duplicates().itertuples(index=False, name=None)
+                ]
+                nflverse_players = select(Player.id).where(~Player.player_id.like('ESPN_%'))
+                for i in range(0, len(weeks), 500):
+                    PlayerStats.query.filter(
+                        tuple_(PlayerStats.season, PlayerStats.week).in_(weeks[i:i + 500]),
+                        PlayerStats.player_id.in_(nflverse_players)
+                    ).delete(synchronize_session=False)
+
+            stats_df = stats_df[stats_df['player_id'].notna() & stats_df['season'].notna()]
+            stats_df = stats_df.astype({'player_id': 'int64', 'season': 'int64', 'week': 'Int64'})
+            stats_df = stats_df.drop_duplicates(['player_id', 'season', 'week'])
+
+            # Anti-join against stats already stored for these seasons
+            seasons = [int(season) for season in stats_df['season'].unique()]
+            existing_keys = pd.DataFrame(
+                PlayerStats.query.with_entities(
+                    PlayerStats.player_id, PlayerStats.season, PlayerStats.week
+                ).filter(PlayerStats.season.in_(seasons)).all(),
+                columns=['player_id', 'season', 'week']
+            ).astype({'player_id': 'int64', 'season': 'int64', 'week': 'Int64'})
+
+            new_stats = stats_df.merge(
+                existing_keys, on=['player_id', 'season', 'week'], how='left', indicator=True
+            )
+            new_stats = new_stats[new_stats['_merge'] == 'left_only'].drop(columns='_merge')
+
+            # Missing values become NULL
+            records = new_stats.astype(object).where(new_stats.notna(), None).to_dict('records')
+
+            batch_size = NFLDataService.STATS_INSERT_BATCH_SIZE
+            for i in range(0, len(records), batch_size):
+                db.session.execute(insert(PlayerStats), records[i:i + batch_size])
                 db.session.commit()
+                print(f"  Imported {min(i + batch_size, len(records))} records...")
+
+            print(f"Imported {len(records)} new stat records")
 
-            print(f"Imported {imported_count} new stat records")
+            # Keep team-week offense and player season totals in step with the imported seasons
+            NFLDataService.refresh_stat_rollups(seasons)
 
         except Exception as e:
             db.session.rollback()
             print(f"Error importing player stats: {e}")
             raise
 
+    @staticmethod
+    def refresh_stat_rollups(seasons=None):
+        """
+        Rebuild every table rolled up from player stats
+        Must be called by every path that writes player stats
+
+        Args:
+            seasons: Seasons to rebuild (default: all seasons)
+        """
+        NFLDataService.refresh_team_offense_weekly(seasons)
+        NFLDataService.refresh_player_season_totals(seasons)
+
+    @staticmethod
+    def refresh_team_offense_weekly(seasons=None):
+        """
+        Rebuild team_offense_weekly rows from player stats
+        Each team-week total is summed over players currently on that team
+
+        Args:
+            seasons: Seasons to rebuild (default: all seasons)
+        """
+        try:
+            stale_rows = TeamOffenseWeekly.query
+            if seasons is not None:
+                stale_rows = stale_rows.filter(TeamOffenseWeekly.season.in_(seasons))
+            stale_rows.delete(synchronize_session=False)
+
+            totals = select(
+                Player.team,
+                PlayerStats.season,
+                PlayerStats.week,
+                func.coalesce(func.sum(PlayerStats.passing_yards), 0),
+                func.coalesce(func.sum(PlayerStats.rushing_yards), 0),
+                func.coalesce(func.sum(PlayerStats.receiving_yards), 0),
+                func.coalesce(func.sum(PlayerStats.targets), 0)
+            ).join(
+                Player, Player.id == PlayerStats.player_id
+            ).where(
+                PlayerStats.week.isnot(None)
+            ).group_by(Player.team, PlayerStats.season, PlayerStats.week)
+
+            if seasons is not None:
+                totals = totals.where(PlayerStats.season.in_(seasons))
+
+            db.session.execute(
+                insert(TeamOffenseWeekly).from_select(
+                    ['team', 'season', 'week', 'passing_yards', 'rushing_yards', 'receiving_yards', 'targets'],
+                    totals
+                )
+            )
+            db.session.commit()
+
+            scope = f"seasons {seasons}" if seasons is not None else "all seasons"
+            print(f"Refreshed team offense weekly totals for {scope}")
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error refreshing team offense totals: {e}")
+            raise
+
+    @staticmethod
+    def refresh_player_season_totals(seasons=None):
+        """
+        Rebuild player_season_totals rows from player stats
+        Backs the current-season leaderboard
+
+        Args:
+            seasons: Seasons to rebuild (default: all seasons)
+        """
+        try:
+            stale_rows = PlayerSeasonTotals.query
+            if seasons is not None:
+                stale_rows = stale_rows.filter(PlayerSeasonTotals.season.in_(seasons))
+            stale_rows.delete(synchronize_session=False)
+
+            def total(column):
+                return func.coalesce(func.sum(column), 0)
+
+            totals = select(
+                PlayerStats.player_id,
+                PlayerStats.season,
+                func.count(PlayerStats.id),
+                total(PlayerStats.receptions),
+                total(PlayerStats.receiving_yards),
+                total(PlayerStats.receiving_touchdowns),
+                total(PlayerStats.rushes),
+                total(PlayerStats.rushing_yards),
+                total(PlayerStats.rushing_touchdowns),
+                total(PlayerStats.receiving_touchdowns) + total(PlayerStats.rushing_touchdowns),
+                total(PlayerStats.passing_attempts),
+                total(PlayerStats.passing_completions),
+                total(PlayerStats.passing_yards),
+                total(PlayerStats.passing_touchdowns),
+                total(PlayerStats.interceptions)
+            ).where(
+                PlayerStats.week.isnot(None)
+            ).group_by(PlayerStats.player_id, PlayerStats.season)
+
+            if seasons is not None:
+                totals = totals.where(PlayerStats.season.in_(seasons))
+
+            db.session.execute(
+                insert(PlayerSeasonTotals).from_select(
+                    [
+                        'player_id', 'season', 'games_played', 'receptions', 'receiving_yards',
+                        'receiving_touchdowns', 'rushes', 'rushing_yards', 'rushing_touchdowns',
+                        'touchdowns', 'passing_attempts', 'passing_completions', 'passing_yards',
+                        'passing_touchdowns', 'interceptions'
+                    ],
+                    totals
+                )
+            )
+            db.session.commit()
+
+            scope = f"seasons {seasons}" if seasons is not None else "all seasons"
+            print(f"Refreshed player season totals for {scope}")
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error refreshing player season totals: {e}")
+            raise
+
+    @staticmethod
+    def backfill_team_offense_weekly():
+        """Build the player stats rollups on first start if player stats predate the tables"""
+        if PlayerStats.query.first() is None:
+            return
+        if TeamOffenseWeekly.query.first() is None:
+            print("Backfilling team offense weekly totals...")
+            NFLDataService.refresh_team_offense_weekly()
+        if PlayerSeasonTotals.query.first() is None:
+            print("Backfilling player season totals...")
+            NFLDataService.refresh_player_season_totals()
+
     @staticmethod
     def import_teams_to_db():
         """
@@ -309,68 +521,127 @@ class NFLDataService:
             raise
 
     @staticmethod
-    def import_team_stats_to_db(team_stats_df):
+    def import_team_stats_to_db(team_stats_df, replace=False):
         """
         Import team defensive statistics to database
+        Team ids are resolved from one lookup and rows are upserted in bulk
 
         Args:
             team_stats_df: DataFrame containing team defensive stats
+            replace: Replace every stat stored for the (season, week) games in the
+                     DataFrame (used to apply stat corrections, including rows the
+                     correction removed) instead of only upserting
         """
         try:
-            imported_count = 0
-            updated_count = 0
-
-            for _, row in team_stats_df.iterrows():
-                # Find the team in our database
-                team = Team.query.filter_by(team_abbr=row['team']).first()
-
-                if not team:
-                    print(f"Warning: Team {row['team']} not found in database, skipping stats")
-                    continue
-
-                # Check if stats already exist for this team/season/week
-                existing_stat = TeamStats.query.filter_by(
-                    team_id=team.id,
-                    season=row['season'],
-                    week=row['week'],
-                    opponent=row['opponent']
-                ).first()
-
-                if existing_stat:
-                    # Update existing stats
-                    existing_stat.points_against = row.get('points_allowed', 0) or 0
-                    existing_stat.yards_against = row.get('yards_allowed', 0) or 0
-                    existing_stat.passing_yards_against = row.get('passing_yards_allowed', 0) or 0
-                    existing_stat.rushing_yards_against = row.get('rushing_yards_allowed', 0) or 0
-                    updated_count += 1
+            team_id_map = dict(Team.query.with_entities(Team.team_abbr, Team.id).all())
+
+            stats_df = pd.DataFrame({
+                'team_id': team_stats_df['team'].map(team_id_map),
+                'season': pd.to_numeric(team_stats_df['season'], errors='coerce'),
+                'week': pd.to_numeric(team_stats_df['week'], errors='coerce'),
+                'opponent': team_stats_df['opponent'].astype(object) if 'opponent' in team_stats_df else None
+            })
+
+            # Missing stats default to 0; NaN (e.g. unplayed games) stays NULL
+            for source, column in NFLDataService.TEAM_STAT_COLUMNS.items():
+                if source in team_stats_df:
+                    stats_df[column] = pd.to_numeric(team_stats_df[source], errors='coerce').round().astype('Int64')
                 else:
-                    # Create new stat record
-                    stat = TeamStats(
-                        team_id=team.id,
-                        season=int(row['season']),
-                        week=int(row['week']) if pd.notna(row['week']) else None,
-                        points_against=row.get('points_allowed', 0) or 0,
-                        yards_against=row.get('yards_allowed', 0) or 0,
-                        passing_yards_against=row.get('passing_yards_allowed', 0) or 0,
-                        rushing_yards_against=row.get('rushing_yards_allowed', 0) or 0,
-                        opponent=row.get('opponent', None)
-                    )
-                    db.session.add(stat)
-                    imported_count += 1
-
-                # Commit in batches to improve performance
-                if (imported_count + updated_count) % 100 == 0:
-                    db.session.commit()
-
-            # Final commit
-            db.session.commit()
-            print(f"Imported {imported_count} new team stat records, updated {updated_count} existing records")
+                    stats_df[column] = 0
+
+            unknown_teams = sorted(team_stats_df.loc[stats_df['team_id'].isna(), 'team'].dropna().unique())
+            for team in unknown_teams:
+                print(f"Warning: Team {team} not found in database, skipping stats")
+
+            if replace:
+                # Whole weeks, taken before unknown teams are dropped; committed with the upsert
+                weeks = [
+                    (int(season), int(week))
+                    for season, week in stats_df[['season', 'week']].dropna().drop_duplicates().itertuples(index=False, name=None)
+                ]
+                for i in range(0, len(weeks), 500):
+                    TeamStats.query.filter(
+                        tuple_(TeamStats.season, TeamStats.week).in_(weeks[i:i + 500])
+                    ).delete(synchronize_session=False)
+
+            stats_df = stats_df[stats_df['team_id'].notna() & stats_df['season'].notna()]
+            stats_df = stats_df.astype({'team_id': 'int64', 'season': 'int64', 'week': 'Int64'})
+            # De-duplicate on the same key the unique index uses (NULL week/opponent as 0/'')
+            key = stats_df[NFLDataService.TEAM_STATS_KEY].fillna({'week': 0, 'opponent': ''})
+            stats_df = stats_df[~key.duplicated(keep='last')]
+
+            records = stats_df.astype(object).where(stats_df.notna(), None).to_dict('records')
+            NFLDataService.upsert_team_stats(records)
+
+            print(f"Upserted {len(records)} team stat records")
 
         except Exception as e:
             db.session.rollback()
             print(f"Error importing team stats: {e}")
             raise
 
+    @staticmethod
+    def upsert_team_stats(records):
+        """
+        Insert team_stats rows, updating rows that already exist for the same
+        (team_id, season, week, opponent), NULL week/opponent included
+        Uses INSERT ... ON CONFLICT DO UPDATE (PostgreSQL and SQLite) on the
+        uq_team_stats_game expression index
+
+        Args:
+            records: List of dicts keyed by TeamStats column names
+        """
+        if not records:
+            return
+
+        if db.engine.dialect.name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as upsert_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert_insert
+
+        # Table-level insert keeps explicit NULLs (the ORM bulk path swaps them for defaults)
+        statement = upsert_insert(TeamStats.__table__)
+        update_columns = [column for column in records[0] if column not in NFLDataService.TEAM_STATS_KEY]
+        statement = statement.on_conflict_do_update(
+            index_elements=TeamStats.unique_key(),
+            set_={
+                **{column: statement.excluded[column] for column in update_columns},
+                'updated_at': datetime.utcnow()
+            }
+        )
+
+        batch_size = NFLDataService.STATS_INSERT_BATCH_SIZE
+        for i in range(0, len(records), batch_size):
+            db.session.execute(statement, records[i:i + batch_size])
+        db.session.commit()
+
+    @staticmethod
+    def ensure_team_stats_unique_index():
+        """
+        Add the team_stats upsert key to databases created before it existed
+        Duplicate rows are collapsed to the most recently inserted one first, and the
+        earlier plain-column index (which let rows with a NULL week or opponent
+        repeat) is replaced
+        """
+        index_name = 'uq_team_stats_game'
+        # Looked up in the catalog: SQLite reflection skips expression indexes
+        if db.engine.dialect.name == 'postgresql':
+            catalog = "SELECT 1 FROM pg_indexes WHERE indexname = :name"
+        else:
+            catalog = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"
+        if db.session.execute(text(catalog), {'name': index_name}).first():
+            return
+
+        print("Adding unique (team_id, season, week, opponent) index to team_stats...")
+        key = "team_id, season, COALESCE(week, 0), COALESCE(opponent, '')"
+        db.session.execute(text(
+            "DELETE FROM team_stats WHERE id NOT IN ("
+            f"SELECT MAX(id) FROM team_stats GROUP BY {key})"
+        ))
+        db.session.execute(text("DROP INDEX IF EXISTS uq_team_stats_team_season_week_opponent"))
+        db.session.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON team_stats ({key})"))
+        db.session.commit()
+
     @staticmethod
     def sync_all_data(years=5):
         """
@@ -406,8 +677,151 @@ class NFLDataService:
             print("Importing team defensive statistics...")
             NFLDataService.import_team_stats_to_db(team_stats)
 
+            # Baseline for incremental syncs
+            NFLDataService.record_sync_state('player_stats', NFLDataService.week_checksums(player_stats))
+            NFLDataService.record_sync_state('team_stats', NFLDataService.week_checksums(team_stats))
+
+            # Cached team context is stale once new stats are in
+            PredictionService.invalidate_cache()
+
             print("Data sync completed successfully!")
 
         except Exception as e:
             print(f"Error during data sync: {e}")
             raise
+
+    @staticmethod
+    def sync_incremental(years=5):
+        """
+        Sync only weeks whose source data changed since the last sync
+        Each (season, week) of the source data is checksummed and compared with
+        sync_state: weeks past the watermark are new, earlier weeks with a different
+        checksum carry stat corrections. Only those weeks are written. Completed
+        seasons that were already synced are not loaded at all.
+
+        Args:
+            years: Number of years of historical data to consider (default: 5)
+
+        Returns:
+            Number of (source, season, week) partitions that were ingested
+        """
+        try:
+            current_season = NFLDataService.get_available_seasons(1)[0]
+            synced_seasons = {
+                row.season for row in db.session.query(SyncState.season).distinct().all()
+            }
+            seasons = [
+                season for season in NFLDataService.get_available_seasons(years)
+                if season >= current_season or season not in synced_seasons
+            ]
+            print(f"Starting incremental sync for seasons: {seasons}")
+
+            NFLDataService.import_teams_to_db()
+
+            # Player stats: ingest new and corrected weeks only
+            player_stats = NFLDataService.fetch_player_stats(seasons)
+            player_checksums = NFLDataService.changed_weeks(
+                'player_stats', NFLDataService.week_checksums(player_stats)
+            )
+            if player_checksums:
+                changed = NFLDataService._rows_for_weeks(player_stats, player_checksums)
+                print(f"Ingesting player stats for {len(player_checksums)} changed weeks ({len(changed)} rows)")
+                NFLDataService.import_players_to_db(changed)
+                NFLDataService.import_player_stats_to_db(changed, replace=True)
+                NFLDataService.record_sync_state('player_stats', player_checksums)
+
+            # Team defensive stats: replace new and corrected weeks only
+            team_stats = NFLDataService.fetch_team_stats(seasons)
+            team_checksums = NFLDataService.changed_weeks(
+                'team_stats', NFLDataService.week_checksums(team_stats)
+            )
+            if team_checksums:
+                changed = NFLDataService._rows_for_weeks(team_stats, team_checksums)
+                print(f"Ingesting team stats for {len(team_checksums)} changed weeks ({len(changed)} rows)")
+                NFLDataService.import_team_stats_to_db(changed, replace=True)
+                NFLDataService.record_sync_state('team_stats', team_checksums)
+
+            changed_count = len(player_checksums) + len(team_checksums)
+            if changed_count:
+                PredictionService.invalidate_cache()
+
+            print(f"Incremental sync completed: {changed_count} changed weeks")
+            return changed_count
+
+        except Exception as e:
+            print(f"Error during incremental sync: {e}")
+            raise
+
+    @staticmethod
+    def week_checksums(df):
+        """
+        Checksum the rows of each (season, week) in a source DataFrame
+        The hash is order-independent, so reordered downloads are not changes
+
+        Returns:
+            Dictionary mapping (season, week) to (checksum, row count)
+        """
+        weekly = df[df['week'].notna()]
+        if weekly.empty:
+            return {}
+
+        row_hashes = pd.util.hash_pandas_object(weekly, index=False)
+        grouped = row_hashes.groupby([weekly['season'].astype(int), weekly['week'].astype(int)])
+        sums = grouped.sum()
+        counts = grouped.size()
+
+        return {
+            (int(season), int(week)): (f'{int(total) & 0xFFFFFFFFFFFFFFFF:016x}', int(counts[(season, week)]))
+            for (season, week), total in sums.items()
+        }
+
+    @staticmethod
+    def changed_weeks(source, checksums):
+        """
+        Keep only weeks whose checksum differs from the one recorded in sync_state
+
+        Returns:
+            Dictionary of changed (season, week) to (checksum, row count)
+        """
+        seasons = sorted({season for season, _ in checksums})
+        recorded = {
+            (row.season, row.week): row.checksum
+            for row in SyncState.query.filter(
+                SyncState.source == source,
+                SyncState.season.in_(seasons)
+            ).all()
+        }
+
+        return {
+            key: value for key, value in checksums.items()
+            if recorded.get(key) != value[0]
+        }
+
+    @staticmethod
+    def record_sync_state(source, checksums):
+        """Store the checksums of ingested weeks for a source"""
+        if not checksums:
+            return
+
+        keys = list(checksums)
+        for i in range(0, len(keys), 500):
+            SyncState.query.filter(
+                SyncState.source == source,
+                tuple_(SyncState.season, SyncState.week).in_(keys[i:i + 500])
+            ).delete(synchronize_session=False)
+
+        db.session.execute(insert(SyncState), [
+            {'source': source, 'season': season, 'week': week, 'checksum': checksum, 'row_count': row_count}
+            for (season, week), (checksum, row_count) in checksums.items()
+        ])
+        db.session.commit()
+
+    @staticmethod
+    def _rows_for_weeks(df, weeks):
+        """Rows of a source DataFrame that belong to the given (season, week) keys"""
+        keys = pd.MultiIndex.from_tuples(list(weeks), names=['season', 'week'])
+        row_keys = pd.MultiIndex.from_arrays([
+            pd.to_numeric(df['season'], errors='coerce').fillna(-1).astype(int),
+            pd.to_numeric(df['week'], errors='coerce').fillna(-1).astype(int)
+        ])
+        return df[row_keys.isin(keys)]
@@ -0,0 +1,364 @@
+"""
+Parlay pricing with correlated Monte Carlo simulation
+
+Each leg is an over/under line on one player stat. Its marginal distribution is
+the one the prediction model fits for that market (normal for yards and
+receptions, Poisson for touchdowns and interceptions). Legs are joined with a
+Gaussian copula:
+
+1. One latent variable per distinct (player, market); two legs on the same
+   player and market (e.g. over 50 and under 90 yards) share it
+2. Pairwise correlations come from priors for how stats move together (the
+   same player's stats, teammates sharing a game script and target pool, and
+   opponents in the same game), shrunk toward the observed weekly correlation
+   when two players have enough games together
+3. Correlated standard normals are drawn in one matrix product; a leg's stat
+   is its marginal's quantile of the latent normal
+
+A line (over hits at or above it, under below it) is therefore exactly a
+cutoff on the leg's latent normal, so every leg is evaluated with one
+vectorized comparison, with no interpolation between benchmarks and no
+independence assumption.
+"""
+
+import numpy as np
+from scipy import special as scipy_special
+from scipy import stats as scipy_stats
+
+from models import db
+from models.player import Player, PlayerStats
+from services.prediction_service import prediction_service
+from services.stats_store import get_stats_store
+
+
+def _pairs(table):
+    """Key a prior table by sorted stat group pairs"""
+    return {tuple(sorted(pair)): value for pair, value in table.items()}
+
+
+def nearest_correlation(matrix):
+    """
+    Closest valid correlation matrix (positive definite, unit diagonal)
+
+    Pairwise estimates are not guaranteed to be jointly consistent, so negative
+    eigenvalues are clipped and the diagonal is rescaled back to 1.
+    """
+    matrix = (matrix + matrix.T) / 2
+    eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+    if eigenvalues.min() > 1e-8:
+        return matrix
+
+    fixed = eigenvectors @ np.diag(np.clip(eigenvalues, 1e-6, None)) @ eigenvectors.T
+    scale = np.sqrt(np.diag(fixed))
+    fixed = fixed / np.outer(scale, scale)
+    np.fill_diagonal(fixed, 1.0)
+    return fixed
+
+
+def latent_cutoff(distribution, line):
+    """
+    Latent standard normal value at which a stat reaches a line
+
+    With the outcome defined as the marginal's quantile of the latent normal z,
+    "stat at or above line" is exactly "z >= cutoff", so lines are evaluated on
+    the latent draws without mapping them to stat values.
+
+    Args:
+        distribution: {'family': 'normal', 'mean', 'std'} or {'family': 'poisson', 'lambda'}
+        line: Stat line
+
+    Returns:
+        Cutoff (may be -inf or inf when the line is always or never reached)
+    """
+    family = distribution['family']
+
+    if family == 'normal' and distribution['std'] > 0:
+        return (line - distribution['mean']) / distribution['std']
+
+    if family == 'poisson' and distribution['lambda'] > 0:
+        # At least k events, k = ceil(line): u > P(X <= k - 1)
+        count = int(np.ceil(line))
+        if count <= 0:
+            return -np.inf
+        return float(scipy_special.ndtri(scipy_stats.poisson.cdf(count - 1, distribution['lambda'])))
+
+    # Point mass: the mean for a zero-std normal, 0 otherwise
+    value = distribution['mean'] if family == 'normal' else 0.0
+    return -np.inf if value >= line else np.inf
+
+
+def simulate_latent(correlation, draws, rng):
+    """
+    Draw correlated standard normals
+
+    Returns:
+        Array of shape (len(correlation), draws), one contiguous row per variable
+    """
+    cholesky = np.linalg.cholesky(correlation)
+    return cholesky @ rng.standard_normal((len(correlation), draws))
+
+
+def american_odds(probability):
+    """Fair American odds for a probability (0-1), None at 0 or 1"""
+    if probability <= 0 or probability >= 1:
+        return None
+    if probability >= 0.5:
+        return -round(probability / (1 - probability) * 100)
+    return round((1 - probability) / probability * 100)
+
+
+class ParlayService:
+    """Price parlays of player stat lines"""
+
+    # Leg stat -> (prediction market, PlayerStats columns summed for the weekly series)
+    LEG_STATS = {
+        'passing_yards': ('passing_yards', ('passing_yards',)),
+        'rushing_yards': ('rushing_yards', ('rushing_yards',)),
+        'receiving_yards': ('receiving_yards', ('receiving_yards',)),
+        'receptions': ('receptions', ('receptions',)),
+        'passing_tds': ('passing_touchdowns', ('passing_touchdowns',)),
+        'interceptions': ('interceptions', ('interceptions',)),
+        # Anytime touchdowns (rushing + receiving); each kind alone has its own market
+        'touchdowns': ('touchdown', ('rushing_touchdowns', 'receiving_touchdowns')),
+        'rushing_tds': ('rushing_touchdowns', ('rushing_touchdowns',)),
+        'receiving_tds': ('receiving_touchdowns', ('receiving_touchdowns',))
+    }
+
+    # Market -> group used to look up correlation priors
+    STAT_GROUPS = {
+        'passing_yards': 'pass',
+        'passing_touchdowns': 'pass_td',
+        'interceptions': 'int',
+        'receiving_yards': 'recv',
+        'receptions': 'recv',
+        'rushing_yards': 'rush',
+        'touchdown': 'td',
+        'rushing_touchdowns': 'td',
+        'receiving_touchdowns': 'td'
+    }
+
+    # Prior correlations between latent outcomes
+    # Same player: volume drives yards, catches and scores together
+    SAME_PLAYER_PRIORS = _pairs({
+        ('recv', 'recv'): 0.8, ('recv', 'td'): 0.35, ('rush', 'td'): 0.35, ('recv', 'rush'): 0.05,
+        ('pass', 'pass_td'): 0.55, ('pass', 'int'): 0.15, ('pass_td', 'int'): -0.05,
+        ('pass', 'rush'): -0.1, ('pass_td', 'rush'): -0.05, ('rush', 'rush'): 0.8
+    })
+    # Teammates: a QB's yards are his receivers' yards; a leading script means runs, a trailing one passes
+    TEAMMATE_PRIORS = _pairs({
+        ('pass', 'recv'): 0.35, ('pass', 'td'): 0.2, ('pass_td', 'recv'): 0.25, ('pass_td', 'td'): 0.3,
+        ('pass', 'rush'): -0.15, ('recv', 'rush'): -0.1, ('rush', 'rush'): -0.1, ('recv', 'recv'): -0.05,
+        ('td', 'td'): 0.05, ('int', 'recv'): 0.05, ('int', 'rush'): -0.1
+    })
+    # Opponents in the same game: shootouts lift both passing games
+    OPPONENT_PRIORS = _pairs({
+        ('pass', 'pass'): 0.2, ('pass', 'recv'): 0.15, ('recv', 'recv'): 0.1, ('pass_td', 'pass_td'): 0.15,
+        ('pass_td', 'td'): 0.1, ('td', 'td'): 0.1, ('pass', 'rush'): -0.05, ('rush', 'rush'): -0.05
+    })
+
+    # Observed correlations need this many shared games before they count as much as the prior
+    PRIOR_WEIGHT_GAMES = 16
+    # Fewest shared games before an observed correlation is used at all
+    MIN_SHARED_GAMES = 6
+    # Recent games per player considered for observed correlations (~3 seasons)
+    HISTORY_GAMES = 50
+
+    DEFAULT_DRAWS = 100000
+
+    @staticmethod
+    def price(legs, draws=None, seed=None):
+        """
+        Price a parlay
+
+        Args:
+            legs: List of dicts with player_id, opponent, stat (key of LEG_STATS),
+                  line (number) and side ('over' or 'under')
+            draws: Number of simulated games (default 100,000)
+            seed: Random seed for reproducible prices
+
+        Returns:
+            Dictionary with the joint probability, the independent-legs probability,
+            fair odds, per-leg probabilities and the leg correlation matrix
+        """
+        draws = draws or ParlayService.DEFAULT_DRAWS
+
+        # One latent variable per (player, market)
+        variables = []
+        variable_index = {}
+        leg_variables = []
+        for leg in legs:
+            market, columns = ParlayService.LEG_STATS[leg['stat']]
+            key = (leg['player_id'], market)
+            if key not in variable_index:
+                variable_index[key] = len(variables)
+                variables.append({
+                    'player_id': leg['player_id'],
+                    'opponent': leg['opponent'],
+                    'market': market,
+                    'columns': columns
+                })
+            leg_variables.append(variable_index[key])
+
+        players = {
+            player.id: player
+            for player in Player.query.filter(Player.id.in_({v['player_id'] for v in variables})).all()
+        }
+        missing = sorted({v['player_id'] for v in variables} - set(players))
+        if missing:
+            raise ValueError(f"Players not found: {', '.join(map(str, missing))}")
+
+        # Fitted marginals for every (player, market) in one batch
+        predictions = prediction_service.predict_batch([
+            {'player_id': v['player_id'], 'opponent': v['opponent'], 'markets': [v['market']]}
+            for v in variables
+        ])
+        distributions = [
+            prediction['predictions'][v['market']]['distribution']
+            for v, prediction in zip(variables, predictions)
+        ]
+
+        correlation = ParlayService.correlation_matrix(variables, players)
+
+        latent = simulate_latent(correlation, draws, np.random.default_rng(seed))
+
+        all_hit = np.ones(draws, dtype=bool)
+        leg_probabilities = []
+        for leg, variable in zip(legs, leg_variables):
+            cutoff = latent_cutoff(distributions[variable], leg['line'])
+            if leg['side'] == 'over':
+                hit = latent[variable] >= cutoff
+            else:
+                hit = latent[variable] < cutoff
+            leg_probabilities.append(hit.mean())
+            all_hit &= hit
+
+        probability = float(all_hit.mean())
+        independent = float(np.prod(leg_probabilities))
+
+        return {
+            'probability': round(probability * 100, 4),
+            'independent_probability': round(independent * 100, 4),
+            'correlation_lift': round(probability / independent, 3) if independent > 0 else None,
+            'standard_error': round(float(np.sqrt(probability * (1 - probability) / draws)) * 100, 3),
+            'fair_odds': {
+                'american': american_odds(probability),
+                'decimal': round(1 / probability, 2) if probability > 0 else None
+            },
+            'draws': draws,
+            'legs': [
+                {
+                    'player_id': leg['player_id'],
+                    'player_name': players[leg['player_id']].name,
+                    'team': players[leg['player_id']].team,
+                    'opponent': leg['opponent'],
+                    'stat': leg['stat'],
+                    'line': leg['line'],
+                    'side': leg['side'],
+                    'probability': round(float(leg_probability) * 100, 2),
+                    'distribution': distributions[variable]
+                }
+                for leg, variable, leg_probability in zip(legs, leg_variables, leg_probabilities)
+            ],
+            'correlation': np.round(correlation[np.ix_(leg_variables, leg_variables)], 3).tolist()
+        }
+
+    @staticmethod
+    def correlation_matrix(variables, players):
+        """
+        Correlation of the latent outcomes of each (player, market) variable
+
+        Args:
+            variables: List of dicts with player_id, opponent, market and columns
+            players: Player rows by id
+
+        Returns:
+            Positive definite correlation matrix
+        """
+        series = ParlayService._weekly_series({v['player_id'] for v in variables})
+
+        size = len(variables)
+        matrix = np.eye(size)
+        for i in range(size):
+            for j in range(i + 1, size):
+                a, b = variables[i], variables[j]
+                player_a, player_b = players[a['player_id']], players[b['player_id']]
+                pair = tuple(sorted((ParlayService.STAT_GROUPS[a['market']], ParlayService.STAT_GROUPS[b['market']])))
+
+                if a['player_id'] == b['player_id']:
+                    prior, observed = ParlayService.SAME_PLAYER_PRIORS.get(pair, 0.0), True
+                elif player_a.team == player_b.team:
+                    prior, observed = ParlayService.TEAMMATE_PRIORS.get(pair, 0.0), True
+                elif player_a.team == b['opponent'] or player_b.team == a['opponent']:
+                    # Different teams never share a week's game in the history, so priors only
+                    prior, observed = ParlayService.OPPONENT_PRIORS.get(pair, 0.0), False
+                else:
+                    prior, observed = 0.0, False
+
+                value = prior
+                if observed:
+                    value = ParlayService._shrunk_correlation(series, a, b, prior)
+                matrix[i, j] = matrix[j, i] = value
+
+        return nearest_correlation(matrix)
+
+    @staticmethod
+    def _shrunk_correlation(series, a, b, prior):
+        """Observed weekly correlation of two variables shrunk toward the prior"""
+        games_a, games_b = series.get(a['player_id']), series.get(b['player_id'])
+        if games_a is None or games_b is None:
+            return prior
+
+        _, index_a, index_b = np.intersect1d(games_a['game'], games_b['game'], return_indices=True)
+        shared = len(index_a)
+        if shared < ParlayService.MIN_SHARED_GAMES:
+            return prior
+
+        values_a = sum(games_a[column] for column in a['columns'])[index_a]
+        values_b = sum(games_b[column] for column in b['columns'])[index_b]
+        if values_a.std() == 0 or values_b.std() == 0:
+            return prior
+
+        observed = float(np.corrcoef(values_a, values_b)[0, 1])
+        weight = ParlayService.PRIOR_WEIGHT_GAMES
+        return (shared * observed + weight * prior) / (shared + weight)
+
+    @staticmethod
+    def _weekly_series(player_ids):
+        """
+        Recent weekly stats of each player, keyed by game (season * 100 + week)
+
+        Returns:
+            Dictionary of player_id -> dict of arrays ('game' and stat columns)
+        """
+        columns = sorted({column for stat in ParlayService.LEG_STATS.values() for column in stat[1]})
+        store = get_stats_store()
+
+        series = {}
+        if store is not None:
+            for player_id in player_ids:
+                recent = store.recent_stats(player_id, limit=ParlayService.HISTORY_GAMES)
+                if len(recent['season']):
+                    series[player_id] = {'game': recent['season'] * 100 + recent['week']}
+                    series[player_id].update({column: recent[column] for column in columns})
+            return series
+
+        rows = db.session.query(
+            PlayerStats.player_id, PlayerStats.season, PlayerStats.week,
+            *[getattr(PlayerStats, column) for column in columns]
+        ).filter(
+            PlayerStats.player_id.in_(player_ids),
+            PlayerStats.week.isnot(None)
+        ).order_by(PlayerStats.player_id, PlayerStats.season.desc(), PlayerStats.week.desc()).all()
+
+        by_player = {}
+        for row in rows:
+            games = by_player.setdefault(row.player_id, [])
+            if len(games) < ParlayService.HISTORY_GAMES:
+                games.append(row)
+
+        for player_id, games in by_player.items():
+            series[player_id] = {'game': np.array([g.season * 100 + g.week for g in games])}
+            series[player_id].update({
+                column: np.array([getattr(g, column) or 0 for g in games], dtype=float) for column in columns
+            })
+        return series
@@ -0,0 +1,210 @@
+"""
+Precomputed prediction matrix
+
+After each data sync, every active QB/RB/WR/TE is predicted against every
+opponent and the results are stored in prediction_matrix, keyed by
+(data_version, player_id, opponent). Prediction reads are then a single
+indexed lookup; anything missing from the matrix (or built for an older data
+version) falls back to computing the prediction live.
+
+The build is spread over a pool of worker processes. Workers are spawned
+rather than forked: the build runs on scheduler and request threads of a
+multithreaded server, and a forked child would inherit locks held by other
+threads and the parent's open database connections. Each worker opens its own
+engine, builds its own stats snapshot and only returns compressed rows; the
+parent writes them chunk by chunk inside one transaction for the version.
+"""
+
+import multiprocessing
+
+from flask import Flask, current_app
+from sqlalchemy import insert
+
+from config import Config
+from models import db
+from models.data_version import DataVersion
+from models.player import Player, PlayerStats
+from models.prediction import PredictionMatrix
+from models.team import Team, TeamStats
+from services.prediction_service import PredictionService, prediction_service
+
+
+def _init_worker(database_uri):
+    """Give each spawned worker its own app context and database engine"""
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    db.init_app(app)
+    app.app_context().push()
+
+
+def _predict_players(player_ids, opponents, data_version):
+    """
+    Predict a chunk of players against every opponent
+
+    Returns:
+        List of prediction_matrix row dicts
+    """
+    items = [
+        {'player_id': player_id, 'opponent': opponent, 'markets': ['full']}
+        for player_id in player_ids
+        for opponent in opponents
+    ]
+
+    rows = []
+    for result in prediction_service.predict_batch(items):
+        if 'error' in result:
+            continue
+        rows.append({
+            'data_version': data_version,
+            'player_id': result['player_id'],
+            'opponent': result['opponent'],
+            'prediction': PredictionMatrix.encode(result['predictions']['full'])
+        })
+    return rows
+
+
+def _predict_players_task(task):
+    """Pool.imap_unordered entry point for _predict_players"""
+    return _predict_players(*task)
+
+
+class PredictionMatrixService:
+    """Service for building and reading the precomputed prediction matrix"""
+
+    # Positions included in the matrix
+    POSITIONS = ['QB', 'RB', 'WR', 'TE']
+
+    # Players predicted per worker task
+    CHUNK_SIZE = 25
+
+    # Rows per INSERT statement
+    INSERT_BATCH_SIZE = 1000
+
+    @staticmethod
+    def get_active_player_ids(season=PredictionService.CURRENT_SEASON):
+        """Get IDs of skill-position players with stats in the given season"""
+        rows = db.session.query(Player.id).filter(
+            Player.position.in_(PredictionMatrixService.POSITIONS),
+            Player.id.in_(
+                db.session.query(PlayerStats.player_id).filter(PlayerStats.season == season)
+            )
+        ).order_by(Player.id).all()
+        return [row.id for row in rows]
+
+    @staticmethod
+    def get_opponents(season=PredictionService.CURRENT_SEASON):
+        """Get abbreviations of teams playing in the given season (all teams if unknown)"""
+        rows = db.session.query(Team.team_abbr).join(
+            TeamStats, TeamStats.team_id == Team.id
+        ).filter(
+            TeamStats.season == season
+        ).distinct().order_by(Team.team_abbr).all()
+
+        if not rows:
+            rows = db.session.query(Team.team_abbr).order_by(Team.team_abbr).all()
+
+        return [row.team_abbr for row in rows]
+
+    @staticmethod
+    def build(workers=None):
+        """
+        Compute and store predictions for every active player against every opponent
+        Called at the end of each sync; failures are logged and leave reads on the live path
+
+        Args:
+            workers: Number of worker processes (default: Config.PREDICTION_MATRIX_WORKERS)
+        """
+        if not Config.PREDICTION_MATRIX_ENABLED:
+            return
+
+        try:
+            data_version = DataVersion.current()
+            player_ids = PredictionMatrixService.get_active_player_ids()
+            opponents = PredictionMatrixService.get_opponents()
+            workers = workers or Config.PREDICTION_MATRIX_WORKERS
+
+            print(f"Building prediction matrix v{data_version}: "
+                  f"{len(player_ids)} players x {len(opponents)} opponents ({workers} workers)")
+
+            chunks = [
+                player_ids[i:i + PredictionMatrixService.CHUNK_SIZE]
+                for i in range(0, len(player_ids), PredictionMatrixService.CHUNK_SIZE)
+            ]
+
+            # Rebuilding a version replaces it. Rows are written as chunks finish, all
+            # in one transaction, so readers never see a partial matrix and only one
+            # chunk of rows is held in memory
+            PredictionMatrix.query.filter(
+                PredictionMatrix.data_version == data_version
+            ).delete(synchronize_session=False)
+
+            row_count = 0
+            # SQLite blocks the workers' reads while this write transaction is open
+            if workers > 1 and len(chunks) > 1 and db.engine.dialect.name != 'sqlite':
+                pool = multiprocessing.get_context('spawn').Pool(
+                    min(workers, len(chunks)),
+                    initializer=_init_worker,
+                    initargs=(current_app.config['SQLALCHEMY_DATABASE_URI'],)
+                )
+                try:
+                    tasks = [(chunk, opponents, data_version) for chunk in chunks]
+                    for chunk_rows in pool.imap_unordered(_predict_players_task, tasks):
+                        row_count += PredictionMatrixService._insert_rows(chunk_rows)
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                for chunk in chunks:
+                    row_count += PredictionMatrixService._insert_rows(
+                        _predict_players(chunk, opponents, data_version)
+                    )
+
+            # Only the latest version is ever read
+            PredictionMatrix.query.filter(
+                PredictionMatrix.data_version != data_version
+            ).delete(synchronize_session=False)
+            db.session.commit()
+
+            print(f"Prediction matrix v{data_version} built: {row_count} predictions")
+
+        except Exception as e:
+            db.session.rollback()
+            print(f"Error building prediction matrix: {e}")
+
+    @staticmethod
+    def _insert_rows(rows):
+        """
+        Insert prediction_matrix rows in batches (in the caller's transaction)
+
+        Returns:
+            Number of rows inserted
+        """
+        for i in range(0, len(rows), PredictionMatrixService.INSERT_BATCH_SIZE):
+            db.session.execute(
+                insert(PredictionMatrix), rows[i:i + PredictionMatrixService.INSERT_BATCH_SIZE]
+            )
+        return len(rows)
+
+    @staticmethod
+    def get_prediction(player_id, opponent):
+        """
+        Get a precomputed full prediction for the current data version
+
+        Returns:
+            Prediction dictionary, or None when it is not in the matrix
+        """
+        if not Config.PREDICTION_MATRIX_ENABLED:
+            return None
+
+        current_version = db.session.query(DataVersion.version).filter(
+            DataVersion.id == 1
+        ).scalar_subquery()
+
+        row = db.session.query(PredictionMatrix.prediction).filter(
+            PredictionMatrix.data_version == current_version,
+            PredictionMatrix.player_id == player_id,
+            PredictionMatrix.opponent == opponent
+        ).first()
+
+        return PredictionMatrix.decode(row.prediction) if row else None
@@ -9,12 +9,23 @@ and scoring touchdowns based on:
 """
 
 import numpy as np
+import threading
 from datetime import datetime
+from config import Config
 from models import db
+from models.data_version import DataVersion
 from models.player import Player, PlayerStats
-from models.team import Team, TeamStats
-from sqlalchemy import func
-from scipy import stats as scipy_stats
+from models.team import Team, TeamStats, TeamOffenseWeekly
+from sqlalchemy import func, tuple_
+from services.probability_kernel import (
+    ProbabilityBatch, line_exceedance, normal_distribution, normal_exceedance,
+    poisson_at_least, poisson_distribution, to_percentages
+)
+from services.result_cache import cached_result, get_result_cache
+from services.stats_store import (
+    PLAYER_STAT_COLUMNS, TEAM_TOTAL_COLUMNS, DEFENSE_STAT_COLUMNS,
+    get_stats_store, refresh_stats_store, rows_to_columns
+)
 
 
 class PredictionService:
@@ -26,12 +37,249 @@ class PredictionService:
     # QB-specific passing yards benchmarks
     QB_PASSING_BENCHMARKS = [150, 200, 225, 250, 275, 300, 325, 350, 375, 400, 450, 500]
 
+    # Receptions benchmarks
+    RECEPTIONS_BENCHMARKS = [2, 3, 4, 5, 6, 7, 8, 10, 12, 15]
+
+    # QB passing touchdown thresholds (1+, 2+, 3+, 4+)
+    QB_TD_THRESHOLDS = [1, 2, 3, 4]
+
     # Time decay factors (more recent = higher weight)
     CURRENT_SEASON_WEIGHT = 2.0  # Current season weighted 2x higher
     WEEK_DECAY_FACTOR = 0.95  # Each week back reduces weight by 5%
 
+    # PlayerStats columns the model reads from a player's recent games
+    MODEL_STAT_COLUMNS = PLAYER_STAT_COLUMNS
+
+    # Team totals used for yard/target shares
+    SHARE_STAT_COLUMNS = TEAM_TOTAL_COLUMNS
+
+    # Markets accepted by predict_batch
+    BATCH_MARKETS = [
+        'full', 'receiving_yards', 'rushing_yards', 'total_yards', 'passing_yards',
+        'receptions', 'touchdown', 'rushing_touchdowns', 'receiving_touchdowns',
+        'passing_touchdowns', 'interceptions'
+    ]
+
+    # Markets accepted by predict_lines (each has a single fitted distribution)
+    LINE_MARKETS = [market for market in BATCH_MARKETS if market != 'full']
+
+    # Season used for team offense and defensive context
+    CURRENT_SEASON = 2025
+
+    # Process-level caches for team context that only changes when data is synced
+    # Keyed by (team_abbr, season) and season respectively, valid for _cache_version
+    _team_offense_cache = {}
+    _league_splits_cache = {}
+    _cache_version = None
+    _cache_lock = threading.Lock()
+
     def __init__(self):
-        pass
+        # Rows bulk-loaded by preload(); None means every lookup hits the database
+        self._preloaded = None
+
+        # When set, benchmark probabilities are queued and evaluated together
+        self._probability_batch = None
+
+    @classmethod
+    def invalidate_cache(cls):
+        """
+        Clear cached team offensive stats and league splits and rebuild the stats store
+        Must be called by every path that writes player or team stats
+
+        Also bumps the data version, so results keyed by the previous version
+        (e.g. the prediction matrix and the result cache) stop being served
+        """
+        version = DataVersion.bump()
+        with cls._cache_lock:
+            cls._team_offense_cache.clear()
+            cls._league_splits_cache.clear()
+            cls._cache_version = version
+        refresh_stats_store()
+
+        # Entries for the old version can no longer be hit; free them now
+        result_cache = get_result_cache()
+        if result_cache is not None:
+            result_cache.clear_local()
+        print("Prediction caches invalidated")
+
+    @classmethod
+    def _sync_context_caches(cls):
+        """
+        Drop cached team context from before the current data version
+        Covers bumps made by other workers and offline scripts, which never
+        call invalidate_cache() in this process
+
+        Returns:
+            The data version the caches are valid for
+        """
+        version = DataVersion.cached(Config.DATA_VERSION_CHECK_SECONDS)
+        with cls._cache_lock:
+            if cls._cache_version is None or cls._cache_version < version:
+                cls._team_offense_cache.clear()
+                cls._league_splits_cache.clear()
+                cls._cache_version = version
+        return version
+
+    def preload(self, player_ids, opponents, limit=20):
+        """
+        Bulk-load everything needed to predict a set of players against a set of opponents
+        Lookups made by this instance afterwards are served from memory instead of
+        issuing per-player queries
+
+        Args:
+            player_ids: Player database IDs
+            opponents: Opponent team abbreviations
+            limit: Number of recent games to load per player
+        """
+        player_ids = list(set(player_ids))
+        opponents = list(set(opponents))
+
+        players = {p.id: p for p in Player.query.filter(Player.id.in_(player_ids)).all()} if player_ids else {}
+
+        self._preloaded = {
+            'limit': limit,
+            'players': {player_id: players.get(player_id) for player_id in player_ids},
+            'recent_stats': {},
+            'teams': set(),
+            'team_totals': {},
+            'defense': {}
+        }
+
+        # Stats are already served from memory by the stats store
+        if get_stats_store() is not None:
+            return
+
+        # Latest `limit` games per player in one windowed query
+        recent_rows = {player_id: [] for player_id in player_ids}
+        if player_ids:
+            game_rank = func.row_number().over(
+                partition_by=PlayerStats.player_id,
+                order_by=(PlayerStats.season.desc(), PlayerStats.week.desc())
+            ).label('game_rank')
+            ranked = self._stats_query().add_columns(game_rank).filter(
+                PlayerStats.player_id.in_(player_ids),
+                PlayerStats.week.isnot(None)
+            ).subquery()
+            rows = db.session.query(ranked).filter(
+                ranked.c.game_rank <= limit
+            ).order_by(ranked.c.player_id, ranked.c.game_rank).all()
+            for row in rows:
+                recent_rows[row.player_id].append(row)
+        recent_stats = {
+            player_id: rows_to_columns(rows, ['season', 'week'] + self.MODEL_STAT_COLUMNS)
+            for player_id, rows in recent_rows.items()
+        }
+
+        # Team totals for every team-week any of those games touch
+        team_totals = {}
+        teams = {p.team for p in players.values()}
+        games = {(row.season, row.week) for rows in recent_rows.values() for row in rows}
+        if teams and games:
+            totals = db.session.query(
+                TeamOffenseWeekly.team,
+                TeamOffenseWeekly.season,
+                TeamOffenseWeekly.week,
+                *[getattr(TeamOffenseWeekly, column) for column in self.SHARE_STAT_COLUMNS]
+            ).filter(
+                TeamOffenseWeekly.team.in_(teams),
+                tuple_(TeamOffenseWeekly.season, TeamOffenseWeekly.week).in_(list(games))
+            ).all()
+            for row in totals:
+                team_totals[(row.team, row.season, row.week)] = {
+                    column: getattr(row, column) or 0 for column in self.SHARE_STAT_COLUMNS
+                }
+
+        # Current season defensive games for every opponent
+        defense_rows = {team_abbr: [] for team_abbr in opponents}
+        if opponents:
+            for row in self._defense_query(self.CURRENT_SEASON).filter(Team.team_abbr.in_(opponents)).all():
+                defense_rows[row.team_abbr].append(row)
+        defense = {
+            team_abbr: rows_to_columns(rows, ['week'] + DEFENSE_STAT_COLUMNS)
+            for team_abbr, rows in defense_rows.items()
+        }
+
+        self._preloaded.update({
+            'recent_stats': recent_stats,
+            'teams': teams,
+            'team_totals': team_totals,
+            'defense': defense
+        })
+
+    def _stats_query(self):
+        """Query for the PlayerStats columns the model uses (no ORM objects)"""
+        return db.session.query(
+            PlayerStats.player_id,
+            PlayerStats.season,
+            PlayerStats.week,
+            *[getattr(PlayerStats, column) for column in self.MODEL_STAT_COLUMNS]
+        )
+
+    def _defense_query(self, season):
+        """Query for a season's weekly defensive rows, most recent week first"""
+        return db.session.query(
+            Team.team_abbr,
+            TeamStats.week,
+            *[getattr(TeamStats, column) for column in DEFENSE_STAT_COLUMNS]
+        ).join(
+            Team, Team.id == TeamStats.team_id
+        ).filter(
+            TeamStats.season == season,
+            TeamStats.week.isnot(None)
+        ).order_by(TeamStats.week.desc())
+
+    def _get_player(self, player_id):
+        """Look up a player, preferring preloaded rows"""
+        if self._preloaded is not None and player_id in self._preloaded['players']:
+            return self._preloaded['players'][player_id]
+        return Player.query.get(player_id)
+
+    def _get_recent_stats(self, player_id, limit=20):
+        """
+        Get a player's most recent games, newest first
+        Served from the stats store when available, then preloaded rows, then the database
+
+        Returns:
+            Dictionary of arrays (season, week and MODEL_STAT_COLUMNS)
+        """
+        store = get_stats_store()
+        if store is not None:
+            return store.recent_stats(player_id, limit)
+
+        if (self._preloaded is not None and player_id in self._preloaded['recent_stats']
+                and limit <= self._preloaded['limit']):
+            return {
+                column: values[:limit]
+                for column, values in self._preloaded['recent_stats'][player_id].items()
+            }
+
+        rows = self._stats_query().filter(
+            PlayerStats.player_id == player_id,
+            PlayerStats.week.isnot(None)
+        ).order_by(
+            PlayerStats.season.desc(),
+            PlayerStats.week.desc()
+        ).limit(limit).all()
+
+        return rows_to_columns(rows, ['season', 'week'] + self.MODEL_STAT_COLUMNS)
+
+    def _get_defense_stats(self, team_abbr, season):
+        """
+        Get a team's defensive games for a season, newest first
+
+        Returns:
+            Dictionary of arrays (week and DEFENSE_STAT_COLUMNS)
+        """
+        store = get_stats_store()
+        if store is not None:
+            return store.defense_stats(team_abbr, season)
+
+        if (self._preloaded is not None and season == self.CURRENT_SEASON
+                and team_abbr in self._preloaded['defense']):
+            return self._preloaded['defense'][team_abbr]
+
+        rows = self._defense_query(season).filter(Team.team_abbr == team_abbr).all()
+        return rows_to_columns(rows, ['week'] + DEFENSE_STAT_COLUMNS)
 
     def get_team_offensive_stats(self, team_abbr, season=2025):
         """
@@ -50,25 +298,32 @@ class PredictionService:
                 - rush_rate: Percentage of offense that is rushing (0-1)
                 - total_games: Number of games played
         """
-        # Get all players on this team
-        players = Player.query.filter_by(team=team_abbr).all()
+        cache_key = (team_abbr, season)
+        version = self._sync_context_caches()
+        with self._cache_lock:
+            if cache_key in self._team_offense_cache:
+                cached = self._team_offense_cache[cache_key]
+                return dict(cached) if cached else None
 
-        if not players:
-            return None
+        team_stats = self._calculate_team_offensive_stats(team_abbr, season)
 
-        # Get all player stats for this season, grouped by week
-        player_ids = [p.id for p in players]
+        with self._cache_lock:
+            # Skip storing if the caches moved to a newer version meanwhile
+            if self._cache_version == version:
+                self._team_offense_cache[cache_key] = team_stats
 
-        # Query to get stats per week
+        return dict(team_stats) if team_stats else None
+
+    def _calculate_team_offensive_stats(self, team_abbr, season):
+        """Average a team's weekly offensive totals for a season (uncached)"""
+        # Team-week totals are maintained on import in team_offense_weekly
         stats_by_week = db.session.query(
-            PlayerStats.week,
-            func.sum(PlayerStats.passing_yards).label('team_passing'),
-            func.sum(PlayerStats.rushing_yards).label('team_rushing')
+            TeamOffenseWeekly.passing_yards.label('team_passing'),
+            TeamOffenseWeekly.rushing_yards.label('team_rushing')
         ).filter(
-            PlayerStats.player_id.in_(player_ids),
-            PlayerStats.season == season,
-            PlayerStats.week.isnot(None)
-        ).group_by(PlayerStats.week).all()
+            TeamOffenseWeekly.team == team_abbr,
+            TeamOffenseWeekly.season == season
+        ).all()
 
         if not stats_by_week:
             return None
@@ -96,6 +351,21 @@ class PredictionService:
         Returns:
             Dictionary with league average pass_rate and rush_rate
         """
+        version = self._sync_context_caches()
+        with self._cache_lock:
+            if season in self._league_splits_cache:
+                return dict(self._league_splits_cache[season])
+
+        league_splits = self._calculate_league_average_splits(season)
+
+        with self._cache_lock:
+            if self._cache_version == version:
+                self._league_splits_cache[season] = league_splits
+
+        return dict(league_splits)
+
+    def _calculate_league_average_splits(self, season):
+        """Average every team's offensive split for a season (uncached)"""
         # Get all teams
         teams = Team.query.all()
 
@@ -116,190 +386,151 @@ class PredictionService:
             'rush_rate': round(np.mean(rush_rates), 3)
         }
 
-    def get_player_yard_share(self, player_id, stat_type='receiving_yards', limit=20):
+    def get_team_weekly_totals(self, team_abbr, games, stat_columns):
         """
-        Calculate player's share of team's total yards with time weighting
+        Fetch a team's summed stats for many games in a single query
 
         Args:
-            player_id: Player database ID
-            stat_type: 'receiving_yards' or 'rushing_yards'
-            limit: Number of recent games to analyze
+            team_abbr: Team abbreviation (e.g., 'LAR')
+            games: List of (season, week) tuples to fetch totals for
+            stat_columns: PlayerStats column names to sum (e.g., ['targets'])
 
         Returns:
-            Weighted average of player's yard share (0-1)
+            Dictionary mapping (season, week) to {column: team total}
         """
-        player = Player.query.get(player_id)
-        if not player:
-            return 0.0
-
-        # Get player's recent games
-        player_stats = PlayerStats.query.filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).order_by(
-            PlayerStats.season.desc(),
-            PlayerStats.week.desc()
-        ).limit(limit).all()
-
-        if not player_stats:
-            return 0.0
-
-        # Get team players
-        team_players = Player.query.filter_by(team=player.team).all()
-        team_player_ids = [p.id for p in team_players]
-
-        yard_shares = []
-        games_data = []
-
-        for stat in player_stats:
-            # Get player's yards for this game
-            if stat_type == 'receiving_yards':
-                player_yards = stat.receiving_yards or 0
-            else:  # rushing_yards
-                player_yards = stat.rushing_yards or 0
-
-            # Get team's total yards for this game/week
-            if stat_type == 'receiving_yards':
-                team_total = db.session.query(
-                    func.sum(PlayerStats.receiving_yards)
-                ).filter(
-                    PlayerStats.player_id.in_(team_player_ids),
-                    PlayerStats.season == stat.season,
-                    PlayerStats.week == stat.week
-                ).scalar() or 0
-            else:  # rushing_yards
-                team_total = db.session.query(
-                    func.sum(PlayerStats.rushing_yards)
-                ).filter(
-                    PlayerStats.player_id.in_(team_player_ids),
-                    PlayerStats.season == stat.season,
-                    PlayerStats.week == stat.week
-                ).scalar() or 0
-
-            # Calculate share
-            if team_total > 0:
-                yard_shares.append(player_yards / team_total)
-            else:
-                yard_shares.append(0.0)
-
-            games_data.append({
-                'season': stat.season,
-                'week': stat.week
-            })
+        if not games:
+            return {}
 
-        if not yard_shares:
-            return 0.0
+        store = get_stats_store()
+        if store is not None:
+            return store.team_weekly_totals(team_abbr, games, stat_columns)
 
-        # Calculate time weights
-        current_season = games_data[0]['season']
-        current_week = games_data[0]['week']
-        weights = self.calculate_time_weights(games_data, current_season, current_week)
+        if (self._preloaded is not None and team_abbr in self._preloaded['teams']
+                and set(stat_columns) <= set(self.SHARE_STAT_COLUMNS)):
+            team_totals = self._preloaded['team_totals']
+            return {
+                (season, week): {column: team_totals[(team_abbr, season, week)][column] for column in stat_columns}
+                for season, week in set(games)
+                if (team_abbr, season, week) in team_totals
+            }
 
-        # Weighted average yard share
-        weighted_share = np.average(yard_shares, weights=weights)
+        # Indexed point reads from the materialized team-week totals
+        totals = db.session.query(
+            TeamOffenseWeekly.season,
+            TeamOffenseWeekly.week,
+            *[getattr(TeamOffenseWeekly, column) for column in stat_columns]
+        ).filter(
+            TeamOffenseWeekly.team == team_abbr,
+            tuple_(TeamOffenseWeekly.season, TeamOffenseWeekly.week).in_(list(set(games)))
+        ).all()
 
-        return round(weighted_share, 4)
+        return {
+            (row.season, row.week): {column: getattr(row, column) or 0 for column in stat_columns}
+            for row in totals
+        }
 
-    def get_player_target_share(self, player_id, limit=20):
+    def get_player_share(self, player_id, stat_column, limit=20):
         """
-        Calculate player's share of team's total targets with time weighting
+        Calculate player's share of a team stat with time weighting
+        Team totals for every game are fetched in one lookup and the
+        per-game shares are computed on NumPy arrays
 
         Args:
             player_id: Player database ID
+            stat_column: PlayerStats column to compare (e.g., 'receiving_yards', 'targets')
             limit: Number of recent games to analyze
 
         Returns:
-            Weighted average of player's target share (0-1)
+            Weighted average of player's share (0-1)
         """
-        player = Player.query.get(player_id)
+        player = self._get_player(player_id)
         if not player:
             return 0.0
 
         # Get player's recent games
-        player_stats = PlayerStats.query.filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).order_by(
-            PlayerStats.season.desc(),
-            PlayerStats.week.desc()
-        ).limit(limit).all()
+        player_stats = self._get_recent_stats(player_id, limit)
 
-        if not player_stats:
+        if not len(player_stats['season']):
             return 0.0
 
-        # Get team players
-        team_players = Player.query.filter_by(team=player.team).all()
-        team_player_ids = [p.id for p in team_players]
+        games = list(zip(player_stats['season'].tolist(), player_stats['week'].tolist()))
+        team_totals = self.get_team_weekly_totals(player.team, games, [stat_column])
 
-        target_shares = []
-        games_data = []
+        player_values = player_stats[stat_column].astype(float)
+        team_values = np.array(
+            [team_totals.get(game, {}).get(stat_column, 0) for game in games], dtype=float
+        )
 
-        for stat in player_stats:
-            player_targets = stat.targets or 0
+        # Share is 0 for games where the team recorded nothing
+        shares = np.divide(
+            player_values, team_values,
+            out=np.zeros_like(player_values), where=team_values > 0
+        )
 
-            # Get team's total targets for this game/week
-            team_total_targets = db.session.query(
-                func.sum(PlayerStats.targets)
-            ).filter(
-                PlayerStats.player_id.in_(team_player_ids),
-                PlayerStats.season == stat.season,
-                PlayerStats.week == stat.week
-            ).scalar() or 0
-
-            # Calculate share
-            if team_total_targets > 0:
-                target_shares.append(player_targets / team_total_targets)
-            else:
-                target_shares.append(0.0)
+        # Calculate time weights
+        weights = self.calculate_time_weights_array(player_stats['season'], player_stats['week'])
 
-            games_data.append({
-                'season': stat.season,
-                'week': stat.week
-            })
+        # Weighted average share
+        weighted_share = np.average(shares, weights=weights)
 
-        if not target_shares:
-            return 0.0
+        return round(weighted_share, 4)
 
-        # Calculate time weights
-        current_season = games_data[0]['season']
-        current_week = games_data[0]['week']
-        weights = self.calculate_time_weights(games_data, current_season, current_week)
+    def get_player_yard_share(self, player_id, stat_type='receiving_yards', limit=20):
+        """
+        Calculate player's share of team's total yards with time weighting
 
-        # Weighted average target share
-        weighted_share = np.average(target_shares, weights=weights)
+        Args:
+            player_id: Player database ID
+            stat_type: 'receiving_yards' or 'rushing_yards'
+            limit: Number of recent games to analyze
 
-        return round(weighted_share, 4)
+        Returns:
+            Weighted average of player's yard share (0-1)
+        """
+        stat_column = 'receiving_yards' if stat_type == 'receiving_yards' else 'rushing_yards'
+        return self.get_player_share(player_id, stat_column, limit=limit)
+
+    def get_player_target_share(self, player_id, limit=20):
+        """
+        Calculate player's share of team's total targets with time weighting
+
+        Args:
+            player_id: Player database ID
+            limit: Number of recent games to analyze
+
+        Returns:
+            Weighted average of player's target share (0-1)
+        """
+        return self.get_player_share(player_id, 'targets', limit=limit)
 
     def calculate_time_weights(self, games_data, current_season, current_week):
         """
         Calculate time-based weights for each game
         Recent games and current season weighted higher
         """
-        weights = []
-
-        for game in games_data:
-            game_season = game['season']
-            game_week = game['week']
-
-            # Base weight
-            weight = 1.0
+        seasons = np.array([game['season'] for game in games_data])
+        weeks = np.array([game['week'] for game in games_data])
+        return self.calculate_time_weights_array(seasons, weeks, current_season, current_week)
 
-            # Current season gets 2x weight
-            if game_season == current_season:
-                weight *= self.CURRENT_SEASON_WEIGHT
+    def calculate_time_weights_array(self, seasons, weeks, current_season=None, current_week=None):
+        """
+        Vectorized time weights for arrays of game seasons and weeks
+        Defaults to treating the first (most recent) game as the current one
+        """
+        if current_season is None:
+            current_season = seasons[0]
+        if current_week is None:
+            current_week = weeks[0]
 
-                # Within current season, apply weekly decay
-                weeks_ago = current_week - game_week
-                if weeks_ago > 0:
-                    weight *= (self.WEEK_DECAY_FACTOR ** weeks_ago)
-            else:
-                # Past seasons: decay based on years ago
-                seasons_ago = current_season - game_season
-                weight *= (0.7 ** seasons_ago)  # 70% weight per season back
+        # Current season gets 2x weight, with weekly decay within the season
+        weeks_ago = np.maximum(current_week - weeks, 0)
+        current_weights = self.CURRENT_SEASON_WEIGHT * (self.WEEK_DECAY_FACTOR ** weeks_ago)
 
-            weights.append(weight)
+        # Past seasons: 70% weight per season back
+        seasons_ago = current_season - seasons
+        past_weights = 0.7 ** seasons_ago.astype(float)
 
-        return np.array(weights)
+        return np.where(seasons == current_season, current_weights, past_weights)
 
     def get_player_stats_weighted(self, player_id, stat_type='receiving_yards', limit=20):
         """
@@ -307,48 +538,21 @@ class PredictionService:
         Returns: weighted mean, weighted std, raw values
         """
         # Get recent games
-        stats = PlayerStats.query.filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).order_by(
-            PlayerStats.season.desc(),
-            PlayerStats.week.desc()
-        ).limit(limit).all()
+        stats = self._get_recent_stats(player_id, limit)
 
-        if not stats:
+        if not len(stats['season']):
             return 0, 0, []
 
-        # Extract values and metadata
-        values = []
-        games_data = []
-
-        for stat in stats:
-            if stat_type == 'receiving_yards':
-                values.append(stat.receiving_yards or 0)
-            elif stat_type == 'rushing_yards':
-                values.append(stat.rushing_yards or 0)
-            elif stat_type == 'passing_yards':
-                values.append(stat.passing_yards or 0)
-            elif stat_type == 'total_yards':
-                values.append((stat.receiving_yards or 0) + (stat.rushing_yards or 0))
-            elif stat_type == 'touchdowns':
-                values.append((stat.receiving_touchdowns or 0) + (stat.rushing_touchdowns or 0))
-            elif stat_type == 'passing_touchdowns':
-                values.append(stat.passing_touchdowns or 0)
-            elif stat_type == 'interceptions':
-                values.append(stat.interceptions or 0)
-
-            games_data.append({
-                'season': stat.season,
-                'week': stat.week
-            })
-
-        values = np.array(values)
-        current_season = games_data[0]['season']
-        current_week = games_data[0]['week']
+        # Extract values for the requested stat
+        if stat_type == 'total_yards':
+            values = stats['receiving_yards'] + stats['rushing_yards']
+        elif stat_type == 'touchdowns':
+            values = stats['receiving_touchdowns'] + stats['rushing_touchdowns']
+        else:
+            values = stats[stat_type]
 
         # Calculate time weights
-        weights = self.calculate_time_weights(games_data, current_season, current_week)
+        weights = self.calculate_time_weights_array(stats['season'], stats['week'])
 
         # Weighted statistics
         weighted_mean = np.average(values, weights=weights)
@@ -370,40 +574,86 @@ class PredictionService:
         Returns:
             Tuple of (average yards allowed, std deviation)
         """
-        # Get team
-        team = Team.query.filter_by(team_abbr=team_abbr).first()
-        if not team:
-            return None, None
-
         # Get current season - now using 2025 data from ESPN API
-        current_season = 2025
-
-        # Build query for defensive stats
-        query = TeamStats.query.filter(
-            TeamStats.team_id == team.id,
-            TeamStats.week.isnot(None)
-        )
+        current_season = self.CURRENT_SEASON
 
         # Restrict to current season only (defenses change year to year)
         if current_season_only:
-            query = query.filter(TeamStats.season == current_season)
-
-        stats = query.order_by(TeamStats.week.desc()).all()
+            stats = self._get_defense_stats(team_abbr, current_season)
+        else:
+            rows = db.session.query(
+                *[getattr(TeamStats, column) for column in DEFENSE_STAT_COLUMNS]
+            ).join(Team).filter(
+                Team.team_abbr == team_abbr,
+                TeamStats.week.isnot(None)
+            ).all()
+            stats = rows_to_columns(rows, DEFENSE_STAT_COLUMNS)
 
-        if not stats:
+        if not len(stats['points_against']):
             # No stats available for this team/season
             return None, None
 
         # Extract values based on stat type
         if stat_type == 'passing':
-            values = [s.passing_yards_against or 0 for s in stats]
+            values = stats['passing_yards_against']
         elif stat_type == 'rushing':
-            values = [s.rushing_yards_against or 0 for s in stats]
+            values = stats['rushing_yards_against']
         else:
-            values = [s.yards_against or 0 for s in stats]
+            values = stats['yards_against']
 
         return np.mean(values), np.std(values)
 
+    def normal_benchmark_probabilities(self, mean, std, benchmarks):
+        """
+        Probability (%) of exceeding each benchmark under a normal distribution
+        Queued for vectorized evaluation when running inside predict_batch
+        """
+        if self._probability_batch is not None:
+            return self._probability_batch.normal(mean, std, benchmarks)
+        return to_percentages(normal_exceedance([mean], [std], benchmarks)[0], benchmarks)
+
+    def poisson_threshold_probabilities(self, lam, thresholds):
+        """
+        Probability (%) of at least each count under a Poisson distribution
+        Queued for vectorized evaluation when running inside predict_batch
+        """
+        if self._probability_batch is not None:
+            return self._probability_batch.poisson(lam, thresholds)
+        return to_percentages(poisson_at_least([lam], thresholds)[0], thresholds)
+
+    def get_opponent_td_factor(self, team_abbr):
+        """
+        Scale factor for TD expectation from opponent's current season points allowed
+
+        Args:
+            team_abbr: Opponent team abbreviation
+
+        Returns:
+            Points allowed relative to league average (~22 points/game), 1.0 if unknown
+        """
+        recent_stats = self._get_defense_stats(team_abbr, self.CURRENT_SEASON)
+
+        if not len(recent_stats['points_against']):
+            return 1.0
+
+        avg_points_allowed = np.mean(recent_stats['points_against'])
+        # Normalize to TD factor (league avg ~22 points/game)
+        return avg_points_allowed / 22.0 if avg_points_allowed > 0 else 1.0
+
+    @staticmethod
+    def _no_data_prediction(benchmarks, projection_key):
+        """
+        Prediction for a player without data (or without the stat): every benchmark
+        at 0% and a point-mass distribution at 0, in the same shape as a fitted one
+        """
+        return {
+            'probabilities': {benchmark: 0.0 for benchmark in benchmarks},
+            projection_key: 0.0,
+            'player_avg': 0.0,
+            'distribution': normal_distribution(0.0, 0.0)
+        }
+
+    @cached_result
     def predict_yardage_probabilities(self, player_id, opponent_team, stat_type='receiving_yards'):
         """
         Predict probability of hitting various yardage benchmarks
@@ -421,9 +671,9 @@ class PredictionService:
             Dictionary with probabilities for each benchmark
         """
         # Get player info
-        player = Player.query.get(player_id)
+        player = self._get_player(player_id)
         if not player:
-            return {benchmark: 0.0 for benchmark in self.YARDAGE_BENCHMARKS}
+            return self._no_data_prediction(self.YARDAGE_BENCHMARKS, 'projected_yards')
 
         # Get player stats
         player_mean, player_std, recent_values = self.get_player_stats_weighted(
@@ -431,16 +681,16 @@ class PredictionService:
         )
 
         if player_mean == 0:
-            return {benchmark: 0.0 for benchmark in self.YARDAGE_BENCHMARKS}
+            return self._no_data_prediction(self.YARDAGE_BENCHMARKS, 'projected_yards')
 
         # Get player's yard share
         player_yard_share = self.get_player_yard_share(player_id, stat_type=stat_type, limit=20)
 
         # Get team offensive stats
-        team_offense = self.get_team_offensive_stats(player.team, season=2025)
+        team_offense = self.get_team_offensive_stats(player.team, season=self.CURRENT_SEASON)
 
         # Get league average splits
-        league_splits = self.get_league_average_splits(season=2025)
+        league_splits = self.get_league_average_splits(season=self.CURRENT_SEASON)
 
         # Get opponent defensive stats
         def_type = 'passing' if 'receiving' in stat_type else 'rushing'
@@ -487,16 +737,9 @@ class PredictionService:
             player_std = max(player_std, adjusted_mean * 0.3)  # At least 30% variance
 
         # Calculate probabilities using normal distribution
-        probabilities = {}
-
-        for benchmark in self.YARDAGE_BENCHMARKS:
-            # Z-score for benchmark
-            z_score = (benchmark - adjusted_mean) / player_std if player_std > 0 else 0
-
-            # Probability of exceeding benchmark (1 - CDF)
-            prob = 1 - scipy_stats.norm.cdf(z_score)
-
-            probabilities[benchmark] = round(prob * 100, 2)  # Convert to percentage
+        probabilities = self.normal_benchmark_probabilities(
+            adjusted_mean, player_std, self.YARDAGE_BENCHMARKS
+        )
 
         return {
             'probabilities': probabilities,
@@ -504,9 +747,11 @@ class PredictionService:
             'player_avg': round(player_mean, 1),
             'player_yard_share': round(player_yard_share * 100, 1) if player_yard_share else None,
             'opponent_avg_allowed': round(def_mean, 1) if def_mean else None,
-            'consistency_score': round(1 / (1 + player_std / player_mean), 2) if player_mean > 0 else 0
+            'consistency_score': round(1 / (1 + player_std / player_mean), 2) if player_mean > 0 else 0,
+            'distribution': normal_distribution(adjusted_mean, player_std)
         }
 
+    @cached_result
     def predict_touchdown_probability(self, player_id, opponent_team, position='WR'):
         """
         Predict probability of scoring a touchdown
@@ -527,31 +772,13 @@ class PredictionService:
         if player_td_avg == 0:
             return {
                 'td_probability': 0.0,
-                'avg_tds_per_game': 0.0
+                'avg_tds_per_game': 0.0,
+                'distribution': poisson_distribution(0.0)
             }
 
         # Get opponent defensive stats (points allowed as proxy for TD defense)
         # Use current season only since defenses fluctuate year to year
-        team = Team.query.filter_by(team_abbr=opponent_team).first()
-        if team:
-            # Get current season - now using 2025 data from ESPN API
-            current_season = 2025
-
-            # Query current season defensive stats only
-            recent_stats = TeamStats.query.filter(
-                TeamStats.team_id == team.id,
-                TeamStats.season == current_season,
-                TeamStats.week.isnot(None)
-            ).order_by(TeamStats.week.desc()).all()
-
-            if recent_stats:
-                avg_points_allowed = np.mean([s.points_against or 0 for s in recent_stats])
-                # Normalize to TD factor (league avg ~22 points/game)
-                td_factor = avg_points_allowed / 22.0 if avg_points_allowed > 0 else 1.0
-            else:
-                td_factor = 1.0
-        else:
-            td_factor = 1.0
+        td_factor = self.get_opponent_td_factor(opponent_team)
 
         # Adjust TD expectation
         adjusted_td_avg = player_td_avg * td_factor
@@ -564,9 +791,49 @@ class PredictionService:
             'td_probability': round(td_prob * 100, 2),
             'avg_tds_per_game': round(adjusted_td_avg, 2),
             'player_td_avg': round(player_td_avg, 2),
-            'consistency': round(1 / (1 + player_td_std / player_td_avg), 2) if player_td_avg > 0 else 0
+            'consistency': round(1 / (1 + player_td_std / player_td_avg), 2) if player_td_avg > 0 else 0,
+            'distribution': poisson_distribution(adjusted_td_avg)
         }
 
+    @cached_result
+    def predict_touchdown_type_probability(self, player_id, opponent_team, stat_type='rushing_touchdowns'):
+        """
+        Predict probability of scoring a rushing or a receiving touchdown
+        Anytime touchdowns are a Poisson, so each kind is a Poisson whose rate is the
+        anytime rate times that kind's share of the player's weighted touchdown average
+
+        Args:
+            player_id: Player database ID
+            opponent_team: Opponent team abbreviation
+            stat_type: 'rushing_touchdowns' or 'receiving_touchdowns'
+
+        Returns:
+            Touchdown probability as percentage
+        """
+        player = self._get_player(player_id)
+        anytime = self.predict_touchdown_probability(
+            player_id, opponent_team, position=player.position if player else 'WR'
+        )
+
+        player_td_avg, _, _ = self.get_player_stats_weighted(player_id, stat_type='touchdowns', limit=20)
+        if player_td_avg == 0:
+            return {
+                'td_probability': 0.0,
+                'avg_tds_per_game': 0.0,
+                'distribution': poisson_distribution(0.0)
+            }
+
+        type_avg, _, _ = self.get_player_stats_weighted(player_id, stat_type=stat_type, limit=20)
+        adjusted_avg = anytime['distribution']['lambda'] * type_avg / player_td_avg
+
+        return {
+            'td_probability': round((1 - np.exp(-adjusted_avg)) * 100, 2),
+            'avg_tds_per_game': round(adjusted_avg, 2),
+            'share_of_tds': round(type_avg / player_td_avg * 100, 1),
+            'distribution': poisson_distribution(adjusted_avg)
+        }
+
+    @cached_result
     def predict_qb_passing_probabilities(self, player_id, opponent_team):
         """
         Predict QB passing yards probabilities using QB-specific benchmarks
@@ -583,9 +850,9 @@ class PredictionService:
             Dictionary with probabilities for each QB passing benchmark
         """
         # Get player info
-        player = Player.query.get(player_id)
+        player = self._get_player(player_id)
         if not player:
-            return {benchmark: 0.0 for benchmark in self.QB_PASSING_BENCHMARKS}
+            return self._no_data_prediction(self.QB_PASSING_BENCHMARKS, 'projected_yards')
 
         # Get player passing stats
         player_mean, player_std, recent_values = self.get_player_stats_weighted(
@@ -593,13 +860,13 @@ class PredictionService:
         )
 
         if player_mean == 0:
-            return {benchmark: 0.0 for benchmark in self.QB_PASSING_BENCHMARKS}
+            return self._no_data_prediction(self.QB_PASSING_BENCHMARKS, 'projected_yards')
 
         # Get team offensive stats
-        team_offense = self.get_team_offensive_stats(player.team, season=2025)
+        team_offense = self.get_team_offensive_stats(player.team, season=self.CURRENT_SEASON)
 
         # Get league average splits
-        league_splits = self.get_league_average_splits(season=2025)
+        league_splits = self.get_league_average_splits(season=self.CURRENT_SEASON)
 
         # Get opponent defensive stats (passing yards allowed)
         def_mean, def_std = self.get_defensive_stats(opponent_team, stat_type='passing')
@@ -635,12 +902,9 @@ class PredictionService:
             player_std = max(player_std, adjusted_mean * 0.25)
 
         # Calculate probabilities
-        probabilities = {}
-
-        for benchmark in self.QB_PASSING_BENCHMARKS:
-            z_score = (benchmark - adjusted_mean) / player_std if player_std > 0 else 0
-            prob = 1 - scipy_stats.norm.cdf(z_score)
-            probabilities[benchmark] = round(prob * 100, 2)
+        probabilities = self.normal_benchmark_probabilities(
+            adjusted_mean, player_std, self.QB_PASSING_BENCHMARKS
+        )
 
         return {
             'probabilities': probabilities,
@@ -648,9 +912,11 @@ class PredictionService:
             'player_avg': round(player_mean, 1),
             'team_pass_rate': round(team_offense['pass_rate'] * 100, 1) if team_offense else None,
             'opponent_avg_allowed': round(def_mean, 1) if def_mean else None,
-            'consistency_score': round(1 / (1 + player_std / player_mean), 2) if player_mean > 0 else 0
+            'consistency_score': round(1 / (1 + player_std / player_mean), 2) if player_mean > 0 else 0,
+            'distribution': normal_distribution(adjusted_mean, player_std)
         }
 
+    @cached_result
     def predict_qb_passing_touchdowns(self, player_id, opponent_team):
         """
         Predict QB passing touchdown probabilities for multiple thresholds
@@ -669,49 +935,29 @@ class PredictionService:
 
         if player_td_avg == 0:
             return {
-                'td_probabilities': {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0},
-                'avg_tds_per_game': 0.0
+                'td_probabilities': {threshold: 0.0 for threshold in self.QB_TD_THRESHOLDS},
+                'avg_tds_per_game': 0.0,
+                'distribution': poisson_distribution(0.0)
             }
 
         # Get opponent defensive stats (points allowed as proxy)
-        team = Team.query.filter_by(team_abbr=opponent_team).first()
-        if team:
-            current_season = 2025
-            recent_stats = TeamStats.query.filter(
-                TeamStats.team_id == team.id,
-                TeamStats.season == current_season,
-                TeamStats.week.isnot(None)
-            ).order_by(TeamStats.week.desc()).all()
-
-            if recent_stats:
-                avg_points_allowed = np.mean([s.points_against or 0 for s in recent_stats])
-                td_factor = avg_points_allowed / 22.0 if avg_points_allowed > 0 else 1.0
-            else:
-                td_factor = 1.0
-        else:
-            td_factor = 1.0
+        td_factor = self.get_opponent_td_factor(opponent_team)
 
         # Adjust TD expectation
         adjusted_td_avg = player_td_avg * td_factor
 
         # Calculate probabilities for multiple thresholds using Poisson distribution
-        td_probabilities = {}
-        for threshold in [1, 2, 3, 4]:
-            # P(X >= threshold) = 1 - P(X < threshold) = 1 - sum(P(X=k) for k=0 to threshold-1)
-            prob_less_than = sum(
-                (adjusted_td_avg ** k) * np.exp(-adjusted_td_avg) / np.math.factorial(k)
-                for k in range(threshold)
-            )
-            prob_at_least = 1 - prob_less_than
-            td_probabilities[threshold] = round(prob_at_least * 100, 2)
+        td_probabilities = self.poisson_threshold_probabilities(adjusted_td_avg, self.QB_TD_THRESHOLDS)
 
         return {
             'td_probabilities': td_probabilities,
             'avg_tds_per_game': round(adjusted_td_avg, 2),
             'player_td_avg': round(player_td_avg, 2),
-            'consistency': round(1 / (1 + player_td_std / player_td_avg), 2) if player_td_avg > 0 else 0
+            'consistency': round(1 / (1 + player_td_std / player_td_avg), 2) if player_td_avg > 0 else 0,
+            'distribution': poisson_distribution(adjusted_td_avg)
         }
 
+    @cached_result
     def predict_qb_interceptions(self, player_id):
         """
         Predict QB interception probability
@@ -733,7 +979,8 @@ class PredictionService:
                 'avg_ints_per_game': 0.0,
                 'prob_0_ints': 100.0,
                 'prob_1_int': 0.0,
-                'prob_2plus_ints': 0.0
+                'prob_2plus_ints': 0.0,
+                'distribution': poisson_distribution(0.0)
             }
 
         # Use Poisson distribution for interception probabilities
@@ -750,9 +997,11 @@ class PredictionService:
             'avg_ints_per_game': round(player_int_avg, 2),
             'prob_0_ints': round(prob_0 * 100, 2),
             'prob_1_int': round(prob_1 * 100, 2),
-            'prob_2plus_ints': round(prob_2plus * 100, 2)
+            'prob_2plus_ints': round(prob_2plus * 100, 2),
+            'distribution': poisson_distribution(player_int_avg)
         }
 
+    @cached_result
     def predict_receptions_probabilities(self, player_id, opponent_team):
         """
         Predict receptions probabilities for various thresholds
@@ -768,56 +1017,39 @@ class PredictionService:
         Returns:
             Dictionary with probabilities for each reception benchmark
         """
-        # Receptions benchmarks
-        RECEPTIONS_BENCHMARKS = [2, 3, 4, 5, 6, 7, 8, 10, 12, 15]
-
         # Get player info
-        player = Player.query.get(player_id)
+        player = self._get_player(player_id)
         if not player:
-            return {benchmark: 0.0 for benchmark in RECEPTIONS_BENCHMARKS}
+            return self._no_data_prediction(self.RECEPTIONS_BENCHMARKS, 'projected_receptions')
 
         # Get actual reception counts from stats
-        stats = PlayerStats.query.filter(
-            PlayerStats.player_id == player_id,
-            PlayerStats.week.isnot(None)
-        ).order_by(
-            PlayerStats.season.desc(),
-            PlayerStats.week.desc()
-        ).limit(20).all()
+        stats = self._get_recent_stats(player_id, 20)
 
-        if not stats:
-            return {benchmark: 0.0 for benchmark in RECEPTIONS_BENCHMARKS}
+        if not len(stats['season']):
+            return self._no_data_prediction(self.RECEPTIONS_BENCHMARKS, 'projected_receptions')
 
         # Extract reception values
-        reception_values = [stat.receptions or 0 for stat in stats]
+        reception_values = stats['receptions']
 
         # Calculate time weights
-        games_data = [{'season': stat.season, 'week': stat.week} for stat in stats]
-        current_season = games_data[0]['season']
-        current_week = games_data[0]['week']
-        weights = self.calculate_time_weights(games_data, current_season, current_week)
+        weights = self.calculate_time_weights_array(stats['season'], stats['week'])
 
         # Weighted statistics
-        reception_values = np.array(reception_values)
         weighted_mean = np.average(reception_values, weights=weights)
         weighted_variance = np.average((reception_values - weighted_mean) ** 2, weights=weights)
         weighted_std = np.sqrt(weighted_variance)
 
         if weighted_mean == 0:
-            return {
-                'probabilities': {benchmark: 0.0 for benchmark in RECEPTIONS_BENCHMARKS},
-                'projected_receptions': 0.0,
-                'player_avg': 0.0
-            }
+            return self._no_data_prediction(self.RECEPTIONS_BENCHMARKS, 'projected_receptions')
 
         # Get player's target share
         player_target_share = self.get_player_target_share(player_id, limit=20)
 
         # Get team offensive stats
-        team_offense = self.get_team_offensive_stats(player.team, season=2025)
+        team_offense = self.get_team_offensive_stats(player.team, season=self.CURRENT_SEASON)
 
         # Get league average splits
-        league_splits = self.get_league_average_splits(season=2025)
+        league_splits = self.get_league_average_splits(season=self.CURRENT_SEASON)
 
         # Get opponent defensive stats (passing defense as proxy)
         def_mean, def_std = self.get_defensive_stats(opponent_team, stat_type='passing')
@@ -855,12 +1087,9 @@ class PredictionService:
             weighted_std = max(weighted_std, adjusted_mean * 0.3)
 
         # Calculate probabilities using normal distribution
-        probabilities = {}
-
-        for benchmark in RECEPTIONS_BENCHMARKS:
-            z_score = (benchmark - adjusted_mean) / weighted_std if weighted_std > 0 else 0
-            prob = 1 - scipy_stats.norm.cdf(z_score)
-            probabilities[benchmark] = round(prob * 100, 2)
+        probabilities = self.normal_benchmark_probabilities(
+            adjusted_mean, weighted_std, self.RECEPTIONS_BENCHMARKS
+        )
 
         return {
             'probabilities': probabilities,
@@ -868,9 +1097,11 @@ class PredictionService:
             'player_avg': round(weighted_mean, 1),
             'player_target_share': round(player_target_share * 100, 1) if player_target_share else None,
             'opponent_avg_allowed': round(def_mean, 1) if def_mean else None,
-            'consistency_score': round(1 / (1 + weighted_std / weighted_mean), 2) if weighted_mean > 0 else 0
+            'consistency_score': round(1 / (1 + weighted_std / weighted_mean), 2) if weighted_mean > 0 else 0,
+            'distribution': normal_distribution(adjusted_mean, weighted_std)
         }
 
+    @cached_result
     def get_player_prediction(self, player_id, opponent_team):
         """
         Get complete prediction for a player against an opponent
@@ -879,7 +1110,7 @@ class PredictionService:
         QB predictions include passing yards, passing TDs, and interceptions
         """
         # Get player info
-        player = Player.query.get(player_id)
+        player = self._get_player(player_id)
         if not player:
             return None
 
@@ -935,6 +1166,151 @@ class PredictionService:
             'touchdown_prediction': td_pred
         }
 
+    def predict_market(self, player_id, opponent_team, market):
+        """
+        Run the prediction behind a single market name
+
+        Args:
+            player_id: Player database ID
+            opponent_team: Opponent team abbreviation
+            market: One of BATCH_MARKETS
+
+        Returns:
+            The same payload the matching single-prediction endpoint returns
+        """
+        if market == 'full':
+            return self.get_player_prediction(player_id, opponent_team)
+        if market == 'passing_yards':
+            return self.predict_qb_passing_probabilities(player_id, opponent_team)
+        if market in ('receiving_yards', 'rushing_yards', 'total_yards'):
+            return self.predict_yardage_probabilities(player_id, opponent_team, stat_type=market)
+        if market == 'receptions':
+            return self.predict_receptions_probabilities(player_id, opponent_team)
+        if market == 'touchdown':
+            player = self._get_player(player_id)
+            position = player.position if player else 'WR'
+            return self.predict_touchdown_probability(player_id, opponent_team, position=position)
+        if market in ('rushing_touchdowns', 'receiving_touchdowns'):
+            return self.predict_touchdown_type_probability(player_id, opponent_team, stat_type=market)
+        if market == 'passing_touchdowns':
+            return self.predict_qb_passing_touchdowns(player_id, opponent_team)
+        if market == 'interceptions':
+            return self.predict_qb_interceptions(player_id)
+        raise ValueError(f"Unknown market: {market}")
+
+    def predict_batch(self, items):
+        """
+        Predict many (player, opponent, markets) requests at once
+        Player stats, team totals and opponent defenses are bulk-loaded up front and
+        team offense / league splits are shared through the process-level cache
+
+        Args:
+            items: List of dicts with player_id, opponent and markets (defaults to ['full'])
+
+        Returns:
+            List of result dicts in the same order as items
+        """
+        batch_service = PredictionService()
+        batch_service._probability_batch = ProbabilityBatch()
+        batch_service.preload(
+            [item['player_id'] for item in items],
+            [item['opponent'] for item in items]
+        )
+
+        results = []
+        for item in items:
+            player_id = item['player_id']
+            opponent = item['opponent']
+
+            if not batch_service._get_player(player_id):
+                results.append({
+                    'player_id': player_id,
+                    'opponent': opponent,
+                    'error': 'Player not found'
+                })
+                continue
+
+            results.append({
+                'player_id': player_id,
+                'opponent': opponent,
+                'predictions': {
+                    market: batch_service.predict_market(player_id, opponent, market)
+                    for market in item.get('markets') or ['full']
+                }
+            })
+
+        # Fill every queued benchmark grid in one vectorized pass
+        batch_service._probability_batch.evaluate()
+
+        return results
+
+    def predict_lines(self, items):
+        """
+        Probability of going over or under arbitrary lines (e.g. 67.5 yards)
+        Lines are evaluated exactly from each market's fitted distribution rather
+        than interpolated between benchmarks, and all lines of all items are
+        evaluated together
+
+        Args:
+            items: List of dicts with player_id, opponent, market (one of LINE_MARKETS)
+                   and lines (list of numbers)
+
+        Returns:
+            List of result dicts in the same order as items, each with the fitted
+            distribution and {line, over, under} percentages per line. Over means at
+            or above the line, as for the benchmarks
+        """
+        batch_service = PredictionService()
+        # Benchmark grids are queued but never evaluated: only the distributions are needed
+        batch_service._probability_batch = ProbabilityBatch()
+        batch_service.preload(
+            [item['player_id'] for item in items],
+            [item['opponent'] for item in items]
+        )
+
+        results = []
+        distributions = []
+        lines = []
+        for item in items:
+            player_id = item['player_id']
+            opponent = item['opponent']
+
+            if not batch_service._get_player(player_id):
+                results.append({
+                    'player_id': player_id,
+                    'opponent': opponent,
+                    'market': item['market'],
+                    'error': 'Player not found'
+                })
+                continue
+
+            prediction = batch_service.predict_market(player_id, opponent, item['market'])
+            distribution = prediction['distribution']
+
+            results.append({
+                'player_id': player_id,
+                'opponent': opponent,
+                'market': item['market'],
+                'distribution': distribution,
+                'lines': []
+            })
+            distributions.extend([distribution] * len(item['lines']))
+            lines.extend(item['lines'])
+
+        over = iter(np.round(line_exceedance(distributions, lines) * 100, 2).tolist())
+        for item, result in zip(items, results):
+            if 'error' in result:
+                continue
+            for line in item['lines']:
+                probability = next(over)
+                result['lines'].append({
+                    'line': line,
+                    'over': probability,
+                    'under': round(100 - probability, 2)
+                })
+
+        return results
+
 
 # Singleton instance
 prediction_service = PredictionService()
@@ -0,0 +1,151 @@
+"""
+Vectorized probability kernel for benchmark predictions
+
+Evaluates every benchmark for many players at once from arrays of fitted
+distribution parameters:
+- Yardage and receptions use a normal distribution (mean, std)
+- Touchdowns and interceptions use a Poisson distribution (lambda)
+
+line_exceedance evaluates arbitrary lines from the same parameters.
+
+ProbabilityBatch defers evaluations so a whole slate is priced with one
+scipy call per benchmark grid instead of one call per benchmark.
+"""
+
+import numpy as np
+from scipy import stats as scipy_stats
+
+
+def normal_exceedance(means, stds, thresholds):
+    """
+    Probability of exceeding each threshold under a normal distribution
+
+    Args:
+        means: Array of distribution means (one per player)
+        stds: Array of standard deviations (a std of 0 is a point mass at the
+              mean: 100% at or below it, 0% above, as in line_exceedance)
+        thresholds: Benchmarks to evaluate
+
+    Returns:
+        Array of shape (len(means), len(thresholds)) with probabilities (0-1)
+    """
+    means = np.asarray(means, dtype=float)[:, None]
+    stds = np.asarray(stds, dtype=float)[:, None]
+    thresholds = np.asarray(thresholds, dtype=float)[None, :]
+
+    safe_stds = np.where(stds > 0, stds, 1.0)
+    z_scores = (thresholds - means) / safe_stds
+
+    return np.where(stds > 0, scipy_stats.norm.sf(z_scores), (means >= thresholds).astype(float))
+
+
+def poisson_at_least(lambdas, thresholds):
+    """
+    Probability of at least k events under a Poisson distribution
+
+    Args:
+        lambdas: Array of expected counts per game (one per player)
+        thresholds: Counts to evaluate (e.g., [1, 2, 3, 4])
+
+    Returns:
+        Array of shape (len(lambdas), len(thresholds)) with probabilities (0-1)
+    """
+    lambdas = np.asarray(lambdas, dtype=float)[:, None]
+    counts = np.asarray(thresholds)[None, :]
+
+    # P(X >= k) = P(X > k - 1)
+    return scipy_stats.poisson.sf(counts - 1, lambdas)
+
+
+def line_exceedance(distributions, lines):
+    """
+    Probability of reaching each line under its fitted distribution
+
+    Evaluates arbitrary lines directly instead of reading them off a benchmark
+    grid: normal markets at or above the line, Poisson markets at least
+    ceil(line) events. A zero-std normal or a zero-rate Poisson is a point mass
+    (at the mean, or at 0).
+
+    Args:
+        distributions: Fitted distributions as reported by the predictions
+                       (one per line, entries may repeat)
+        lines: Lines to evaluate
+
+    Returns:
+        Array of probabilities (0-1), one per line
+    """
+    lines = np.asarray(lines, dtype=float)
+    families = np.array([d['family'] for d in distributions], dtype=object)
+    means = np.array([d.get('mean', 0.0) for d in distributions], dtype=float)
+    stds = np.array([d.get('std', 0.0) for d in distributions], dtype=float)
+    lambdas = np.array([d.get('lambda', 0.0) for d in distributions], dtype=float)
+
+    # Point masses first (Poisson distributions have mean 0 here);
+    # the fitted cases below overwrite them
+    probabilities = (means >= lines).astype(float)
+
+    normal = (families == 'normal') & (stds > 0)
+    if normal.any():
+        probabilities[normal] = scipy_stats.norm.sf((lines[normal] - means[normal]) / stds[normal])
+
+    poisson = (families == 'poisson') & (lambdas > 0)
+    if poisson.any():
+        probabilities[poisson] = scipy_stats.poisson.sf(np.ceil(lines[poisson]) - 1, lambdas[poisson])
+
+    return probabilities
+
+
+def normal_distribution(mean, std):
+    """Fitted normal distribution parameters, as reported alongside predictions"""
+    return {'family': 'normal', 'mean': round(float(mean), 4), 'std': round(float(std), 4)}
+
+
+def poisson_distribution(lam):
+    """Fitted Poisson distribution parameters, as reported alongside predictions"""
+    return {'family': 'poisson', 'lambda': round(float(lam), 4)}
+
+
+def to_percentages(probabilities, thresholds):
+    """Map thresholds to probabilities as percentages rounded to 2 decimals"""
+    percentages = np.round(np.asarray(probabilities) * 100, 2).tolist()
+    return dict(zip(thresholds, percentages))
+
+
+class ProbabilityBatch:
+    """
+    Collects benchmark evaluations and runs them together
+    Each call returns an empty dict that is filled in place by evaluate()
+    """
+
+    def __init__(self):
+        self._pending = {'normal': {}, 'poisson': {}}
+
+    def normal(self, mean, std, thresholds):
+        """Queue a normal exceedance evaluation"""
+        return self._queue('normal', (mean, std), thresholds)
+
+    def poisson(self, lam, thresholds):
+        """Queue a Poisson at-least evaluation"""
+        return self._queue('poisson', (lam,), thresholds)
+
+    def _queue(self, kind, params, thresholds):
+        result = {}
+        self._pending[kind].setdefault(tuple(thresholds), []).append((params, result))
+        return result
+
+    def evaluate(self):
+        """Run one vectorized evaluation per distribution and benchmark grid"""
+        for thresholds, entries in self._pending['normal'].items():
+            means = [params[0] for params, _ in entries]
+            stds = [params[1] for params, _ in entries]
+            probabilities = normal_exceedance(means, stds, thresholds)
+            for (_, result), row in zip(entries, probabilities):
+                result.update(to_percentages(row, thresholds))
+
+        for thresholds, entries in self._pending['poisson'].items():
+            lambdas = [params[0] for params, _ in entries]
+            probabilities = poisson_at_least(lambdas, thresholds)
+            for (_, result), row in zip(entries, probabilities):
+                result.update(to_percentages(row, thresholds))
+
+        self._pending = {'normal': {}, 'poisson': {}}
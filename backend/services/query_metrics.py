@@ -0,0 +1,284 @@
+"""
+Per-request SQL instrumentation
+
+SQLAlchemy cursor events time every statement and add it to whichever
+QueryCollectors are active on the current thread. When enabled
+(QUERY_METRICS_ENABLED), a collector is opened for each Flask request and the
+result is:
+- Returned in response headers (X-DB-Query-Count, X-DB-Time-Ms, Server-Timing)
+- Aggregated per endpoint: requests, latency, statements, DB time and the
+  slowest statements, exposed at /api/metrics in Prometheus text format
+
+count_queries() opens a collector around any block of code, so scripts and
+benchmarks can assert how many statements an operation issues (N+1 guards).
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, request
+from sqlalchemy import event
+
+from models import db
+
+
+class QueryCollector:
+    """SQL statements executed while the collector is active"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = {}  # Normalized statement -> [calls, total seconds, max seconds]
+
+    def add(self, statement, duration):
+        """Record one executed statement"""
+        self.count += 1
+        self.duration += duration
+
+        stats = self.statements.get(statement)
+        if stats is None:
+            self.statements[statement] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+
+# Collectors active on each thread (nested count_queries() blocks all see a statement)
+_active = threading.local()
+
+# Placeholder lists such as IN (?, ?, ?) collapse so one query shape is one statement
+_PLACEHOLDER_LIST = re.compile(r'\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))+\s*\)')
+
+
+def _normalize(statement):
+    """Collapse whitespace and placeholder lists, and cap the length"""
+    statement = _PLACEHOLDER_LIST.sub('(...)', ' '.join(statement.split()))
+    return statement[:500]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and getattr(_active, 'collectors', None):
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collectors = getattr(_active, 'collectors', None)
+    if not collectors:
+        return
+
+    start = getattr(context, '_query_start_time', None)
+    duration = time.perf_counter() - start if start is not None else 0.0
+
+    statement = _normalize(statement)
+    for collector in collectors:
+        collector.add(statement, duration)
+
+
+def instrument_engine(engine):
+    """Attach the timing listeners to an engine (idempotent)"""
+    if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+@contextmanager
+def count_queries():
+    """
+    Collect the SQL statements executed by the current thread inside the block
+
+    Usage:
+        with count_queries() as queries:
+            prediction_service.get_player_prediction(player_id, 'KC')
+        assert queries.count <= 5
+
+    Must run inside an app context.
+    """
+    instrument_engine(db.engine)
+
+    collector = QueryCollector()
+    if not hasattr(_active, 'collectors'):
+        _active.collectors = []
+    _active.collectors.append(collector)
+    try:
+        yield collector
+    finally:
+        _active.collectors.remove(collector)
+
+
+class QueryMetrics:
+    """Per-endpoint request and SQL statistics for the running process"""
+
+    # Slowest statements (by total time) reported per endpoint
+    TOP_STATEMENTS = 5
+    # Distinct statements tracked per endpoint before the cheapest are dropped
+    MAX_STATEMENTS = 100
+
+    _lock = threading.Lock()
+    _endpoints = {}  # (method, endpoint) -> aggregate dictionary
+
+    @staticmethod
+    def init_app(app):
+        """Instrument the database engine and open a collector around every request"""
+        with app.app_context():
+            instrument_engine(db.engine)
+
+        app.before_request(QueryMetrics._start_request)
+        app.after_request(QueryMetrics._finish_request)
+        app.teardown_request(QueryMetrics._teardown_request)
+
+    @staticmethod
+    def _start_request():
+        g.query_collector = QueryCollector()
+        g.request_started = time.perf_counter()
+
+        if not hasattr(_active, 'collectors'):
+            _active.collectors = []
+        _active.collectors.append(g.query_collector)
+
+    @staticmethod
+    def _finish_request(response):
+        collector = g.pop('query_collector', None)
+        if collector is None:
+            return response
+
+        _active.collectors.remove(collector)
+        elapsed = time.perf_counter() - g.pop('request_started')
+
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        QueryMetrics.record(request.method, endpoint, collector, elapsed)
+
+        db_ms = collector.duration * 1000
+        response.headers['X-DB-Query-Count'] = str(collector.count)
+        response.headers['X-DB-Time-Ms'] = f'{db_ms:.2f}'
+        response.headers['Server-Timing'] = f'db;dur={db_ms:.2f}, app;dur={elapsed * 1000:.2f}'
+        return response
+
+    @staticmethod
+    def _teardown_request(exc):
+        # after_request is skipped when a request raises; don't leak its collector
+        collector = g.pop('query_collector', None)
+        if collector is not None and collector in getattr(_active, 'collectors', []):
+            _active.collectors.remove(collector)
+
+    @staticmethod
+    def record(method, endpoint, collector, elapsed):
+        """
+        Add a finished request to the per-endpoint totals
+
+        Args:
+            method: HTTP method
+            endpoint: URL rule (e.g. /api/players/<int:player_id>)
+            collector: QueryCollector of the request
+            elapsed: Request duration in seconds
+        """
+        with QueryMetrics._lock:
+            metrics = QueryMetrics._endpoints.get((method, endpoint))
+            if metrics is None:
+                metrics = QueryMetrics._endpoints[(method, endpoint)] = {
+                    'requests': 0,
+                    'request_seconds': 0.0,
+                    'statements': 0,
+                    'db_seconds': 0.0,
+                    'max_statements': 0,
+                    'statement_stats': {}
+                }
+
+            metrics['requests'] += 1
+            metrics['request_seconds'] += elapsed
+            metrics['statements'] += collector.count
+            metrics['db_seconds'] += collector.duration
+            metrics['max_statements'] = max(metrics['max_statements'], collector.count)
+
+            statement_stats = metrics['statement_stats']
+            for statement, (calls, total, slowest) in collector.statements.items():
+                stats = statement_stats.get(statement)
+                if stats is None:
+                    statement_stats[statement] = [calls, total, slowest]
+                else:
+                    stats[0] += calls
+                    stats[1] += total
+                    stats[2] = max(stats[2], slowest)
+
+            while len(statement_stats) > QueryMetrics.MAX_STATEMENTS:
+                del statement_stats[min(statement_stats, key=lambda s: statement_stats[s][1])]
+
+    @staticmethod
+    def snapshot():
+        """
+        Copy of the per-endpoint totals
+
+        Returns:
+            List of dictionaries (one per method and endpoint) with the top statements
+        """
+        with QueryMetrics._lock:
+            endpoints = []
+            for (method, endpoint), metrics in sorted(QueryMetrics._endpoints.items()):
+                top = sorted(
+                    metrics['statement_stats'].items(), key=lambda item: item[1][1], reverse=True
+                )[:QueryMetrics.TOP_STATEMENTS]
+
+                endpoints.append({
+                    'method': method,
+                    'endpoint': endpoint,
+                    'requests': metrics['requests'],
+                    'request_seconds': metrics['request_seconds'],
+                    'statements': metrics['statements'],
+                    'db_seconds': metrics['db_seconds'],
+                    'max_statements': metrics['max_statements'],
+                    'top_statements': [
+                        {'statement': statement, 'calls': calls, 'seconds': total, 'max_seconds': slowest}
+                        for statement, (calls, total, slowest) in top
+                    ]
+                })
+            return endpoints
+
+    @staticmethod
+    def reset():
+        """Forget all recorded requests"""
+        with QueryMetrics._lock:
+            QueryMetrics._endpoints.clear()
+
+    @staticmethod
+    def render_prometheus():
+        """Per-endpoint metrics in the Prometheus text exposition format"""
+        def label(value):
+            return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        families = [
+            ('api_requests_total', 'counter', 'Requests handled', 'requests'),
+            ('api_request_duration_seconds_total', 'counter', 'Time spent handling requests', 'request_seconds'),
+            ('api_db_statements_total', 'counter', 'SQL statements executed', 'statements'),
+            ('api_db_duration_seconds_total', 'counter', 'Time spent executing SQL statements', 'db_seconds'),
+            ('api_db_statements_per_request_max', 'gauge', 'Most SQL statements issued by a single request', 'max_statements')
+        ]
+        statement_families = [
+            ('api_db_statement_calls_total', 'counter', 'Executions of the slowest SQL statements', 'calls'),
+            ('api_db_statement_duration_seconds_total', 'counter', 'Total time of the slowest SQL statements', 'seconds'),
+            ('api_db_statement_duration_seconds_max', 'gauge', 'Slowest single execution of the slowest SQL statements', 'max_seconds')
+        ]
+
+        endpoints = QueryMetrics.snapshot()
+        lines = []
+
+        for name, kind, description, key in families:
+            lines.append(f'# HELP {name} {description} per endpoint')
+            lines.append(f'# TYPE {name} {kind}')
+            for metrics in endpoints:
+                labels = f'method="{label(metrics["method"])}",endpoint="{label(metrics["endpoint"])}"'
+                lines.append(f'{name}{{{labels}}} {metrics[key]}')
+
+        for name, kind, description, key in statement_families:
+            lines.append(f'# HELP {name} {description} per endpoint')
+            lines.append(f'# TYPE {name} {kind}')
+            for metrics in endpoints:
+                for statement in metrics['top_statements']:
+                    labels = (
+                        f'method="{label(metrics["method"])}",endpoint="{label(metrics["endpoint"])}",'
+                        f'statement="{label(statement["statement"])}"'
+                    )
+                    lines.append(f'{name}{{{labels}}} {statement[key]}')
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,335 @@
+"""
+Result cache for PredictionService
+
+Public prediction methods are memoized under a key made of the data version,
+the method name and its arguments, so a result is computed once per data
+version and never served after the next sync. Two tiers:
+- MemoryCache: bounded in-process LRU with a TTL, always in front
+- RedisCache: optional shared tier (any Redis-compatible server) so every
+  worker behind the load balancer reuses results computed by the others
+
+Concurrent misses on the same key are coalesced: threads of a process wait for
+the one computing it, and with a shared tier a short Redis lock makes the other
+workers wait for the result instead of computing it again.
+
+The version in a key is the one the inputs were read at: the stats snapshot's
+version when the store is enabled, so a result computed from a snapshot that
+has not caught up with a bump yet is never filed under the newer version.
+
+Cached results are shared between callers and must not be modified.
+"""
+
+import inspect
+import json
+import pickle
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import wraps
+
+from config import Config
+from models.data_version import DataVersion
+from services.stats_store import get_stats_store
+
+
+class MemoryCache:
+    """Bounded in-process LRU cache with a per-entry time to live"""
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self.expirations = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Look up a key
+
+        Returns:
+            Tuple (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries beyond max_entries"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Entry count and eviction counters"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+
+class RedisCache:
+    """
+    Shared cache tier on a Redis-compatible server
+    Accepts any client with redis-py's get/set/delete (e.g. a fakeredis instance),
+    or connects to url with redis-py
+    """
+
+    # Seconds a worker may hold the compute lock for a key
+    LOCK_SECONDS = 30
+    # Seconds another worker waits for the lock holder's result before computing itself
+    WAIT_SECONDS = 10
+    POLL_SECONDS = 0.05
+
+    def __init__(self, ttl, client=None, url=None, prefix='prediction-cache'):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError('RESULT_CACHE_BACKEND=redis requires the redis package (pip install redis)') from e
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key):
+        """
+        Look up a key
+
+        Returns:
+            Tuple (found, value)
+        """
+        data = self.client.get(f'{self.prefix}:{key}')
+        if data is None:
+            return False, None
+        return True, pickle.loads(zlib.decompress(data))
+
+    def set(self, key, value):
+        """
+        Store a value with the tier's TTL
+        Values are compressed pickles rather than JSON so int benchmark keys
+        (e.g. {50: 61.2}) come back as ints, exactly as a local compute returns them
+        """
+        data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        self.client.set(f'{self.prefix}:{key}', data, ex=self.ttl)
+
+    def acquire(self, key):
+        """Try to become the worker that computes key"""
+        return bool(self.client.set(f'{self.prefix}:lock:{key}', b'1', nx=True, ex=RedisCache.LOCK_SECONDS))
+
+    def release(self, key):
+        """Release the compute lock for key"""
+        self.client.delete(f'{self.prefix}:lock:{key}')
+
+    def wait(self, key):
+        """
+        Wait for another worker to store key
+
+        Returns:
+            Tuple (found, value); not found after WAIT_SECONDS
+        """
+        deadline = time.monotonic() + RedisCache.WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(RedisCache.POLL_SECONDS)
+            found, value = self.get(key)
+            if found:
+                return True, value
+        return False, None
+
+
+class ResultCache:
+    """Two-tier cache with per-key request coalescing and hit/miss counters"""
+
+    COUNTERS = ['hits', 'shared_hits', 'coalesced', 'misses']
+
+    def __init__(self, local, shared=None):
+        self.local = local
+        self.shared = shared
+        self.counters = dict.fromkeys(ResultCache.COUNTERS, 0)
+        self._inflight = {}  # key -> Event set when the computing thread finishes
+        self._lock = threading.Lock()
+
+    def _count(self, counter):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached value for key, computing and storing it on a miss
+
+        Args:
+            key: Cache key (must change whenever the result can change)
+            compute: Zero-argument function producing the value
+
+        Returns:
+            The cached or computed value
+        """
+        found, value = self.local.get(key)
+        if found:
+            self._count('hits')
+            return value
+
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                self._inflight[key] = threading.Event()
+
+        if inflight is not None:
+            # Another thread is computing this key; use its result if it succeeds
+            inflight.wait(RedisCache.WAIT_SECONDS)
+            found, value = self.local.get(key)
+            if found:
+                self._count('coalesced')
+                return value
+            self._count('misses')
+            return compute()
+
+        locked = False
+        try:
+            if self.shared is not None:
+                found, value = self.shared.get(key)
+                if not found:
+                    locked = self.shared.acquire(key)
+                    if not locked:
+                        found, value = self.shared.wait(key)
+                if found:
+                    self._count('shared_hits')
+                    self.local.set(key, value)
+                    return value
+
+            self._count('misses')
+            value = compute()
+            self.local.set(key, value)
+            if self.shared is not None:
+                self.shared.set(key, value)
+            return value
+        finally:
+            if locked:
+                self.shared.release(key)
+            with self._lock:
+                self._inflight.pop(key).set()
+
+    def clear_local(self):
+        """Drop this process's entries (e.g. after a data version bump makes them unreachable)"""
+        self.local.clear()
+
+    def stats(self):
+        """Counters for this process, plus local tier occupancy"""
+        with self._lock:
+            counters = dict(self.counters)
+        lookups = sum(counters.values())
+        served = lookups - counters['misses']
+        return {
+            'backend': 'redis' if self.shared is not None else 'memory',
+            **counters,
+            'hit_ratio': round(served / lookups, 4) if lookups else None,
+            **self.local.stats()
+        }
+
+    def render_prometheus(self):
+        """Counters in Prometheus text format"""
+        stats = self.stats()
+        lines = []
+        for name in ResultCache.COUNTERS + ['evictions', 'expirations']:
+            lines.append(f'# TYPE prediction_cache_{name}_total counter')
+            lines.append(f'prediction_cache_{name}_total {stats[name]}')
+        lines.append('# TYPE prediction_cache_entries gauge')
+        lines.append(f'prediction_cache_entries {stats["entries"]}')
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide cache; built from Config on first use
+_result_cache = None
+_init_lock = threading.Lock()
+
+
+def get_result_cache():
+    """
+    Get the configured result cache
+
+    Returns:
+        ResultCache, or None when RESULT_CACHE_BACKEND is 'none'
+    """
+    global _result_cache
+
+    if Config.RESULT_CACHE_BACKEND == 'none':
+        return None
+
+    if _result_cache is None:
+        with _init_lock:
+            if _result_cache is None:
+                local = MemoryCache(Config.RESULT_CACHE_MAX_ENTRIES, Config.RESULT_CACHE_TTL)
+                shared = None
+                if Config.RESULT_CACHE_BACKEND == 'redis':
+                    shared = RedisCache(Config.RESULT_CACHE_TTL, url=Config.RESULT_CACHE_URL)
+                _result_cache = ResultCache(local, shared)
+
+    return _result_cache
+
+
+def set_result_cache(cache):
+    """Replace the process-wide cache (e.g. with a RedisCache on a fakeredis client)"""
+    global _result_cache
+    _result_cache = cache
+
+
+def inputs_version():
+    """
+    Data version that predictions computed now are based on
+
+    Returns:
+        The stats snapshot's version, or the cached data version when the store
+        is disabled (reads then go to the database and are at least that recent)
+    """
+    store = get_stats_store()
+    if store is not None:
+        return store.data_version
+    return DataVersion.cached(Config.DATA_VERSION_CHECK_SECONDS)
+
+
+def cached_result(method):
+    """
+    Memoize a PredictionService method in the result cache
+    Keyed by data version, method name and bound arguments (defaults applied, so
+    positional and keyword calls share entries). Batch instances are not cached:
+    they defer benchmark evaluation and read preloaded rows
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = get_result_cache()
+        if cache is None or self._preloaded is not None or self._probability_batch is not None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = json.dumps(list(bound.arguments.values())[1:], default=str)
+        version = inputs_version()
+
+        return cache.get_or_compute(
+            f'v{version}:{method.__name__}:{arguments}',
+            lambda: method(self, *args, **kwargs)
+        )
+
+    return wrapper
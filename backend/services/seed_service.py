@@ -0,0 +1,453 @@
+"""
+Seed snapshots and streaming seed files
+
+A snapshot is a directory with one zstd-compressed Parquet file per table and
+a manifest:
+
+    seed_snapshot/manifest.json
+    seed_snapshot/teams.parquet
+    seed_snapshot/players.parquet
+    seed_snapshot/player_stats.parquet
+    seed_snapshot/team_stats.parquet
+
+The same data can also be written as JSON (the legacy seed_data.json layout)
+or NDJSON (a header line, one line per row tagged with its table, and a
+trailer with row counts). NDJSON imports are chunked and resumable: progress
+is committed with each chunk, so an interrupted import continues where it
+stopped.
+
+Rows reference players and teams by their natural keys (player_id string,
+team_abbr). Exports read the database with yield_per and write incrementally;
+imports stream batches straight into the database (COPY on PostgreSQL,
+executemany elsewhere), so memory stays flat regardless of how many seasons
+are exported.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from itertools import islice
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Float, Integer, insert, select
+
+from models import db
+from models.player import Player, PlayerStats, PlayerSeasonTotals
+from models.seed_import import SeedImport
+from models.sync_state import SyncState
+from models.team import Team, TeamStats, TeamOffenseWeekly
+
+
+BACKEND_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+
+class SeedService:
+    """Export and restore seed snapshots and seed files"""
+
+    FORMAT = 'football-betting-seed'
+    VERSION = 2
+
+    DEFAULT_DIR = os.path.join(BACKEND_DIR, 'seed_snapshot')
+    DEFAULT_NDJSON = os.path.join(BACKEND_DIR, 'seed_data.ndjson')
+
+    # Rows per Parquet row group / database read on export and per insert batch on import
+    CHUNK_SIZE = 20000
+
+    # Stat columns stored for each table (natural keys are added per table)
+    PLAYER_STAT_COLUMNS = [
+        'season', 'week', 'receptions', 'receiving_yards', 'receiving_touchdowns', 'targets',
+        'rushes', 'rushing_yards', 'rushing_touchdowns', 'passing_attempts', 'passing_completions',
+        'passing_yards', 'passing_touchdowns', 'interceptions', 'opponent'
+    ]
+    TEAM_STAT_COLUMNS = [
+        'season', 'week', 'opponent', 'points_against', 'yards_against',
+        'passing_yards_against', 'rushing_yards_against'
+    ]
+
+    # Load order: table name -> (database table, natural-key column, id column it maps to)
+    TABLES = {
+        'teams': (Team.__table__, None, None),
+        'players': (Player.__table__, None, None),
+        'player_stats': (PlayerStats.__table__, 'player_id', 'player_id'),
+        'team_stats': (TeamStats.__table__, 'team_abbr', 'team_id')
+    }
+
+    @staticmethod
+    def _export_queries():
+        """Query per table selecting natural keys and stored columns"""
+        return {
+            'teams': select(Team.team_abbr, Team.team_name).order_by(Team.id),
+            'players': select(
+                Player.player_id, Player.name, Player.position, Player.team
+            ).order_by(Player.id),
+            'player_stats': select(
+                Player.player_id,
+                *[getattr(PlayerStats, column) for column in SeedService.PLAYER_STAT_COLUMNS]
+            ).join(Player, Player.id == PlayerStats.player_id).order_by(PlayerStats.id),
+            'team_stats': select(
+                Team.team_abbr,
+                *[getattr(TeamStats, column) for column in SeedService.TEAM_STAT_COLUMNS]
+            ).join(Team, Team.id == TeamStats.team_id).order_by(TeamStats.id)
+        }
+
+    @staticmethod
+    def iter_chunks(query, chunk_size=None):
+        """
+        Yield lists of row tuples from a query, chunk_size (default CHUNK_SIZE) rows at a time
+        Uses a server-side cursor where the driver supports one, so only one chunk is in memory
+        """
+        result = db.session.execute(query.execution_options(yield_per=chunk_size or SeedService.CHUNK_SIZE))
+        for chunk in result.partitions():
+            yield chunk
+
+    @staticmethod
+    def _iter_rows(query):
+        """Yield rows of a query as dictionaries without loading the whole table"""
+        columns = [column.name for column in query.selected_columns]
+        for chunk in SeedService.iter_chunks(query):
+            for row in chunk:
+                yield dict(zip(columns, row))
+
+    @staticmethod
+    def has_snapshot(directory=None):
+        """Whether a snapshot exists in the directory"""
+        return os.path.exists(os.path.join(directory or SeedService.DEFAULT_DIR, 'manifest.json'))
+
+    @staticmethod
+    def export_snapshot(directory=None):
+        """
+        Write the database to a snapshot directory
+
+        Args:
+            directory: Output directory (default: backend/seed_snapshot)
+
+        Returns:
+            Manifest dictionary
+        """
+        directory = directory or SeedService.DEFAULT_DIR
+        os.makedirs(directory, exist_ok=True)
+
+        tables = {}
+        for table, query in SeedService._export_queries().items():
+            rows = SeedService._export_table(query, os.path.join(directory, f'{table}.parquet'))
+            tables[table] = {'file': f'{table}.parquet', 'rows': rows}
+            print(f"  Exported {rows} {table}")
+
+        manifest = {
+            'format': SeedService.FORMAT,
+            'version': SeedService.VERSION,
+            'exported_at': datetime.utcnow().isoformat(),
+            'tables': tables
+        }
+        with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        return manifest
+
+    @staticmethod
+    def arrow_schema(query):
+        """
+        Arrow schema and pandas dtypes for the columns a query selects
+        Derived from the column types so every row group matches, whether or
+        not a chunk happens to contain NULLs
+
+        Returns:
+            Tuple (pyarrow schema, dictionary of column name to pandas dtype)
+        """
+        fields, dtypes = [], {}
+        for column in query.selected_columns:
+            if isinstance(column.type, Integer):
+                fields.append(pa.field(column.name, pa.int64()))
+                dtypes[column.name] = 'Int64'
+            elif isinstance(column.type, Float):
+                fields.append(pa.field(column.name, pa.float64()))
+                dtypes[column.name] = 'float64'
+            else:
+                fields.append(pa.field(column.name, pa.string()))
+                dtypes[column.name] = object
+        return pa.schema(fields), dtypes
+
+    @staticmethod
+    def chunk_table(chunk, schema, dtypes):
+        """Convert a chunk of row tuples into an Arrow table with a fixed schema"""
+        frame = pd.DataFrame(chunk, columns=schema.names).astype(dtypes)
+        return pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+
+    @staticmethod
+    def _export_table(query, path):
+        """Stream a query into a Parquet file one row group per chunk"""
+        schema, dtypes = SeedService.arrow_schema(query)
+
+        rows = 0
+        with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+            for chunk in SeedService.iter_chunks(query):
+                writer.write_table(SeedService.chunk_table(chunk, schema, dtypes))
+                rows += len(chunk)
+
+        return rows
+
+    @staticmethod
+    def export_json(path):
+        """
+        Write the database to a JSON seed file (seed_data.json layout), one row at a time
+
+        Args:
+            path: Output file
+
+        Returns:
+            Dictionary of table name to rows exported
+        """
+        counts = {}
+        with open(path, 'w') as f:
+            f.write('{\n')
+            f.write(f'  "version": "1.0",\n  "exported_at": {json.dumps(datetime.utcnow().isoformat())}')
+
+            for table, query in SeedService._export_queries().items():
+                f.write(f',\n  "{table}": [')
+                counts[table] = 0
+                for row in SeedService._iter_rows(query):
+                    f.write(',\n    ' if counts[table] else '\n    ')
+                    f.write(json.dumps(row))
+                    counts[table] += 1
+                f.write('\n  ]' if counts[table] else ']')
+                print(f"  Exported {counts[table]} {table}")
+
+            f.write('\n}\n')
+
+        return counts
+
+    @staticmethod
+    def export_ndjson(path=None):
+        """
+        Write the database to an NDJSON seed file, one row per line
+
+        The first line is a header (format, version, exported_at), every row
+        line carries its table in "_table", and the last line is a trailer
+        with row counts so truncated files are detected on import.
+
+        Args:
+            path: Output file (default: backend/seed_data.ndjson)
+
+        Returns:
+            Dictionary of table name to rows exported
+        """
+        path = path or SeedService.DEFAULT_NDJSON
+
+        header = {
+            'format': SeedService.FORMAT,
+            'version': SeedService.VERSION,
+            'exported_at': datetime.utcnow().isoformat(),
+            'tables': list(SeedService.TABLES)
+        }
+
+        counts = {}
+        with open(path, 'w') as f:
+            f.write(json.dumps(header) + '\n')
+
+            for table, query in SeedService._export_queries().items():
+                counts[table] = 0
+                for row in SeedService._iter_rows(query):
+                    row['_table'] = table
+                    f.write(json.dumps(row) + '\n')
+                    counts[table] += 1
+                print(f"  Exported {counts[table]} {table}")
+
+            f.write(json.dumps({'_end': True, 'rows': counts}) + '\n')
+
+        return counts
+
+    @staticmethod
+    def _check_header(header):
+        """Raise ValueError unless a manifest/header is from a supported format version"""
+        if header.get('format') != SeedService.FORMAT or header.get('version') != SeedService.VERSION:
+            raise ValueError(
+                f"Unsupported seed {header.get('format')} v{header.get('version')} "
+                f"(expected {SeedService.FORMAT} v{SeedService.VERSION})"
+            )
+
+    @staticmethod
+    def clear_tables():
+        """Delete all seeded data before a fresh restore"""
+        print("Clearing existing data...")
+        PlayerSeasonTotals.query.delete()
+        PlayerStats.query.delete()
+        Player.query.delete()
+        TeamOffenseWeekly.query.delete()
+        TeamStats.query.delete()
+        Team.query.delete()
+        # Sync watermarks and import progress describe the replaced data
+        SyncState.query.delete()
+        SeedImport.query.delete()
+        db.session.commit()
+
+    @staticmethod
+    def restore_snapshot(directory=None):
+        """
+        Replace the database contents with a snapshot
+
+        Args:
+            directory: Snapshot directory (default: backend/seed_snapshot)
+
+        Returns:
+            Dictionary of table name to rows restored
+        """
+        directory = directory or SeedService.DEFAULT_DIR
+        with open(os.path.join(directory, 'manifest.json')) as f:
+            manifest = json.load(f)
+        SeedService._check_header(manifest)
+
+        SeedService.clear_tables()
+
+        restored = {}
+        key_ids = {}
+        for table in SeedService.TABLES:
+            path = os.path.join(directory, manifest['tables'][table]['file'])
+            restored[table] = 0
+
+            # Nullable integers come back as Int64 instead of float with NaN
+            batches = pq.ParquetFile(path).iter_batches(batch_size=SeedService.CHUNK_SIZE)
+            for batch in batches:
+                frame = batch.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+                restored[table] += SeedService._load_rows(table, frame, key_ids)
+
+            db.session.commit()
+            print(f"  Restored {restored[table]} {table}")
+
+        return restored
+
+    @staticmethod
+    def import_ndjson(path=None, resume=True):
+        """
+        Replace the database contents with an NDJSON seed file in chunks
+
+        Each chunk is committed together with the byte offset reached, so if
+        the import is interrupted, running it again on the same file continues
+        from the last committed chunk instead of starting over.
+
+        Args:
+            path: Seed file (default: backend/seed_data.ndjson)
+            resume: Continue an unfinished import of the same file (False restarts it)
+
+        Returns:
+            Number of rows imported (including rows from earlier attempts)
+        """
+        path = os.path.abspath(path or SeedService.DEFAULT_NDJSON)
+
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            SeedService._check_header(header)
+
+            progress = None
+            if resume:
+                progress = SeedImport.query.filter_by(
+                    path=path, exported_at=header['exported_at']
+                ).first()
+
+            if progress and progress.completed:
+                print(f"Seed file already imported ({progress.rows} rows)")
+                return progress.rows
+
+            if progress:
+                print(f"Resuming seed import at row {progress.rows}")
+                f.seek(progress.offset)
+            else:
+                SeedService.clear_tables()
+                progress = SeedImport(path=path, exported_at=header['exported_at'], offset=f.tell(), rows=0)
+                db.session.add(progress)
+                db.session.commit()
+
+            key_ids = {}
+            while not progress.completed:
+                lines = list(islice(f, SeedService.CHUNK_SIZE))
+                if not lines:
+                    raise ValueError(f"Seed file {path} is truncated (no trailer after {progress.rows} rows)")
+
+                # Group the chunk by table, keeping file order (teams before players before stats)
+                tables = {}
+                for line in lines:
+                    row = json.loads(line)
+                    table = row.pop('_table', None)
+                    if table is None:
+                        progress.completed = True
+                        break
+                    tables.setdefault(table, []).append(row)
+
+                for table, rows in tables.items():
+                    progress.rows += SeedService._load_rows(table, pd.DataFrame(rows), key_ids)
+
+                progress.offset = f.tell()
+                db.session.commit()
+                print(f"  Imported {progress.rows} rows...")
+
+        print(f"  ✓ Imported {progress.rows} rows from {path}")
+        return progress.rows
+
+    @staticmethod
+    def _load_rows(table_name, frame, key_ids):
+        """
+        Insert a batch of seed rows into their table
+
+        Args:
+            table_name: Seed table name (key of TABLES)
+            frame: DataFrame of rows in seed layout (natural keys)
+            key_ids: Cache of natural key -> database id Series, filled on demand
+
+        Returns:
+            Number of rows inserted
+        """
+        table, key_column, target_key = SeedService.TABLES[table_name]
+
+        # Parents loaded in this batch invalidate their id lookups
+        if table_name == 'teams':
+            key_ids.pop('team_abbr', None)
+        elif table_name == 'players':
+            key_ids.pop('player_id', None)
+
+        if key_column:
+            if key_column not in key_ids:
+                if key_column == 'player_id':
+                    pairs = db.session.query(Player.player_id, Player.id).all()
+                else:
+                    pairs = db.session.query(Team.team_abbr, Team.id).all()
+                key_ids[key_column] = pd.Series(dict(pairs), dtype='Int64')
+
+            frame[target_key] = frame.pop(key_column).map(key_ids[key_column])
+            frame = frame[frame[target_key].notna()]
+
+        if frame.empty:
+            return 0
+
+        now = datetime.utcnow()
+        for column in ('created_at', 'updated_at'):
+            if column in table.c:
+                frame[column] = now
+
+        SeedService._load_frame(frame, table)
+        return len(frame)
+
+    @staticmethod
+    def _load_frame(frame, table):
+        """Insert a DataFrame into a table (COPY on PostgreSQL)"""
+        # Integer columns holding NULLs arrive as floats; keep them integral
+        for column in frame.columns:
+            if isinstance(table.c[column].type, Integer) and frame[column].dtype.kind == 'f':
+                frame[column] = frame[column].astype('Int64')
+
+        if db.engine.dialect.name == 'postgresql':
+            buffer = io.StringIO()
+            frame.to_csv(buffer, index=False, header=False, quoting=csv.QUOTE_MINIMAL, na_rep='\\N')
+            buffer.seek(0)
+
+            cursor = db.session.connection().connection.cursor()
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(frame.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+            return
+
+        records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+        db.session.execute(insert(table), records)
@@ -0,0 +1,244 @@
+"""
+In-memory columnar snapshot of player and team statistics
+
+The prediction hot path only needs a handful of integer columns per game.
+Instead of going through the ORM for every prediction, a read-only snapshot of
+player_stats and team_stats is held as NumPy arrays:
+- Player games sorted by player, newest game first, so a player's recent games
+  are a contiguous slice
+- Team totals per (team, season, week) for yard/target shares
+- Defensive games sorted by team and season, newest week first
+
+The snapshot is built lazily on first use and records the data version it was
+built at. It is rebuilt after a sync in this process and, for bumps made by
+other workers or offline scripts, as soon as DataVersion.cached() reports a
+newer version. A new snapshot is fully built before it replaces the old one, so
+readers always see a complete snapshot.
+"""
+
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from models import db
+from models.data_version import DataVersion
+from models.player import Player, PlayerStats
+from models.team import Team, TeamStats
+
+
+# PlayerStats columns the prediction model reads
+PLAYER_STAT_COLUMNS = [
+    'receptions', 'receiving_yards', 'receiving_touchdowns', 'targets',
+    'rushing_yards', 'rushing_touchdowns',
+    'passing_yards', 'passing_touchdowns', 'interceptions'
+]
+
+# Team totals used for yard/target shares
+TEAM_TOTAL_COLUMNS = ['receiving_yards', 'rushing_yards', 'targets']
+
+# TeamStats columns used for defensive adjustments
+DEFENSE_STAT_COLUMNS = ['points_against', 'yards_against', 'passing_yards_against', 'rushing_yards_against']
+
+
+def rows_to_columns(rows, columns):
+    """
+    Convert query rows into a dictionary of NumPy arrays, one per column
+    NULL values become 0 to match how the model treats missing stats
+    """
+    return {
+        column: np.array([getattr(row, column) or 0 for row in rows], dtype=np.int64)
+        for column in columns
+    }
+
+
+class StatsStore:
+    """Read-only columnar snapshot of player_stats and team_stats"""
+
+    def __init__(self, player_columns, player_slices, team_totals, defense_columns, defense_slices,
+                 data_version=0):
+        self.player_columns = player_columns
+        self.player_slices = player_slices
+        self.team_totals = team_totals
+        self.defense_columns = defense_columns
+        self.defense_slices = defense_slices
+        self.data_version = data_version
+        self.built_at = datetime.utcnow()
+
+    @classmethod
+    def build(cls, data_version=0):
+        """
+        Build a snapshot from the database (requires an app context)
+
+        Args:
+            data_version: Data version read before the build started
+
+        Returns:
+            StatsStore instance
+        """
+        player_rows = db.session.query(
+            PlayerStats.player_id,
+            Player.team,
+            PlayerStats.season,
+            PlayerStats.week,
+            *[getattr(PlayerStats, column) for column in PLAYER_STAT_COLUMNS]
+        ).join(
+            Player, Player.id == PlayerStats.player_id
+        ).filter(
+            PlayerStats.week.isnot(None)
+        ).all()
+
+        player_df = pd.DataFrame(
+            player_rows,
+            columns=['player_id', 'team', 'season', 'week'] + PLAYER_STAT_COLUMNS
+        )
+        player_df[PLAYER_STAT_COLUMNS] = player_df[PLAYER_STAT_COLUMNS].fillna(0)
+
+        # Team totals per game, keyed by (team, season, week)
+        team_totals = {
+            key: {column: int(value) for column, value in totals.items()}
+            for key, totals in player_df.groupby(['team', 'season', 'week'])[TEAM_TOTAL_COLUMNS]
+            .sum().to_dict('index').items()
+        }
+
+        # Each player's games contiguous, newest first
+        player_df = player_df.sort_values(
+            ['player_id', 'season', 'week'], ascending=[True, False, False], kind='mergesort'
+        ).reset_index(drop=True)
+        player_columns = {
+            column: player_df[column].to_numpy(dtype=np.int64)
+            for column in ['player_id', 'season', 'week'] + PLAYER_STAT_COLUMNS
+        }
+        player_slices = cls._group_slices(player_df[['player_id']])
+
+        defense_rows = db.session.query(
+            Team.team_abbr,
+            TeamStats.season,
+            TeamStats.week,
+            *[getattr(TeamStats, column) for column in DEFENSE_STAT_COLUMNS]
+        ).join(
+            Team, Team.id == TeamStats.team_id
+        ).filter(
+            TeamStats.week.isnot(None)
+        ).all()
+
+        defense_df = pd.DataFrame(
+            defense_rows,
+            columns=['team_abbr', 'season', 'week'] + DEFENSE_STAT_COLUMNS
+        )
+        defense_df[DEFENSE_STAT_COLUMNS] = defense_df[DEFENSE_STAT_COLUMNS].fillna(0)
+
+        # Each team-season contiguous, most recent week first
+        defense_df = defense_df.sort_values(
+            ['team_abbr', 'season', 'week'], ascending=[True, True, False], kind='mergesort'
+        ).reset_index(drop=True)
+        defense_columns = {
+            column: defense_df[column].to_numpy(dtype=np.int64)
+            for column in ['season', 'week'] + DEFENSE_STAT_COLUMNS
+        }
+        defense_slices = cls._group_slices(defense_df[['team_abbr', 'season']])
+
+        print(f"Stats store v{data_version} built: "
+              f"{len(player_df)} player games, {len(defense_df)} defensive games")
+
+        return cls(player_columns, player_slices, team_totals, defense_columns, defense_slices, data_version)
+
+    @staticmethod
+    def _group_slices(key_df):
+        """Map each distinct key in a sorted DataFrame to its (start, stop) row range"""
+        if key_df.empty:
+            return {}
+
+        # Rows where the key differs from the previous row start a new group
+        changed = (key_df != key_df.shift()).any(axis=1).to_numpy()
+        starts = np.flatnonzero(changed)
+        stops = np.append(starts[1:], len(key_df))
+
+        keys = key_df.iloc[starts].itertuples(index=False, name=None)
+        return {
+            (key[0] if len(key) == 1 else key): (int(start), int(stop))
+            for key, start, stop in zip(keys, starts, stops)
+        }
+
+    def recent_stats(self, player_id, limit=20):
+        """
+        Get a player's most recent games as array slices, newest first
+
+        Returns:
+            Dictionary of arrays (season, week and PLAYER_STAT_COLUMNS)
+        """
+        start, stop = self.player_slices.get(player_id, (0, 0))
+        stop = min(stop, start + limit)
+        return {
+            column: values[start:stop]
+            for column, values in self.player_columns.items()
+            if column != 'player_id'
+        }
+
+    def team_weekly_totals(self, team_abbr, games, stat_columns):
+        """
+        Get a team's summed stats for the given (season, week) games
+
+        Returns:
+            Dictionary mapping (season, week) to {column: team total}
+        """
+        totals = {}
+        for season, week in set(games):
+            game_totals = self.team_totals.get((team_abbr, season, week))
+            if game_totals:
+                totals[(season, week)] = {column: game_totals[column] for column in stat_columns}
+        return totals
+
+    def defense_stats(self, team_abbr, season):
+        """
+        Get a team's defensive games for a season as array slices, newest first
+
+        Returns:
+            Dictionary of arrays (week and DEFENSE_STAT_COLUMNS)
+        """
+        start, stop = self.defense_slices.get((team_abbr, season), (0, 0))
+        return {
+            column: values[start:stop]
+            for column, values in self.defense_columns.items()
+            if column != 'season'
+        }
+
+
+# Current snapshot; replaced as a whole so readers never see a partial build
+_stats_store = None
+_build_lock = threading.Lock()
+
+
+def get_stats_store():
+    """
+    Get the current snapshot, building it on first use and rebuilding it
+    when the data version has moved past the one it was built at
+
+    Returns:
+        StatsStore, or None when the store is disabled
+    """
+    global _stats_store
+
+    if not Config.STATS_STORE_ENABLED:
+        return None
+
+    version = DataVersion.cached(Config.DATA_VERSION_CHECK_SECONDS)
+    if _stats_store is None or _stats_store.data_version < version:
+        with _build_lock:
+            if _stats_store is None or _stats_store.data_version < version:
+                _stats_store = StatsStore.build(version)
+
+    return _stats_store
+
+
+def refresh_stats_store():
+    """Rebuild the snapshot from the database and swap it in"""
+    global _stats_store
+
+    if not Config.STATS_STORE_ENABLED:
+        return
+
+    with _build_lock:
+        _stats_store = StatsStore.build(DataVersion.cached(Config.DATA_VERSION_CHECK_SECONDS))
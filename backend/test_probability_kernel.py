@@ -0,0 +1,31 @@
+"""
+Test that benchmark and line probabilities agree, including zero-std point masses
+"""
+import numpy as np
+
+from services.probability_kernel import (
+    line_exceedance, normal_distribution, normal_exceedance
+)
+
+print("Testing probability kernel conventions...\n")
+
+benchmarks = [0, 25, 50, 75, 100]
+cases = [
+    (60.0, 20.0),  # fitted normal
+    (60.0, 0.0),   # point mass at the mean
+    (0.0, 0.0),    # no-data prediction
+]
+
+for mean, std in cases:
+    grid = normal_exceedance([mean], [std], benchmarks)[0]
+    lines = line_exceedance([normal_distribution(mean, std)] * len(benchmarks), benchmarks)
+    print(f"mean={mean}, std={std}")
+    print(f"  benchmarks: {np.round(grid, 4).tolist()}")
+    print(f"  lines:      {np.round(lines, 4).tolist()}")
+    assert np.allclose(grid, lines), "benchmark and line probabilities disagree"
+
+# A point mass reaches every line at or below its mean and none above it
+assert normal_exceedance([60.0], [0.0], benchmarks)[0].tolist() == [1.0, 1.0, 1.0, 0.0, 0.0]
+assert normal_exceedance([0.0], [0.0], benchmarks)[0].tolist() == [1.0, 0.0, 0.0, 0.0, 0.0]
+
+print("\nAll probability kernel checks passed")
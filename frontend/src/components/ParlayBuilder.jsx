@@ -38,10 +38,33 @@ const NFL_TEAMS = [
   { name: 'Commanders', abbr: 'WAS' }
 ].sort((a, b) => a.name.localeCompare(b.name));
 
+// Parlay stat -> prediction market priced by the line probability API
+const STAT_MARKETS = {
+  passing_yards: 'passing_yards',
+  passing_tds: 'passing_touchdowns',
+  interceptions: 'interceptions',
+  rushing_yards: 'rushing_yards',
+  rushing_tds: 'rushing_touchdowns',
+  receptions: 'receptions',
+  receiving_yards: 'receiving_yards',
+  receiving_tds: 'receiving_touchdowns'
+};
+
+// Builder legs in the shape the parlay pricing API expects
+const toPricingLegs = (legs) => legs.map(leg => ({
+  player_id: leg.playerId,
+  opponent: leg.opponent,
+  stat: leg.stat,
+  line: leg.threshold,
+  side: leg.overUnder.toLowerCase()
+}));
+
 const ParlayBuilder = () => {
   const [parlays, setParlays] = useState([]);
   const [currentParlay, setCurrentParlay] = useState(null);
   const [isBuilding, setIsBuilding] = useState(false);
+  const [parlayPrice, setParlayPrice] = useState(null);
+  const [pricingParlay, setPricingParlay] = useState(false);
 
   // Player search state
   const [searchTerm, setSearchTerm] = useState('');
@@ -59,6 +82,7 @@ const ParlayBuilder = () => {
   const [opponent, setOpponent] = useState('');
   const [loadingPrediction, setLoadingPrediction] = useState(false);
   const [prediction, setPrediction] = useState(null);
+  const [lineProbability, setLineProbability] = useState(null);
 
   // Load saved parlays from localStorage on mount
   useEffect(() => {
@@ -86,7 +110,11 @@ const ParlayBuilder = () => {
 
   const saveParlay = () => {
     if (currentParlay && currentParlay.legs.length > 0) {
-      setParlays([...parlays, currentParlay]);
+      // Left undefined while pricing is in flight; saved parlays are priced below
+      setParlays([...parlays, {
+        ...currentParlay,
+        combinedProbability: parlayPrice ? parlayPrice.probability : undefined
+      }]);
       setCurrentParlay(null);
       setIsBuilding(false);
     }
@@ -173,6 +201,7 @@ const ParlayBuilder = () => {
     setOverUnder('OVER');
     setOpponent('');
     setPrediction(null);
+    setLineProbability(null);
   };
 
   // Close stat modal
@@ -184,105 +213,78 @@ const ParlayBuilder = () => {
     setOverUnder('OVER');
     setOpponent('');
     setPrediction(null);
+    setLineProbability(null);
   };
 
-  // Fetch prediction when stat and opponent are selected
+  // Fetch the selected stat's market prediction (the same market the line is priced on)
   useEffect(() => {
-    if (selectedPlayer && selectedStat && opponent && showStatModal) {
-      fetchPrediction();
+    if (!selectedPlayer || !selectedStat || !opponent || !showStatModal) {
+      setLoadingPrediction(false);
+      return;
     }
-  }, [selectedStat, opponent]);
 
-  const fetchPrediction = async () => {
-    if (!selectedPlayer || !selectedStat || !opponent) return;
-
-    try {
-      setLoadingPrediction(true);
-
-      let response;
+    const market = STAT_MARKETS[selectedStat];
+    let cancelled = false;
+    const fetchPrediction = async () => {
+      try {
+        // Drop the previous stat's projection so it is never shown for this one
+        setPrediction(null);
+        setLoadingPrediction(true);
+        const response = await apiService.getBatchPredictions([
+          { player_id: selectedPlayer.id, opponent, markets: [market] }
+        ]);
+        const result = response.data.predictions[0];
+        if (!cancelled) setPrediction(result.predictions ? result.predictions[market] : null);
+      } catch (error) {
+        console.error('Error fetching prediction:', error);
+        if (!cancelled) setPrediction(null);
+      } finally {
+        if (!cancelled) setLoadingPrediction(false);
+      }
+    };
 
-      // Check if it's a TD stat - use TD API which returns different format
-      if (selectedStat === 'passing_tds' || selectedStat === 'rushing_tds' || selectedStat === 'receiving_tds') {
-        response = await apiService.getTouchdownPrediction(
-          selectedPlayer.id,
-          opponent
-        );
+    fetchPrediction();
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedPlayer, selectedStat, opponent, showStatModal]);
 
-        // Transform TD response to match yardage format for consistency
-        const tdData = response.data.prediction;
-        const transformedPrediction = {
-          probabilities: tdData.td_probabilities || { 1: tdData.td_probability || 0 },
-          projected_tds: tdData.avg_tds_per_game,
-          avg_tds_per_game: tdData.avg_tds_per_game
-        };
-        setPrediction(transformedPrediction);
-      } else if (selectedStat === 'receptions') {
-        // Use receptions API for reception stats
-        response = await apiService.getReceptionsPrediction(
-          selectedPlayer.id,
-          opponent
-        );
-        setPrediction(response.data.prediction);
-      } else {
-        // Use yardage API for yardage/interceptions stats
-        let statType = selectedStat;
-        if (selectedStat === 'interceptions') {
-          statType = 'passing_yards'; // Use passing yards API for interceptions
-        }
+  // Price the entered line exactly from the model's fitted distribution
+  useEffect(() => {
+    const line = parseFloat(threshold);
+    if (!selectedPlayer || !selectedStat || !opponent || !showStatModal || Number.isNaN(line)) {
+      setLineProbability(null);
+      return;
+    }
 
-        response = await apiService.getYardagePrediction(
+    let cancelled = false;
+    const fetchLineProbability = async () => {
+      try {
+        // Drop the previous line's price so it is never shown or added for this line
+        setLineProbability(null);
+        const response = await apiService.getLineProbabilities(
           selectedPlayer.id,
           opponent,
-          statType
+          STAT_MARKETS[selectedStat],
+          [line]
         );
-        setPrediction(response.data.prediction);
+        if (!cancelled) setLineProbability(response.data.prediction.lines[0]);
+      } catch (error) {
+        console.error('Error fetching line probability:', error);
+        if (!cancelled) setLineProbability(null);
       }
-    } catch (error) {
-      console.error('Error fetching prediction:', error);
-      setPrediction(null);
-    } finally {
-      setLoadingPrediction(false);
-    }
-  };
-
-  // Calculate probability for a specific threshold
-  const calculateProbability = (threshold, overUnder, prediction) => {
-    if (!prediction || !prediction.probabilities) return null;
-
-    const benchmarks = Object.keys(prediction.probabilities).map(Number).sort((a, b) => a - b);
-    const thresholdNum = parseFloat(threshold);
-
-    // Find closest benchmarks
-    let lowerBenchmark = benchmarks[0];
-    let upperBenchmark = benchmarks[benchmarks.length - 1];
-
-    for (let i = 0; i < benchmarks.length - 1; i++) {
-      if (benchmarks[i] <= thresholdNum && thresholdNum <= benchmarks[i + 1]) {
-        lowerBenchmark = benchmarks[i];
-        upperBenchmark = benchmarks[i + 1];
-        break;
-      }
-    }
-
-    // Interpolate probability
-    let probability;
-    if (thresholdNum <= lowerBenchmark) {
-      probability = prediction.probabilities[lowerBenchmark];
-    } else if (thresholdNum >= upperBenchmark) {
-      probability = prediction.probabilities[upperBenchmark];
-    } else {
-      const lowerProb = prediction.probabilities[lowerBenchmark];
-      const upperProb = prediction.probabilities[upperBenchmark];
-      const ratio = (thresholdNum - lowerBenchmark) / (upperBenchmark - lowerBenchmark);
-      probability = lowerProb - (ratio * (lowerProb - upperProb));
-    }
+    };
 
-    // If UNDER, use 1 - probability
-    if (overUnder === 'UNDER') {
-      probability = 100 - probability;
-    }
+    fetchLineProbability();
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedPlayer, selectedStat, opponent, threshold, showStatModal]);
 
-    return Math.max(0, Math.min(100, probability));
+  // Probability (%) of the selected side of the entered line
+  const calculateProbability = (overUnder) => {
+    if (!lineProbability) return null;
+    return overUnder === 'UNDER' ? lineProbability.under : lineProbability.over;
   };
 
   // Add leg to parlay
@@ -294,7 +296,7 @@ const ParlayBuilder = () => {
     }
 
     // Calculate probability for this leg
-    const probability = prediction ? calculateProbability(threshold, overUnder, prediction) : null;
+    const probability = calculateProbability(overUnder);
 
     // Get opponent team name for display
     const opponentTeam = NFL_TEAMS.find(t => t.abbr === opponent);
@@ -331,19 +333,76 @@ const ParlayBuilder = () => {
     });
   };
 
-  // Calculate combined probability (multiply all leg probabilities)
-  const calculateCombinedProbability = (legs) => {
-    if (!legs || legs.length === 0) return 0;
+  // Price the current parlay's legs together: the backend simulates them with
+  // their correlations instead of multiplying leg probabilities
+  useEffect(() => {
+    const legs = currentParlay ? currentParlay.legs : [];
+    if (legs.length === 0) {
+      setParlayPrice(null);
+      return;
+    }
 
-    const validLegs = legs.filter(leg => leg.probability !== null);
-    if (validLegs.length === 0) return 0;
+    let cancelled = false;
+    const priceCurrentParlay = async () => {
+      try {
+        // Drop the previous legs' price so it is never shown or saved for these legs
+        setParlayPrice(null);
+        setPricingParlay(true);
+        const response = await apiService.priceParlay(toPricingLegs(legs));
+        if (!cancelled) setParlayPrice(response.data.parlay);
+      } catch (error) {
+        console.error('Error pricing parlay:', error);
+        if (!cancelled) setParlayPrice(null);
+      } finally {
+        if (!cancelled) setPricingParlay(false);
+      }
+    };
 
-    // Multiply all probabilities (convert from percentage to decimal first)
-    const combined = validLegs.reduce((acc, leg) => {
-      return acc * (leg.probability / 100);
-    }, 1);
+    priceCurrentParlay();
+    return () => {
+      cancelled = true;
+    };
+  }, [currentParlay?.legs]);
 
-    return combined * 100; // Convert back to percentage
+  // Price saved parlays that have no combined probability yet (saved while
+  // pricing was in flight, or before parlays were priced jointly)
+  useEffect(() => {
+    const unpriced = parlays.filter(parlay => parlay.combinedProbability === undefined);
+    if (unpriced.length === 0) return;
+
+    let cancelled = false;
+    const priceSavedParlays = async () => {
+      const prices = {};
+      for (const parlay of unpriced) {
+        try {
+          const response = await apiService.priceParlay(toPricingLegs(parlay.legs));
+          prices[parlay.id] = response.data.parlay.probability;
+        } catch (error) {
+          console.error('Error pricing saved parlay:', error);
+          prices[parlay.id] = null;
+        }
+      }
+
+      if (!cancelled) {
+        setParlays(current => current.map(parlay =>
+          parlay.id in prices ? { ...parlay, combinedProbability: prices[parlay.id] } : parlay
+        ));
+      }
+    };
+
+    priceSavedParlays();
+    return () => {
+      cancelled = true;
+    };
+  }, [parlays]);
+
+  // Combined probability (%) of the parlay being built, null until priced
+  const currentProbability = parlayPrice ? parlayPrice.probability : null;
+
+  // Format a combined probability, which may still be pricing or unavailable
+  const formatProbability = (probability, pending = false) => {
+    if (probability === null || probability === undefined) return pending ? 'Pricing...' : 'N/A';
+    return `${probability.toFixed(2)}%`;
   };
 
   // Convert probability to American odds
@@ -549,14 +608,23 @@ const ParlayBuilder = () => {
                   <div className="summary-item">
                     <span className="summary-label">Our Probability:</span>
                     <span className="summary-value probability">
-                      {calculateCombinedProbability(currentParlay.legs).toFixed(2)}%
+                      {formatProbability(currentProbability, pricingParlay)}
                     </span>
                   </div>
 
+                  {parlayPrice && (
+                    <div className="summary-item">
+                      <span className="summary-label">If Legs Were Independent:</span>
+                      <span className="summary-value">
+                        {formatProbability(parlayPrice.independent_probability)}
+                      </span>
+                    </div>
+                  )}
+
                   <div className="summary-item">
                     <span className="summary-label">Our American Odds:</span>
                     <span className="summary-value odds">
-                      {formatAmericanOdds(probabilityToAmericanOdds(calculateCombinedProbability(currentParlay.legs)))}
+                      {formatAmericanOdds(probabilityToAmericanOdds(currentProbability))}
                     </span>
                   </div>
 
@@ -586,28 +654,30 @@ const ParlayBuilder = () => {
                         </span>
                       </div>
 
-                      <div className="summary-item value-indicator">
-                        <span className="summary-label">Value Assessment:</span>
-                        <span className={`summary-value ${
-                          (() => {
-                            const ourProb = calculateCombinedProbability(currentParlay.legs);
-                            const bookProb = americanOddsToImpliedProbability(currentParlay.bookCombinedOdds);
-                            const diff = ourProb - bookProb;
-
-                            if (Math.abs(diff) <= 2) return 'fair-value';
-                            return diff > 0 ? 'good-value' : 'bad-value';
-                          })()
-                        }`}>
-                          {(() => {
-                            const ourProb = calculateCombinedProbability(currentParlay.legs);
-                            const bookProb = americanOddsToImpliedProbability(currentParlay.bookCombinedOdds);
-                            const diff = ourProb - bookProb;
-
-                            if (Math.abs(diff) <= 2) return '= Fair Value';
-                            return diff > 0 ? '✓ Good Value' : '✗ Poor Value';
-                          })()}
-                        </span>
-                      </div>
+                      {currentProbability !== null && (
+                        <div className="summary-item value-indicator">
+                          <span className="summary-label">Value Assessment:</span>
+                          <span className={`summary-value ${
+                            (() => {
+                              const ourProb = currentProbability;
+                              const bookProb = americanOddsToImpliedProbability(currentParlay.bookCombinedOdds);
+                              const diff = ourProb - bookProb;
+
+                              if (Math.abs(diff) <= 2) return 'fair-value';
+                              return diff > 0 ? 'good-value' : 'bad-value';
+                            })()
+                          }`}>
+                            {(() => {
+                              const ourProb = currentProbability;
+                              const bookProb = americanOddsToImpliedProbability(currentParlay.bookCombinedOdds);
+                              const diff = ourProb - bookProb;
+
+                              if (Math.abs(diff) <= 2) return '= Fair Value';
+                              return diff > 0 ? '✓ Good Value' : '✗ Poor Value';
+                            })()}
+                          </span>
+                        </div>
+                      )}
                     </>
                   )}
 
@@ -615,7 +685,7 @@ const ParlayBuilder = () => {
                     <span className="summary-label">Potential Payout:</span>
                     <span className="summary-value payout">
                       ${ calculatePayout(
-                        currentParlay.bookCombinedOdds || probabilityToAmericanOdds(calculateCombinedProbability(currentParlay.legs)),
+                        currentParlay.bookCombinedOdds || probabilityToAmericanOdds(currentProbability),
                         currentParlay.betAmount
                       ).toFixed(2)}
                     </span>
@@ -625,7 +695,7 @@ const ParlayBuilder = () => {
                     <span className="summary-label">Total Return:</span>
                     <span className="summary-value total">
                       ${(parseFloat(currentParlay.betAmount) + calculatePayout(
-                        currentParlay.bookCombinedOdds || probabilityToAmericanOdds(calculateCombinedProbability(currentParlay.legs)),
+                        currentParlay.bookCombinedOdds || probabilityToAmericanOdds(currentProbability),
                         currentParlay.betAmount
                       )).toFixed(2)}
                     </span>
@@ -720,15 +790,17 @@ const ParlayBuilder = () => {
                 </div>
               )}
 
-              {prediction && threshold && (
+              {prediction && lineProbability && (
                 <div className="prediction-display">
                   <p className="prediction-label">Predicted Probability:</p>
                   <p className="prediction-value">
-                    {calculateProbability(threshold, overUnder, prediction)?.toFixed(1)}%
+                    {calculateProbability(overUnder)?.toFixed(1)}%
                   </p>
                   <p className="prediction-projected">
                     {selectedStat.includes('_tds') ? (
                       `Projected: ${prediction.avg_tds_per_game} TDs`
+                    ) : selectedStat === 'interceptions' ? (
+                      `Projected: ${prediction.avg_ints_per_game} INTs`
                     ) : selectedStat === 'receptions' ? (
                       `Projected: ${prediction.projected_receptions} receptions`
                     ) : (
@@ -766,7 +838,7 @@ const ParlayBuilder = () => {
         ) : (
           <div className="parlays-grid">
             {parlays.map(parlay => {
-              const combinedProb = calculateCombinedProbability(parlay.legs);
+              const combinedProb = parlay.combinedProbability ?? null;
               const ourAmericanOdds = probabilityToAmericanOdds(combinedProb);
               const bookOdds = parlay.bookCombinedOdds;
               const bookImpliedProb = bookOdds ? americanOddsToImpliedProbability(bookOdds) : null;
@@ -812,7 +884,9 @@ const ParlayBuilder = () => {
                       </div>
                       <div className="saved-summary-row">
                         <span>Our Probability:</span>
-                        <span className="saved-summary-highlight green">{combinedProb.toFixed(2)}%</span>
+                        <span className="saved-summary-highlight green">
+                          {formatProbability(combinedProb, parlay.combinedProbability === undefined)}
+                        </span>
                       </div>
                       <div className="saved-summary-row">
                         <span>Our Odds:</span>
@@ -828,22 +902,24 @@ const ParlayBuilder = () => {
                             <span>Book Implied Prob:</span>
                             <span className="saved-summary-highlight">{bookImpliedProb?.toFixed(2)}%</span>
                           </div>
-                          <div className="saved-summary-row">
-                            <span>Value:</span>
-                            <span className={`saved-summary-highlight ${
-                              (() => {
-                                const diff = combinedProb - bookImpliedProb;
-                                if (Math.abs(diff) <= 2) return 'orange';
-                                return diff > 0 ? 'green' : 'red';
-                              })()
-                            }`}>
-                              {(() => {
-                                const diff = combinedProb - bookImpliedProb;
-                                if (Math.abs(diff) <= 2) return 'Fair';
-                                return diff > 0 ? 'Good' : 'Poor';
-                              })()}
-                            </span>
-                          </div>
+                          {combinedProb !== null && (
+                            <div className="saved-summary-row">
+                              <span>Value:</span>
+                              <span className={`saved-summary-highlight ${
+                                (() => {
+                                  const diff = combinedProb - bookImpliedProb;
+                                  if (Math.abs(diff) <= 2) return 'orange';
+                                  return diff > 0 ? 'green' : 'red';
+                                })()
+                              }`}>
+                                {(() => {
+                                  const diff = combinedProb - bookImpliedProb;
+                                  if (Math.abs(diff) <= 2) return 'Fair';
+                                  return diff > 0 ? 'Good' : 'Poor';
+                                })()}
+                              </span>
+                            </div>
+                          )}
                         </>
                       )}
                       <div className="saved-summary-row">
@@ -41,6 +41,13 @@ export const apiService = {
     api.get(`/predictions/touchdown/${playerId}`, { params: { opponent } }),
   getReceptionsPrediction: (playerId, opponent) =>
     api.get(`/predictions/receptions/${playerId}`, { params: { opponent } }),
+  getBatchPredictions: (items) =>
+    api.post('/predictions/batch', { items }),
+  getLineProbabilities: (playerId, opponent, market, lines) =>
+    api.get(`/predictions/lines/${playerId}`, { params: { opponent, market, lines: lines.join(',') } }),
+
+  // Parlays
+  priceParlay: (legs) => api.post('/parlays/price', { legs }),
 };
 
 export default api;